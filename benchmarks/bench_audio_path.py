@@ -0,0 +1,116 @@
+"""Micro-benchmark: captured microphone audio -> Whisper input array.
+
+Compares the old path (AudioData.get_wav_data(), write a temp .wav, let
+whisper.load_audio() decode it through an ffmpeg subprocess) against the
+in-memory path in modules/audio_processing.py on synthetic clips at the
+sample rates microphones typically open with.
+
+    python benchmarks/bench_audio_path.py             # 5 s clips
+    python benchmarks/bench_audio_path.py 15          # clip length in seconds
+    python benchmarks/bench_audio_path.py 5 --whisper # also time full transcribe() with the tiny model
+
+The ffmpeg path is skipped when ffmpeg is not on PATH.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import speech_recognition as sr
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "modules"))  # import the converter without the GUI package
+
+from audio_processing import WHISPER_SAMPLE_RATE, audio_data_to_whisper  # noqa: E402
+
+RATES = (16000, 44100, 48000)
+
+
+def synthetic_audio(seconds, rate):
+    """Speech-like 16-bit mono clip: a few harmonics with a syllable-rate envelope plus noise"""
+    rng = np.random.default_rng(11)
+    t = np.arange(int(seconds * rate)) / rate
+    voice = sum(np.sin(2 * np.pi * f * t) / (i + 1) for i, f in enumerate((180, 360, 720, 1440)))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)
+    signal = 0.3 * voice * envelope + 0.01 * rng.standard_normal(len(t))
+    pcm = np.clip(signal * 32767, -32768, 32767).astype("<i2").tobytes()
+    return sr.AudioData(pcm, rate, 2)
+
+
+def legacy_path(audio):
+    """What SpeechRecognitionService._recognize did: temp WAV + whisper.load_audio()'s ffmpeg decode"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_file:
+        tmp_filename = tmp_file.name
+        tmp_file.write(audio.get_wav_data())
+    try:
+        cmd = ["ffmpeg", "-nostdin", "-threads", "0", "-i", tmp_filename,
+               "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(WHISPER_SAMPLE_RATE), "-"]
+        out = subprocess.run(cmd, capture_output=True, check=True).stdout
+    finally:
+        os.unlink(tmp_filename)
+    return np.frombuffer(out, np.int16).flatten().astype(np.float32) / 32768.0
+
+
+def in_memory_path(audio):
+    return audio_data_to_whisper(audio)
+
+
+def bench(fn, audio, repeat=10):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(audio)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_transcribe(clips):
+    import whisper
+    model = whisper.load_model("tiny")
+    print("full transcribe() with the tiny model")
+    for rate, audio in clips:
+        if shutil.which("ffmpeg"):
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_file:
+                tmp_file.write(audio.get_wav_data())
+            try:
+                legacy_time, _ = bench(lambda a: model.transcribe(tmp_file.name, language="zh"), audio, repeat=3)
+            finally:
+                os.unlink(tmp_file.name)
+            print(f"  {rate:>6} Hz  temp file: {legacy_time * 1e3:8.1f} ms", end="")
+        else:
+            print(f"  {rate:>6} Hz  temp file:      n/a", end="")
+        new_time, _ = bench(lambda a: model.transcribe(audio_data_to_whisper(a), language="zh"), audio, repeat=3)
+        print(f"   in-memory: {new_time * 1e3:8.1f} ms")
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    seconds = float(args[0]) if args else 5.0
+    have_ffmpeg = shutil.which("ffmpeg") is not None
+    clips = [(rate, synthetic_audio(seconds, rate)) for rate in RATES]
+
+    print(f"clip length: {seconds:g} s, 16-bit mono")
+    if not have_ffmpeg:
+        print("ffmpeg not found on PATH: skipping the temp-file path")
+    print("AudioData -> 16 kHz float32 array")
+    for rate, audio in clips:
+        new_time, new_samples = bench(in_memory_path, audio)
+        line = f"  {rate:>6} Hz  in-memory: {new_time * 1e3:8.2f} ms"
+        if have_ffmpeg:
+            legacy_time, legacy_samples = bench(legacy_path, audio)
+            length = min(len(legacy_samples), len(new_samples))
+            assert abs(len(legacy_samples) - len(new_samples)) <= 1, "paths disagree on the output length"
+            rms = float(np.sqrt(np.mean((legacy_samples[:length] - new_samples[:length]) ** 2)))
+            line += f"   temp file + ffmpeg: {legacy_time * 1e3:8.2f} ms   ({legacy_time / new_time:5.1f}x, rms diff {rms:.4f})"
+        print(line)
+
+    if "--whisper" in sys.argv:
+        bench_transcribe(clips)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark: per-frame cost of appending streamed text to an AI chat bubble.
+
+Simulates one frame = one ~40 character batch appended, then the relayout and
+repaint the GUI would do. Compares the old QLabel.setText(whole string) +
+adjustSize() path with appending to a message row of the chat transcript
+(ChatTranscriptView), sampled as the message grows. A flat transcript column
+means each frame only lays out the new text.
+
+    python benchmarks/bench_chat_append.py
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "modules"))  # import the transcript without the GUI package
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QFrame, QHBoxLayout, QLabel, QScrollArea  # noqa: E402
+
+from chat_transcript import ChatTranscriptView  # noqa: E402
+
+STYLE = "background-color: rgb(44, 49, 58); padding: 10px 15px; font-size: 24px;"
+LINE = "Day 2: 上午游览宽窄巷子，中午品尝火锅，下午前往大熊猫繁育研究基地。\n"
+BATCH = 40
+CHECKPOINTS = (500, 1000, 2000, 5000, 10000)
+
+
+def stream_text(length):
+    text = LINE * (length // len(LINE) + 1)
+    return text[:length]
+
+
+class LegacyBubble(QFrame):
+    """What StreamingChatMessage.appendText used to do"""
+
+    def __init__(self):
+        super().__init__()
+        layout = QHBoxLayout(self)
+        self.label = QLabel()
+        self.label.setWordWrap(True)
+        self.label.setMaximumWidth(800)
+        self.label.setStyleSheet(STYLE)
+        layout.addWidget(self.label)
+        self.current_text = ""
+
+    def append(self, text):
+        self.current_text += text
+        self.label.setText(self.current_text)
+        self.label.adjustSize()
+        self.adjustSize()
+
+
+class LegacyArea:
+    """The bubble in a fixed-size scroll area like the old chatDisplayArea, pinned to the bottom"""
+
+    def __init__(self):
+        self.area = QScrollArea()
+        self.area.setWidgetResizable(True)
+        self.area.resize(1000, 700)
+        self.bubble = LegacyBubble()
+        self.area.setWidget(self.bubble)
+
+    def append(self, text):
+        self.bubble.append(text)
+        QApplication.instance().processEvents()
+        scrollbar = self.area.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+        self.area.viewport().repaint()
+
+
+class TranscriptArea:
+    """A streaming AI message row in the chat transcript, as MainWindow drives it"""
+
+    def __init__(self):
+        self.area = ChatTranscriptView()
+        self.area.resize(1000, 700)
+        self.message = self.area.transcript.addMessage("", is_user=False)
+
+    def append(self, text):
+        self.message.appendText(text)  # StreamRenderer's per-frame batch
+        QApplication.instance().processEvents()
+        self.area.viewport().repaint()
+
+
+def run(area_cls):
+    app = QApplication.instance()
+    target = area_cls()
+    area = target.area
+    area.show()
+    text = stream_text(CHECKPOINTS[-1])
+    samples = {}
+    frame_times = []
+    for start in range(0, len(text), BATCH):
+        t0 = time.perf_counter()
+        target.append(text[start:start + BATCH])
+        frame_times.append(time.perf_counter() - t0)
+        length = start + BATCH
+        for checkpoint in CHECKPOINTS:
+            if length >= checkpoint and checkpoint not in samples:
+                recent = frame_times[-5:]
+                samples[checkpoint] = sum(recent) / len(recent)
+    area.close()
+    area.deleteLater()
+    app.processEvents()
+    return samples
+
+
+def main():
+    QApplication(sys.argv)
+    legacy = run(LegacyArea)
+    transcript = run(TranscriptArea)
+    print(f"{'chars':>8} {'QLabel setText (ms/frame)':>28} {'transcript (ms/frame)':>28}")
+    for checkpoint in CHECKPOINTS:
+        print(f"{checkpoint:>8} {legacy[checkpoint] * 1e3:>28.3f} {transcript[checkpoint] * 1e3:>28.3f}")
+
+
+if __name__ == "__main__":
+    main()
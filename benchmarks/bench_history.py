@@ -0,0 +1,144 @@
+"""Chat history cost per turn: rewriting chat_history.json vs the SQLite store.
+
+Builds an archive of --sessions chats of --messages messages each, then times
+appending one turn to a chat, listing all sessions for the History page,
+reading one page of 100 summaries and opening one chat, for both storage
+designs. "json idx" reads the archive through its byte-offset sidecar index
+(legacy_history), as the app does until the archive is imported; its list
+and page times include loading the sidecar. "cold" is opening a chat after
+compaction; its size column is the database after compacting every chat.
+The search rows time full-text queries
+that match a few chats, one city in ten, and every chat (the ranking worst case).
+
+    python benchmarks/bench_history.py
+    python benchmarks/bench_history.py --sessions 50 200 1000 --messages 40
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "modules"))  # import the store without the GUI package
+
+from chat_store import ChatHistoryStore  # noqa: E402
+from legacy_history import LegacyHistoryIndex  # noqa: E402
+
+TEXT = "Day 1: arrive in Chengdu, hotpot dinner near Chunxi Road. 第一天：抵达成都，春熙路吃火锅。 " * 4
+CITIES = ["Shanghai 上海", "Xiamen 厦门", "Beijing 北京", "Chengdu 成都", "Hangzhou 杭州",
+          "Xi'an 西安", "Guilin 桂林", "Lhasa 拉萨", "Kunming 昆明", "Harbin 哈尔滨"]
+SEARCHES = ["trip 42", "厦门", "hotpot"]
+
+
+def make_archive(sessions, messages):
+    """Newest first, like the chat_history.json the app used to write"""
+    return [{
+        "id": str(1_700_000_000_000 + i),
+        "timestamp": f"2024-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}",
+        "last_updated": "2024-01-01T00:00:00",
+        "title": None,
+        "messages": [{"role": "user" if m % 2 == 0 else "assistant",
+                      "content": f"{CITIES[i % len(CITIES)]} trip {i}. {TEXT}"} for m in range(messages)],
+    } for i in reversed(range(sessions))]
+
+
+def bench(fn, runs):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def json_turn(path, session_id):
+    """What ChatHistoryManager did per AI reply before the SQLite store"""
+    with open(path, 'r', encoding='utf-8') as f:
+        history = json.load(f)
+    for record in history:
+        if record["id"] == session_id:
+            record["messages"].append({"role": "assistant", "content": TEXT})
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, ensure_ascii=False, indent=2)
+
+
+def json_load(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chat history storage benchmark")
+    parser.add_argument("--sessions", nargs="+", type=int, default=[50, 500, 5000])
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'sessions':>8} {'store':<8} {'turn ms':>8} {'list ms':>8} {'page ms':>8} {'open ms':>8} {'file MB':>8}")
+    for sessions in args.sessions:
+        tmp = tempfile.mkdtemp(prefix="bench_history_")
+        try:
+            archive = make_archive(sessions, args.messages)
+            session_id = archive[sessions // 2]["id"]
+            json_file = os.path.join(tmp, "chat_history.json")
+            with open(json_file, 'w', encoding='utf-8') as f:
+                json.dump(archive, f, ensure_ascii=False, indent=2)
+
+            start = time.perf_counter()
+            index = LegacyHistoryIndex(json_file)
+            index.refresh()
+            index_ms = (time.perf_counter() - start) * 1000
+
+            store = ChatHistoryStore(os.path.join(tmp, "chat_history.db"))
+            start = time.perf_counter()
+            store.migrate_json(json_file, index)
+            migrate_ms = (time.perf_counter() - start) * 1000
+            messages = store.load_messages(session_id)
+
+            def sqlite_turn():
+                messages.append({"role": "assistant", "content": TEXT})
+                store.save_session(session_id, messages)
+
+            def db_size():
+                store._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                return os.path.getsize(store.db_file)
+
+            json_list = bench(lambda: json_load(json_file), args.runs)
+            results = {
+                "json": (bench(lambda: json_turn(json_file, session_id), args.runs), json_list, json_list,
+                         bench(lambda: json_load(json_file), args.runs), os.path.getsize(json_file)),
+                "json idx": (None,
+                             bench(lambda: LegacyHistoryIndex(json_file).list_sessions(), args.runs),
+                             bench(lambda: LegacyHistoryIndex(json_file).list_sessions(100), args.runs),
+                             bench(lambda: index.load_messages(session_id), args.runs),
+                             os.path.getsize(index.index_file)),
+                "sqlite": (bench(sqlite_turn, args.runs),
+                           bench(store.list_sessions, args.runs),
+                           bench(lambda: store.list_sessions(100), args.runs),
+                           bench(lambda: store.load_messages(session_id), args.runs),
+                           db_size()),
+            }
+            searches = {query: (bench(lambda: store.search_sessions(query), args.runs),
+                                len(store.search_sessions(query, limit=10 ** 9)))
+                        for query in SEARCHES}
+            start = time.perf_counter()
+            store.compact(0)
+            compact_ms = (time.perf_counter() - start) * 1000
+            store._db.execute("VACUUM")
+            results["cold"] = (None, None, None, bench(lambda: store.load_messages(session_id), args.runs), db_size())
+            store.close()
+            for name, (*times, size) in results.items():
+                cells = " ".join(f"{ms:8.2f}" if ms is not None else f"{'-':>8}" for ms in times)
+                print(f"{sessions:8d} {name:<8} {cells} {size / 1e6:8.1f}")
+            print(f"{'':8}  index {index_ms:.0f} ms, migrate {migrate_ms:.0f} ms, compact {compact_ms:.0f} ms")
+            for query, (ms, hits) in searches.items():
+                print(f"{'':8} search {query!r}: {ms:.2f} ms, {hits} matches ranked")
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
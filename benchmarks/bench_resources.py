@@ -0,0 +1,92 @@
+"""Startup cost of the Qt resources: generated resources_rc.py vs binary resources.rcc.
+
+Both variants are compiled from resources.qrc with pyside6-rcc into a temp
+directory, then each is loaded in fresh interpreters (after PySide6 itself is
+imported, so only the resource cost is measured) and one icon is rendered to
+check the resources resolve.
+
+    python benchmarks/bench_resources.py
+    python benchmarks/bench_resources.py --runs 10
+
+"python, cold" is the first launch after install, which also compiles the
+1 MB module to a .pyc; "python" is every later launch.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ICON = ":/icons/images/icons/cil-3d.png"
+
+CHILD = r"""
+import json, os, sys, time
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtCore import QResource
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QApplication
+
+def rss_kb():
+    try:
+        with open("/proc/self/status") as f:
+            return next(int(line.split()[1]) for line in f if line.startswith("VmRSS:"))
+    except OSError:
+        import psutil
+        return psutil.Process().memory_info().rss // 1024
+
+app = QApplication([])
+mode, path = sys.argv[1], sys.argv[2]
+before = rss_kb()
+start = time.perf_counter()
+if mode == "python":
+    sys.path.insert(0, os.path.dirname(path))
+    import resources_rc
+else:
+    assert QResource.registerResource(path)
+loaded = time.perf_counter() - start
+ok = not QIcon(%r).pixmap(16).isNull()
+print(json.dumps({"ms": loaded * 1000, "rss_kb": rss_kb() - before, "ok": ok}))
+""" % ICON
+
+
+def rcc(*args):
+    subprocess.run(["pyside6-rcc", *args, os.path.join(ROOT, "resources.qrc")], cwd=ROOT, check=True)
+
+
+def run(mode, path):
+    out = subprocess.run([sys.executable, "-c", CHILD, mode, path], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Qt resource startup benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench_resources_")
+    try:
+        module, binary = os.path.join(tmp, "resources_rc.py"), os.path.join(tmp, "resources.rcc")
+        rcc("-o", module)
+        rcc("--binary", "-o", binary)
+        print(f"resources_rc.py: {os.path.getsize(module) / 1e6:.2f} MB, "
+              f"resources.rcc: {os.path.getsize(binary) / 1e6:.2f} MB")
+
+        results = {"python, cold": [run("python", module)]}  # writes __pycache__
+        results["python"] = [run("python", module) for _ in range(args.runs)]
+        results["rcc"] = [run("rcc", binary) for _ in range(args.runs)]
+
+        print(f"{'variant':<14} {'load ms':>8} {'RSS +MB':>8}")
+        for name, runs in results.items():
+            assert all(r["ok"] for r in runs), f"{name}: icon did not resolve"
+            best_ms = min(r["ms"] for r in runs)
+            rss_mb = min(r["rss_kb"] for r in runs) / 1024
+            print(f"{name:<14} {best_ms:8.2f} {rss_mb:8.2f}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
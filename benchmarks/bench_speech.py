@@ -0,0 +1,205 @@
+"""CPU benchmark: speech backends on a fixed set of local clips.
+
+Every configuration (backend x model size x compute type x decoding) runs in
+a fresh process so load time and peak memory are measured in isolation, and
+reports:
+
+    load      seconds to load the model
+    RTF       real-time factor, transcription time / audio duration (lower is faster)
+    peak MB   peak resident memory of that process
+
+Clips are 16-bit PCM .wav files (any rate, mono or stereo) in CLIP_DIR,
+benchmarks/clips by default. Keep the same set between machines so the
+numbers compare. Without a clip directory (or with --synthetic) a fixed set
+of speech-like clips is generated instead: voiced syllables on a pitch
+contour with formants, word gaps and pauses, seeded so every run gets
+identical audio. Whisper's transcripts of them are meaningless, but load
+time, RTF and memory are comparable across machines and configurations.
+
+    python benchmarks/bench_speech.py
+    python benchmarks/bench_speech.py --synthetic --model tiny
+    python benchmarks/bench_speech.py my_clips --model tiny base small --compute-type fp32 int8
+    python benchmarks/bench_speech.py --backend whisper faster-whisper --beam-size 1 5 --language auto
+"""
+import argparse
+import glob
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "modules"))  # import the backends without the GUI package
+
+from audio_processing import WHISPER_SAMPLE_RATE, pcm_to_float32, resample  # noqa: E402
+from speech_backends import BACKENDS, create_backend  # noqa: E402
+
+
+SYNTHETIC_CLIPS = [3, 6, 10, 20]  # seconds: short commands, typical segments, one long dictation
+SYNTHETIC_SEED = 20240101
+FORMANTS = [(700, 1220), (300, 2300), (500, 1900), (350, 800), (600, 1000)]  # rough vowel F1/F2 pairs
+
+
+def synthetic_speech(seconds, rng):
+    """Deterministic speech-like 16 kHz float32 signal"""
+    rate = WHISPER_SAMPLE_RATE
+    audio = np.zeros(int(seconds * rate), dtype=np.float32)
+    position = int(0.3 * rate)
+    while position < len(audio) - rate // 4:
+        for _ in range(rng.randint(2, 6)):  # one "word" of a few syllables
+            length = int(rng.uniform(0.12, 0.28) * rate)
+            if position + length >= len(audio):
+                break
+            t = np.arange(length) / rate
+            pitch = rng.uniform(110, 220) * (1 + 0.1 * np.sin(2 * np.pi * rng.uniform(2, 5) * t))
+            phase = 2 * np.pi * np.cumsum(pitch) / rate
+            f1, f2 = FORMANTS[rng.randint(len(FORMANTS))]
+            voiced = np.zeros(length)
+            for harmonic in range(1, 30):
+                frequency = harmonic * pitch.mean()
+                gain = np.exp(-((frequency - f1) / 150) ** 2) + 0.5 * np.exp(-((frequency - f2) / 200) ** 2)
+                voiced += gain * np.sin(harmonic * phase) / harmonic
+            envelope = np.sin(np.pi * np.arange(length) / length) ** 2
+            audio[position:position + length] += 0.3 * (voiced * envelope / max(1e-9, np.abs(voiced).max()))
+            position += length + int(rng.uniform(0.02, 0.06) * rate)
+        position += int(rng.uniform(0.15, 0.7) * rate)  # word gap or pause
+    audio += 0.003 * rng.standard_normal(len(audio)).astype(np.float32)  # room noise
+    return np.clip(audio, -1, 1)
+
+
+def write_synthetic_clips(directory):
+    rng = np.random.RandomState(SYNTHETIC_SEED)
+    for seconds in SYNTHETIC_CLIPS:
+        samples = (synthetic_speech(seconds, rng) * 32767).astype("<i2")
+        with wave.open(os.path.join(directory, f"synthetic_{seconds:02d}s.wav"), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(WHISPER_SAMPLE_RATE)
+            wav.writeframes(samples.tobytes())
+
+
+def load_clip(path):
+    with wave.open(path, "rb") as wav:
+        frames = wav.readframes(wav.getnframes())
+        samples = pcm_to_float32(frames, wav.getsampwidth(), wav.getnchannels())
+        return resample(samples, wav.getframerate(), WHISPER_SAMPLE_RATE)
+
+
+def peak_memory_mb():
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / 2 ** 20
+        except (ImportError, AttributeError):
+            return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def run_config(config, clip_paths, repeat):
+    """Child process: load one backend and transcribe every clip"""
+    clips = [(os.path.basename(path), load_clip(path)) for path in clip_paths]
+    backend = create_backend(**config)
+
+    start = time.perf_counter()
+    backend.load()
+    load_time = time.perf_counter() - start
+
+    backend.transcribe(clips[0][1][:WHISPER_SAMPLE_RATE])  # first-call allocations are not part of the RTF
+    audio_seconds = sum(len(samples) for _, samples in clips) / WHISPER_SAMPLE_RATE
+    transcribe_time = 0.0
+    texts = {}
+    for _ in range(repeat):
+        for name, samples in clips:
+            start = time.perf_counter()
+            texts[name] = backend.transcribe(samples).strip()
+            transcribe_time += time.perf_counter() - start
+
+    return {
+        "describe": backend.describe(),
+        "load": load_time,
+        "rtf": transcribe_time / (audio_seconds * repeat),
+        "peak_mb": peak_memory_mb(),
+        "texts": texts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Speech backend CPU benchmark")
+    parser.add_argument("clip_dir", nargs="?", default=os.path.join(ROOT, "benchmarks", "clips"))
+    parser.add_argument("--backend", nargs="+", default=["whisper"], choices=sorted(BACKENDS))
+    parser.add_argument("--model", nargs="+", default=["tiny", "base"])
+    parser.add_argument("--compute-type", nargs="+", default=["fp32", "int8"], choices=("fp32", "int8"))
+    parser.add_argument("--beam-size", nargs="+", type=int, default=[1])
+    parser.add_argument("--language", default="zh", help="'auto' to detect per clip")
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--texts", action="store_true", help="print every transcript")
+    parser.add_argument("--synthetic", action="store_true", help="use the generated clip set")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    clip_paths = sorted(glob.glob(os.path.join(args.clip_dir, "*.wav")))
+    if args.child:
+        print(json.dumps(run_config(json.loads(args.child), clip_paths, args.repeat), ensure_ascii=False))
+        return
+    synthetic_dir = None
+    if args.synthetic or not clip_paths:
+        synthetic_dir = tempfile.mkdtemp(prefix="bench_speech_")
+        write_synthetic_clips(synthetic_dir)
+        print(f"no .wav clips in {args.clip_dir}, using the synthetic set" if not args.synthetic
+              else "using the synthetic set")
+        args.clip_dir = synthetic_dir
+        clip_paths = sorted(glob.glob(os.path.join(synthetic_dir, "*.wav")))
+    try:
+        run_benchmark(args, clip_paths)
+    finally:
+        if synthetic_dir:
+            shutil.rmtree(synthetic_dir, ignore_errors=True)
+
+
+def run_benchmark(args, clip_paths):
+    audio_seconds = sum(len(load_clip(path)) for path in clip_paths) / WHISPER_SAMPLE_RATE
+    print(f"{len(clip_paths)} clips, {audio_seconds:.1f} s of audio, {os.cpu_count()} CPUs")
+    print(f"{'configuration':<52} {'load s':>7} {'RTF':>7} {'peak MB':>8}")
+
+    backends = []
+    for backend in args.backend:
+        missing = BACKENDS[backend].missing_modules()
+        if missing:
+            print(f"{backend:<52} skipped, not installed: {', '.join(missing)}")
+        else:
+            backends.append(backend)
+
+    language = None if args.language == "auto" else args.language
+    for backend, model, compute_type, beam_size in itertools.product(
+            backends, args.model, args.compute_type, args.beam_size):
+        config = {"name": backend, "model_size": model, "language": language,
+                  "compute_type": compute_type, "beam_size": beam_size, "threads": args.threads}
+        child = subprocess.run(
+            [sys.executable, __file__, args.clip_dir, "--repeat", str(args.repeat), "--child", json.dumps(config)],
+            capture_output=True, text=True, encoding="utf-8")
+        label = create_backend(**config).describe()
+        if child.returncode != 0:
+            error = (child.stderr.strip().splitlines() or ["failed"])[-1]
+            print(f"{label:<52} {error}")
+            continue
+        result = json.loads(child.stdout.strip().splitlines()[-1])
+        peak = f"{result['peak_mb']:8.0f}" if result["peak_mb"] is not None else f"{'n/a':>8}"
+        print(f"{label:<52} {result['load']:7.2f} {result['rtf']:7.3f} {peak}")
+        if args.texts:
+            for name, text in result["texts"].items():
+                print(f"    {name}: {text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Micro-benchmark: SSE parse throughput on a Dify chat-messages stream.
+
+Compares the old iter_lines/decode/json.loads-per-line loop against
+modules/sse_parser.py fed with network-sized byte chunks.
+
+    python benchmarks/bench_sse.py                 # synthetic recorded-style stream
+    python benchmarks/bench_sse.py stream_dump.txt # raw bytes captured from a real response
+"""
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "modules"))  # import the parser without the GUI package
+
+from sse_parser import SSEParser, iter_dify_events  # noqa: E402
+
+
+def synthetic_stream(n_messages=4000, n_nodes=12):
+    """Shape of a recorded Dify chatflow stream: workflow/node events, pings, many small message deltas"""
+    random.seed(3)
+    conv, msg = "c5b7a1e0-0000-4000-8000-000000000001", "a1f0c2d3-0000-4000-8000-000000000002"
+
+    def data_line(payload):
+        return b"data: " + json.dumps(payload, ensure_ascii=False).encode() + b"\n\n"
+
+    deltas = [random.choice(["成都", "三日游", " itinerary", "，", "Day 1: ", "宽窄巷子", "\n"]) for _ in range(n_messages)]
+    full_answer = "".join(deltas)
+    prompt = "你是一个旅游规划助手。请根据天气和景点信息制定行程。" * 60
+
+    # Like the advanced-chat app in dify/: LLM nodes report their prompt and full output text
+    parts = [b"event: ping\n\n", data_line({"event": "workflow_started", "task_id": "t", "data": {"id": "w"}})]
+    for i in range(n_nodes):
+        node = {"id": str(i), "node_type": "llm" if i % 3 else "tool", "title": f"Node {i}"}
+        parts.append(data_line({"event": "node_started", "task_id": "t", "data": dict(node, inputs={"q": "上海" * 100})}))
+        outputs = {"text": full_answer} if node["node_type"] == "llm" else {"json": [{"weather": "晴转多云 25°C"}] * 40}
+        parts.append(data_line({"event": "node_finished", "task_id": "t", "data": dict(
+            node, process_data={"prompts": [{"role": "system", "text": prompt}]}, outputs=outputs, status="succeeded")}))
+    for i, answer in enumerate(deltas):
+        parts.append(data_line({
+            "event": "message", "task_id": "t", "id": msg, "message_id": msg,
+            "conversation_id": conv, "answer": answer, "created_at": 1750904891,
+        }))
+        if i % 500 == 0:
+            parts.append(b"event: ping\n\n")
+    parts.append(data_line({"event": "workflow_finished", "task_id": "t",
+                            "data": {"id": "w", "outputs": {"answer": full_answer}, "status": "succeeded"}}))
+    parts.append(data_line({
+        "event": "message_end", "conversation_id": conv, "id": msg,
+        "metadata": {"usage": {"total_tokens": 1234}},
+    }))
+    return b"".join(parts)
+
+
+def chunked(raw, low=512, high=8192):
+    """Split the stream the way iter_content() hands it over from the socket"""
+    random.seed(7)
+    chunks = []
+    pos = 0
+    while pos < len(raw):
+        size = random.randint(low, high)
+        chunks.append(raw[pos:pos + size])
+        pos += size
+    return chunks
+
+
+def iter_lines(chunks):
+    """Same algorithm as requests.Response.iter_lines()"""
+    pending = None
+    for chunk in chunks:
+        if pending is not None:
+            chunk = pending + chunk
+        lines = chunk.splitlines()
+        if lines and lines[-1] and chunk and lines[-1][-1] == chunk[-1]:
+            pending = lines.pop()
+        else:
+            pending = None
+        yield from lines
+    if pending is not None:
+        yield pending
+
+
+def legacy_parse(chunks):
+    """The loop EnhancedAIResponseThread used before: decode, strip and json.loads every data line"""
+    answer = []
+    for line in iter_lines(chunks):
+        if not line:
+            continue
+        decoded_line = line.decode("utf-8").strip()
+        if decoded_line.startswith("data:"):
+            event_data = decoded_line[5:].strip()
+            try:
+                data = json.loads(event_data)
+            except json.JSONDecodeError:
+                continue
+            if data.get("event") == "message":
+                answer.append(data.get("answer", ""))
+            elif data.get("event") == "message_end":
+                break
+    return "".join(answer)
+
+
+def incremental_parse(chunks):
+    answer = []
+    for event_type, data in iter_dify_events(chunks):
+        if event_type == "message":
+            answer.append(data.get("answer", ""))
+        elif event_type == "message_end":
+            break
+    return "".join(answer)
+
+
+def legacy_framing(chunks):
+    """Framing cost only: iter_lines plus the per-line decode/strip"""
+    return sum(1 for line in iter_lines(chunks) if line and line.decode("utf-8").strip().startswith("data:"))
+
+
+def incremental_framing(chunks):
+    parser = SSEParser()
+    return sum(len(parser.feed(chunk)) for chunk in chunks)
+
+
+def payload_framing(chunks):
+    """Framing as iter_dify_events does it: data payloads only, no SSEEvent tuples"""
+    parser = SSEParser()
+    return sum(len(parser.feed_data(chunk)) for chunk in chunks)
+
+
+def bench(fn, chunks, repeat=10):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(chunks)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    raw = open(sys.argv[1], "rb").read() if len(sys.argv) > 1 else synthetic_stream()
+    mb = len(raw) / 1e6
+    chunks = chunked(raw)
+    legacy_time, legacy_text = bench(legacy_parse, chunks)
+    new_time, new_text = bench(incremental_parse, chunks)
+    assert legacy_text == new_text, "parsers disagree on the answer text"
+    legacy_frame_time, legacy_events = bench(legacy_framing, chunks)
+    new_frame_time, new_events = bench(incremental_framing, chunks)
+    data_frame_time, data_events = bench(payload_framing, chunks)
+    assert data_events == new_events, "feed and feed_data disagree on the event count"
+
+    print(f"stream size: {mb:.2f} MB, {new_events} events, answer length: {len(new_text)} chars")
+    print("framing only")
+    print(f"  legacy iter_lines     : {legacy_frame_time * 1e3:8.2f} ms  {mb / legacy_frame_time:8.1f} MB/s")
+    print(f"  SSEParser.feed        : {new_frame_time * 1e3:8.2f} ms  {mb / new_frame_time:8.1f} MB/s")
+    print(f"  SSEParser.feed_data   : {data_frame_time * 1e3:8.2f} ms  {mb / data_frame_time:8.1f} MB/s")
+    print("framing + JSON decode of consumed events")
+    print(f"  legacy iter_lines loop: {legacy_time * 1e3:8.2f} ms  {mb / legacy_time:8.1f} MB/s")
+    print(f"  iter_dify_events      : {new_time * 1e3:8.2f} ms  {mb / new_time:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Import-time report for application startup.
+
+Executes main.py the way `python main.py` does (minus the event loop) under
+`python -X importtime` in a fresh interpreter, and prints the most expensive
+modules by cumulative import time plus the total per top-level package. Fails (exit code 1) when a heavy optional dependency
+is imported at startup or the total exceeds --budget-ms, so it can guard
+against regressions in CI.
+
+    python benchmarks/import_report.py
+    python benchmarks/import_report.py --top 40 --budget-ms 600
+    python benchmarks/import_report.py --target modules.chat_transcript  # one module
+"""
+import argparse
+import collections
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Must only ever be imported on first use or by background warm-up
+HEAVY_MODULES = ("whisper", "torch", "faster_whisper", "ctranslate2", "speech_recognition", "PIL", "numpy", "pyaudio")
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def measure(target):
+    """[(module, self_us, cumulative_us, depth)] for one cold interpreter"""
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    if target == "main":
+        # Run the script without starting the event loop in its __main__ block
+        code = "import runpy; runpy.run_path('main.py', run_name='__startup__')"
+    else:
+        code = f"import {target}"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.exit(f"import {target} failed:\n{result.stderr[-2000:]}")
+    rows = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup import-time report")
+    parser.add_argument("--target", default="main", help="module to import (default: the main.py script)")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--repeat", type=int, default=3, help="runs; the fastest is reported")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if the total exceeds this")
+    args = parser.parse_args()
+
+    # The first run also pays for writing .pyc files
+    runs = [measure(args.target) for _ in range(max(1, args.repeat))]
+    rows = min(runs, key=lambda r: sum(self_us for _, self_us, _, _ in r))
+    total_ms = sum(self_us for _, self_us, _, _ in rows) / 1000
+
+    print(f"import {args.target}: {total_ms:.1f} ms, {len(rows)} modules (best of {len(runs)})")
+    print(f"\n{'cumulative ms':>13} {'self ms':>8}  module")
+    for name, self_us, cumulative_us, depth in sorted(rows, key=lambda r: -r[2])[:args.top]:
+        print(f"{cumulative_us / 1000:13.1f} {self_us / 1000:8.1f}  {'  ' * min(depth, 6)}{name}")
+
+    packages = collections.Counter()
+    for name, self_us, _, _ in rows:
+        packages[name.split(".")[0]] += self_us
+    print(f"\n{'total ms':>13}  top-level package")
+    for package, self_us in packages.most_common(args.top):
+        print(f"{self_us / 1000:13.1f}  {package}")
+
+    failures = []
+    heavy = sorted({name.split(".")[0] for name, _, _, _ in rows} & set(HEAVY_MODULES))
+    if heavy:
+        failures.append(f"imported at startup: {', '.join(heavy)} (import these on first use)")
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        failures.append(f"total {total_ms:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+    for failure in failures:
+        print(f"\nFAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
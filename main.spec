@@ -3,9 +3,9 @@
 
 a = Analysis(
     ['main.py'],
-    pathex=[],
+    pathex=['modules'],  # speech_worker / speech_backends as top-level modules for --speech-worker
     binaries=[],
-    datas=[],
+    datas=[('resources.rcc', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -23,8 +23,55 @@ from . ui_main import Ui_MainWindow
 # APP SETTINGS
 from . app_settings import Settings
 
+# HTTP CONNECTION POOL
+from . http_session import HTTPSessionPool
+
+# UPLOAD CACHE
+from . upload_cache import UploadCache
+
+# CHAT HISTORY STORE
+from . chat_search import index_text, match_query
+from . legacy_history import LegacyHistoryIndex
+from . chat_store import ChatHistoryStore
+from . history_writer import HistoryWriter
+
+# HISTORY LIST MODEL
+from . history_model import HistoryListModel
+
+# SSE STREAM PARSER
+from . sse_parser import SSEParser, iter_dify_events
+
+# STREAMED TEXT RENDERING
+from . stream_renderer import ChunkBuffer, StreamRenderer
+
+# CHAT TRANSCRIPT
+from . chat_transcript import ChatTranscriptModel, ChatTranscriptView, TranscriptEntry, TranscriptMessage
+
+# SPEECH RECOGNITION
+from . speech_backends import SpeechBackend, create_backend
+from . speech_process import SpeechWorkerPool, SpeechWorkerProcess
+from . speech_service import SpeechRecognitionService
+
+# MICROPHONE CAPTURE
+from . audio_capture import AudioCapture
+
+# STARTUP TIMELINE
+from . startup_timeline import StartupTimeline
+
 # IMPORT FUNCTIONS
 from . ui_functions import *
 
 # APP FUNCTIONS
 from . app_functions import *
+
+# DIFY API CLIENT
+from . dify_client import DifyAPIClient, EnhancedAIResponseThread
+
+# CHAT HISTORY
+from . chat_history import ChatHistoryManager
+
+# API CONFIG
+from . api_config import APIConfig
+
+# MAIN WINDOW
+from . main_window import MainWindow, APISettingsDialog
@@ -0,0 +1,44 @@
+import json
+
+from .chat_history import ChatHistoryManager
+from .http_session import HTTPSessionPool
+from .speech_service import SpeechRecognitionService
+from .upload_cache import UploadCache
+
+
+class APIConfig:
+    """Manage API configuration loading and saving"""
+    CONFIG_FILE = "api_config.json"
+
+    @staticmethod
+    def load_config():
+        """Loading configuration"""
+        try:
+            with open(APIConfig.CONFIG_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except:
+            return {
+                "dify_api_key": "",
+                "dify_base_url": "https://api.dify.ai/v1",
+                "stream_enabled": True,
+                "typing_speed": 0.03,
+                "pool_size": HTTPSessionPool.DEFAULT_POOL_SIZE,
+                "connect_timeout": HTTPSessionPool.DEFAULT_CONNECT_TIMEOUT,
+                "read_timeout": HTTPSessionPool.DEFAULT_READ_TIMEOUT,
+                "upload_cache_ttl_hours": UploadCache.DEFAULT_TTL_HOURS,
+                "speech_backend": SpeechRecognitionService.DEFAULT_BACKEND,
+                "speech_model": SpeechRecognitionService.DEFAULT_MODEL,
+                "speech_language": SpeechRecognitionService.DEFAULT_LANGUAGE,
+                "speech_compute_type": SpeechRecognitionService.DEFAULT_COMPUTE_TYPE,
+                "speech_beam_size": SpeechRecognitionService.DEFAULT_BEAM_SIZE,
+                "speech_online_fallback": False,
+                "history_max_sessions": ChatHistoryManager.DEFAULT_MAX_SESSIONS,
+                "history_max_age_days": ChatHistoryManager.DEFAULT_MAX_AGE_DAYS,
+                "history_max_size_mb": ChatHistoryManager.DEFAULT_MAX_SIZE_MB,
+                "history_compact_after_days": ChatHistoryManager.DEFAULT_COMPACT_AFTER_DAYS
+            }
+
+    @staticmethod
+    def save_config(config):
+        with open(APIConfig.CONFIG_FILE, 'w', encoding='utf-8') as f:
+            json.dump(config, f, ensure_ascii=False, indent=2)
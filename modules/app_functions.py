@@ -14,13 +14,17 @@
 #
 # ///////////////////////////////////////////////////////////////
 
-# MAIN FILE
+# QT AND SHARED MODULES (never the main.py entry script)
 # ///////////////////////////////////////////////////////////////
-from main import *
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from . app_settings import Settings
 
 # WITH ACCESS TO MAIN WINDOW WIDGETS
 # ///////////////////////////////////////////////////////////////
-class AppFunctions(MainWindow):
+class AppFunctions(QMainWindow):
     def setThemeHack(self):
         Settings.BTN_LEFT_BOX_COLOR = "background-color: #495474;"
         Settings.BTN_RIGHT_BOX_COLOR = "background-color: #495474;"
@@ -29,7 +33,11 @@ class AppFunctions(MainWindow):
         background-color: #566388;
         """
 
-        # SET MANUAL STYLES
+        # SET MANUAL STYLES (the demo page is only built on first use)
+        if self.ui.widgets is not None:
+            AppFunctions.setDemoWidgetsStyle(self)
+
+    def setDemoWidgetsStyle(self):
         self.ui.lineEdit.setStyleSheet("background-color: #6272a4;")
         self.ui.pushButton.setStyleSheet("background-color: #6272a4;")
         self.ui.plainTextEdit.setStyleSheet("background-color: #6272a4;")
@@ -0,0 +1,222 @@
+import collections
+import math
+import threading
+import time
+
+
+class AudioCapture:
+    """Microphone stream that stays open for the lifetime of the app.
+
+    A reader thread continuously pulls 16-bit mono chunks into a ring buffer.
+    begin() starts a capture that already includes the last PRE_ROLL_SECONDS
+    of audio, so speech starting right at the button press is not clipped, and
+    end() returns everything recorded since. While idle, the ambient-noise
+    energy threshold is recalibrated from the ring buffer every
+    CALIBRATION_INTERVAL seconds instead of blocking for a second per press.
+
+    With a segment callback, begin() also splits the capture as it arrives:
+    every chunk is compared against energy_threshold, and once speech is
+    followed by SEGMENT_PAUSE_SECONDS of silence (or runs past
+    MAX_SEGMENT_SECONDS) the segment is handed to the callback on the reader
+    thread. end() then returns only the not yet delivered tail.
+    MAX_CAPTURE_SECONDS bounds the audio held at once (the capture, or the
+    current segment), not the length of a segmented dictation.
+    """
+
+    PRE_ROLL_SECONDS = 0.5
+    RING_SECONDS = 2.0
+    MAX_CAPTURE_SECONDS = 30
+    CALIBRATION_INTERVAL = 30.0
+    CALIBRATION_SECONDS = 1.0
+
+    SEGMENT_PAUSE_SECONDS = 0.5
+    MIN_SEGMENT_SECONDS = 1.0
+    MAX_SEGMENT_SECONDS = 10.0
+
+    # Same dynamic threshold model as speech_recognition.Recognizer
+    DEFAULT_ENERGY_THRESHOLD = 300
+    DYNAMIC_ENERGY_DAMPING = 0.15
+    DYNAMIC_ENERGY_RATIO = 1.5
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, device_index=None):
+        self.device_index = device_index
+        self.sample_rate = None
+        self.sample_width = 2
+        self.chunk_size = None
+        self.energy_threshold = self.DEFAULT_ENERGY_THRESHOLD
+        self.error = None
+
+        self._lock = threading.Lock()
+        self._ring = collections.deque()
+        self._capture = None
+        self._on_segment = None
+        self._segment_has_speech = False
+        self._segment_silence = 0
+        self._segments_sent = 0
+        self._last_calibration = 0.0
+        self._running = False
+        self._thread = None
+        self._opened = threading.Event()
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide capture component"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @property
+    def is_open(self):
+        return self._opened.is_set() and self.error is None
+
+    @property
+    def is_capturing(self):
+        return self._capture is not None
+
+    def start(self):
+        """Open the microphone on a background thread; no-op if already running"""
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="audio-capture", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+
+    def waitUntilOpen(self, timeout=None):
+        return self._opened.wait(timeout) and self.error is None
+
+    def _chunkDuration(self):
+        return self.chunk_size / float(self.sample_rate)
+
+    def _run(self):
+        try:
+            import numpy  # noqa: F401  warm up for calibrate() and segmenting before the first capture
+            import speech_recognition as sr
+            microphone = sr.Microphone(device_index=self.device_index)
+            with microphone as source:
+                self.sample_rate = source.SAMPLE_RATE
+                self.sample_width = source.SAMPLE_WIDTH
+                self.chunk_size = source.CHUNK
+                self._ring = collections.deque(maxlen=max(1, math.ceil(self.RING_SECONDS / self._chunkDuration())))
+                # First calibration once a full CALIBRATION_SECONDS of audio is buffered
+                self._last_calibration = time.monotonic() - self.CALIBRATION_INTERVAL + self.CALIBRATION_SECONDS
+                self._opened.set()
+                print(f"🎙️ Microphone open ({self.sample_rate} Hz)")
+                while self._running:
+                    self._addChunk(source.stream.read(source.CHUNK))
+        except Exception as e:
+            self.error = e
+            print(f"Microphone initialiazation warning: {e}")
+        finally:
+            self._opened.set()
+            self._thread = None
+
+    def _addChunk(self, chunk):
+        max_chunks = self.MAX_CAPTURE_SECONDS / self._chunkDuration()
+        with self._lock:
+            self._ring.append(chunk)
+            if self._capture is not None:
+                if len(self._capture) < max_chunks:
+                    self._capture.append(chunk)
+                    segment = self._nextSegment(chunk) if self._on_segment is not None else None
+                else:
+                    segment = None
+                on_segment = self._on_segment
+            else:
+                on_segment = None
+        if on_segment is not None:
+            if segment:
+                on_segment(self._audioData(segment))
+            return
+        if self._capture is None and time.monotonic() - self._last_calibration >= self.CALIBRATION_INTERVAL:
+            self.calibrate()
+
+    def _nextSegment(self, chunk):
+        """Energy-based endpointing; returns the chunks of a finished segment or None (called under _lock)"""
+        seconds_per_chunk = self._chunkDuration()
+        if self._chunkEnergy(chunk) > self.energy_threshold:
+            self._segment_has_speech = True
+            self._segment_silence = 0
+        else:
+            self._segment_silence += 1
+
+        if not self._segment_has_speech:
+            # Only silence so far: keep a pre-roll's worth in front of the next onset
+            pre_roll = max(1, math.ceil(self.PRE_ROLL_SECONDS / seconds_per_chunk))
+            del self._capture[:-pre_roll]
+            return None
+
+        duration = len(self._capture) * seconds_per_chunk
+        paused = self._segment_silence * seconds_per_chunk >= self.SEGMENT_PAUSE_SECONDS
+        if (paused and duration >= self.MIN_SEGMENT_SECONDS) or duration >= self.MAX_SEGMENT_SECONDS:
+            segment, self._capture = self._capture, []
+            self._segment_has_speech = False
+            self._segment_silence = 0
+            self._segments_sent += 1
+            return segment
+        return None
+
+    def _chunkEnergy(self, chunk):
+        import numpy as np
+        samples = np.frombuffer(chunk, dtype=np.int16).astype(np.float32)
+        return float(np.sqrt(np.mean(samples ** 2))) if len(samples) else 0.0
+
+    def _audioData(self, chunks):
+        import speech_recognition as sr
+        return sr.AudioData(b"".join(chunks), self.sample_rate, self.sample_width)
+
+    def calibrate(self):
+        """Update energy_threshold from the most recent idle audio in the ring buffer"""
+        with self._lock:
+            chunks = list(self._ring)
+        seconds_per_chunk = self._chunkDuration()
+        chunks = chunks[-max(1, int(self.CALIBRATION_SECONDS / seconds_per_chunk)):]
+        if not chunks:
+            return
+        import numpy as np
+        samples = np.frombuffer(b"".join(chunks), dtype=np.int16).astype(np.float32)
+        energies = np.sqrt(np.mean(samples.reshape(len(chunks), -1) ** 2, axis=1))
+
+        damping = self.DYNAMIC_ENERGY_DAMPING ** seconds_per_chunk
+        threshold = self.energy_threshold
+        for energy in energies:
+            threshold = threshold * damping + energy * self.DYNAMIC_ENERGY_RATIO * (1 - damping)
+        self.energy_threshold = float(threshold)
+        self._last_calibration = time.monotonic()
+
+    def begin(self, on_segment=None):
+        """Start capturing, seeded with the pre-roll from the ring buffer.
+
+        on_segment, if given, is called from the reader thread with the
+        speech_recognition.AudioData of each segment finished while capturing.
+        """
+        if not self.is_open:
+            raise RuntimeError(f"Microphone unavailable: {self.error}" if self.error else "Microphone is not open yet")
+        pre_roll = max(0, math.ceil(self.PRE_ROLL_SECONDS / self._chunkDuration()))
+        with self._lock:
+            self._capture = list(self._ring)[-pre_roll:] if pre_roll else []
+            self._on_segment = on_segment
+            self._segment_has_speech = any(self._chunkEnergy(c) > self.energy_threshold for c in self._capture)
+            self._segment_silence = 0
+            self._segments_sent = 0
+
+    def end(self):
+        """Stop capturing and return the recorded speech_recognition.AudioData (None if not capturing).
+
+        When segmenting, only the tail after the last delivered segment is
+        returned, and None if that tail holds no speech.
+        """
+        with self._lock:
+            chunks, self._capture = self._capture, None
+            segmented = self._on_segment is not None and self._segments_sent > 0
+            has_speech = self._segment_has_speech
+            self._on_segment = None
+        if chunks is None or (segmented and not has_speech):
+            return None
+        return self._audioData(chunks)
@@ -0,0 +1,153 @@
+import numpy as np
+
+WHISPER_SAMPLE_RATE = 16000
+
+_PCM_DTYPES = {1: np.uint8, 2: np.int16, 4: np.int32}
+
+
+def pcm_to_float32(frame_data, sample_width=2, channels=1):
+    """Decode little-endian PCM bytes to mono float32 samples in [-1, 1]"""
+    if sample_width == 3:
+        # 24-bit: widen to int32 by padding a low zero byte to every sample
+        raw = np.frombuffer(frame_data, dtype=np.uint8).reshape(-1, 3)
+        padded = np.zeros((raw.shape[0], 4), dtype=np.uint8)
+        padded[:, 1:] = raw
+        samples = padded.view("<i4").ravel()
+        scale = 2.0 ** 31
+    else:
+        samples = np.frombuffer(frame_data, dtype=np.dtype(_PCM_DTYPES[sample_width]).newbyteorder("<"))
+        if sample_width == 1:
+            # 8-bit WAV PCM is unsigned
+            samples = samples.astype(np.int16) - 128
+        scale = 2.0 ** (8 * sample_width - 1)
+
+    audio = samples.astype(np.float32) / np.float32(scale)
+    if channels > 1:
+        audio = audio[:len(audio) - len(audio) % channels].reshape(-1, channels).mean(axis=1)
+    return audio
+
+
+def resample(audio, source_rate, target_rate=WHISPER_SAMPLE_RATE):
+    """Resample float32 audio with vectorized NumPy.
+
+    Integer down-sampling ratios (48 kHz, 32 kHz -> 16 kHz) average each group
+    of samples, which doubles as a simple anti-aliasing filter; any other ratio
+    is linearly interpolated.
+    """
+    if source_rate == target_rate or len(audio) == 0:
+        return audio.astype(np.float32, copy=False)
+
+    if source_rate > target_rate and source_rate % target_rate == 0:
+        factor = source_rate // target_rate
+        usable = len(audio) - len(audio) % factor
+        return audio[:usable].reshape(-1, factor).mean(axis=1, dtype=np.float32)
+
+    duration = len(audio) / float(source_rate)
+    target_length = int(round(duration * target_rate))
+    positions = np.arange(target_length, dtype=np.float64) * (source_rate / float(target_rate))
+    return np.interp(positions, np.arange(len(audio)), audio).astype(np.float32)
+
+
+def audio_data_to_whisper(audio):
+    """Convert speech_recognition AudioData to the 16 kHz float32 array Whisper takes directly"""
+    samples = pcm_to_float32(audio.frame_data, audio.sample_width)
+    return resample(samples, audio.sample_rate, WHISPER_SAMPLE_RATE)
+
+
+# Pre-processing before recognition: 30 ms analysis frames at 16 kHz
+FRAME_SECONDS = 0.03
+SILENCE_FLOOR = 0.003  # ~ -50 dBFS; frames quieter than this are never speech
+NOISE_RATIO = 3.0  # speech frames are this much louder than the noise floor
+MIN_DYNAMIC_RANGE = 2.0  # 6 dB between loud and quiet frames; steady noise stays near 1.1
+SPEECH_PADDING_SECONDS = 0.2  # kept on each side of the detected speech
+MIN_SPEECH_SECONDS = 0.2
+TARGET_RMS = 0.1  # -20 dBFS
+MAX_GAIN = 10.0
+PEAK_LIMIT = 0.99
+
+
+def frame_rms(audio, rate=WHISPER_SAMPLE_RATE, frame_seconds=FRAME_SECONDS):
+    """RMS of every non-overlapping frame (the last partial frame is dropped)"""
+    frame = max(1, int(rate * frame_seconds))
+    usable = len(audio) - len(audio) % frame
+    if not usable:
+        return np.zeros(0, dtype=np.float32)
+    frames = audio[:usable].reshape(-1, frame)
+    return np.sqrt(np.mean(frames * frames, axis=1, dtype=np.float32))
+
+
+def speech_frames(rms):
+    """Boolean mask of frames louder than the clip's own noise floor.
+
+    The threshold is capped at half the loud-frame level so a clip that is
+    speech almost end to end is not measured against itself. Speech rises and
+    falls between syllables; a clip whose loud frames are not MIN_DYNAMIC_RANGE
+    above its quiet ones is steady noise (fan, hum, hiss) and has no speech
+    frames at all, however loud it is.
+    """
+    if not len(rms):
+        return np.zeros(0, dtype=bool)
+    quiet, loud = np.percentile(rms, [10, 90])
+    if float(loud) < float(quiet) * MIN_DYNAMIC_RANGE:
+        return np.zeros(len(rms), dtype=bool)
+    threshold = max(SILENCE_FLOOR, min(float(quiet) * NOISE_RATIO, float(loud) * 0.5))
+    return rms > threshold
+
+
+class UtteranceStats:
+    """What pre-processing did to one utterance"""
+
+    __slots__ = ("duration", "kept", "speech", "gain")
+
+    def __init__(self, duration, kept, speech, gain):
+        self.duration = duration
+        self.kept = kept
+        self.speech = speech
+        self.gain = gain
+
+    @property
+    def trimmed(self):
+        return self.duration - self.kept
+
+    @property
+    def has_speech(self):
+        return self.speech >= MIN_SPEECH_SECONDS
+
+    def __str__(self):
+        if not self.has_speech:
+            return f"no speech in {self.duration:.2f} s, model skipped"
+        saved = self.trimmed / self.duration * 100 if self.duration else 0.0
+        return (f"trimmed {self.trimmed:.2f} s of {self.duration:.2f} s ({saved:.0f}% less audio to decode), "
+                f"speech {self.speech:.2f} s, gain x{self.gain:.2f}")
+
+
+def prepare_for_recognition(audio, rate=WHISPER_SAMPLE_RATE):
+    """Trim leading/trailing silence and normalize loudness.
+
+    Returns (samples, UtteranceStats); samples is None when the clip holds no
+    speech, so the caller can skip the model entirely and noise is never
+    amplified.
+    """
+    duration = len(audio) / float(rate)
+    rms = frame_rms(audio, rate)
+    voiced = speech_frames(rms)
+    frame = max(1, int(rate * FRAME_SECONDS))
+    speech = float(np.count_nonzero(voiced)) * frame / rate
+    if speech < MIN_SPEECH_SECONDS:
+        return None, UtteranceStats(duration, 0.0, speech, 1.0)
+
+    indices = np.flatnonzero(voiced)
+    padding = int(SPEECH_PADDING_SECONDS * rate)
+    start = max(0, indices[0] * frame - padding)
+    end = min(len(audio), (indices[-1] + 1) * frame + padding)
+    trimmed = audio[start:end]
+
+    # Gain from the loudness of the speech frames only, limited so peaks do not clip
+    speech_rms = float(np.sqrt(np.mean(rms[voiced] ** 2)))
+    peak = float(np.max(np.abs(trimmed)))
+    gain = min(TARGET_RMS / speech_rms, MAX_GAIN, PEAK_LIMIT / peak if peak else MAX_GAIN)
+    if abs(gain - 1.0) > 0.05:
+        trimmed = trimmed * np.float32(gain)
+    else:
+        gain = 1.0
+    return trimmed.astype(np.float32, copy=False), UtteranceStats(duration, len(trimmed) / float(rate), speech, gain)
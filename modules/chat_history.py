@@ -0,0 +1,151 @@
+from .chat_store import ChatHistoryStore
+from .history_writer import HistoryWriter
+from .legacy_history import LegacyHistoryIndex
+
+
+class ChatHistoryManager:
+    """Manage chat history storage and retrieval with auto-save support.
+
+    Saves return at once; a HistoryWriter thread commits them to the store
+    in the background and emits `saved` (its flushed signal) afterwards
+    with the ids it wrote.
+    The same thread applies the retention limits and compacts chats that
+    have not been touched for a while. A limit of 0 disables it.
+
+    A chat_history.json left by earlier versions is imported on that thread
+    when it starts, so a large archive never holds up the window. The thread
+    first brings the archive's byte-offset index (LegacyHistoryIndex) up to
+    date and emits a reset: from then until the import is done, chats not
+    imported yet are listed and opened through the index, which needs no
+    full parse of the file. A second reset follows the import.
+    """
+
+    DEFAULT_MAX_SESSIONS = 0
+    DEFAULT_MAX_AGE_DAYS = 0
+    DEFAULT_MAX_SIZE_MB = 0
+    DEFAULT_COMPACT_AFTER_DAYS = 30
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.max_sessions = int(config.get("history_max_sessions", self.DEFAULT_MAX_SESSIONS))
+        self.max_age_days = float(config.get("history_max_age_days", self.DEFAULT_MAX_AGE_DAYS))
+        self.max_size_mb = float(config.get("history_max_size_mb", self.DEFAULT_MAX_SIZE_MB))
+        self.compact_after_days = float(config.get("history_compact_after_days", self.DEFAULT_COMPACT_AFTER_DAYS))
+
+        self.store = ChatHistoryStore()
+        self.legacy = None  # the archive index, set while it is ready and not imported yet
+        startup = (self.index_legacy, self.import_legacy) if self.store.json_import_pending() else None
+        self.writer = HistoryWriter(self.store, maintenance=self.maintain, startup=startup)
+        self.saved = self.writer.flushed
+
+    def index_legacy(self):
+        """Index the chat_history.json archive so the list can show it; runs on the writer thread"""
+        index = LegacyHistoryIndex(ChatHistoryStore.LEGACY_JSON_FILE)
+        try:
+            if not index.refresh():
+                return False
+        except (OSError, ValueError) as e:
+            print(f"Chat history import skipped, {ChatHistoryStore.LEGACY_JSON_FILE} is unreadable: {e}")
+            return False
+        self.legacy = index
+        return True  # the list adds the archive's chats
+
+    def import_legacy(self):
+        """One-time import of the indexed chat_history.json archive; runs on the writer thread"""
+        if self.legacy is None:
+            return False
+        imported = self.store.migrate_json(index=self.legacy)
+        self.legacy = None
+        if imported:
+            print(f"Imported {imported} chats from {ChatHistoryStore.LEGACY_JSON_FILE} into {self.store.db_file}")
+        return True  # the list switches from the archive index to the store
+
+    def maintain(self):
+        """Apply the retention limits, then compact idle chats; runs on the writer thread"""
+        deleted = self.store.apply_retention(self.max_sessions, self.max_age_days, self.max_size_mb)
+        compacted = self.store.compact(self.compact_after_days) if self.compact_after_days else 0
+        if deleted or compacted:
+            print(f"Chat history maintenance: {deleted} chats removed, {compacted} compacted")
+        return bool(deleted)
+
+    def save_or_update_chat(self, chat_history, session_id=None, title=None):
+        """Queue a save of a new chat (no session_id) or an existing one; returns the session id"""
+        if not chat_history:
+            return None
+
+        if not session_id:
+            session_id = self.store.new_session_id()
+        self.writer.save(session_id, chat_history, title)
+        return session_id
+
+    def search(self, text, limit=100):
+        """Summaries of the chats matching `text`, best match first; None if there is nothing to search for"""
+        results = self.store.search_sessions(text, limit)
+        if results is None:
+            return None
+        removed = self.writer.pending_removals()
+        if removed is None:
+            return []
+        return [session for session in results if session['id'] not in removed]
+
+    def load_history(self, limit=None, after=None):
+        """Summaries of saved chats, newest first, `limit` at a time after the summary `after`.
+
+        Messages are read with load_chat.
+        """
+        removed = self.writer.pending_removals()
+        if removed is None:
+            return []
+        # Over-fetch so a page short of deleted chats still comes back full
+        count = limit + len(removed) if limit else limit
+        sessions = self.store.list_sessions(count, after)
+        legacy = self.legacy
+        if legacy is not None:
+            # Import still running: merge in the archive's chats, the stored copy wins
+            archived = self._legacy_call(legacy.list_sessions, count, after) or []
+            merged = {session['id']: session for session in archived}
+            merged.update((session['id'], session) for session in sessions)
+            sessions = sorted(merged.values(), key=lambda session: (session['timestamp'], session['id']), reverse=True)
+        return [session for session in sessions if session['id'] not in removed][:limit]
+
+    @staticmethod
+    def _legacy_call(method, *args):
+        try:
+            return method(*args)
+        except (OSError, ValueError) as e:
+            print(f"Reading {ChatHistoryStore.LEGACY_JSON_FILE} failed: {e}")
+            return None
+
+    def get_summary(self, chat_id):
+        """Summary of one saved chat, or None if it does not exist or is being deleted"""
+        removed = self.writer.pending_removals()
+        if removed is None or chat_id in removed:
+            return None
+        session = self.store.get_session(chat_id)
+        legacy = self.legacy
+        if session is None and legacy is not None:
+            session = self._legacy_call(legacy.get_session, chat_id)
+        return session
+
+    def load_chat(self, chat_id):
+        """Load the messages of one chat, including changes not written yet"""
+        pending = self.writer.pending_messages(chat_id)
+        if pending is not None:
+            return pending
+        legacy = self.legacy
+        if legacy is not None and self.store.get_session(chat_id) is None:
+            return self._legacy_call(legacy.load_messages, chat_id) or []
+        return self.store.load_messages(chat_id)
+
+    def delete_chat(self, chat_id):
+        """Delete a specific chat from history"""
+        self.writer.delete(chat_id)
+
+    def clear_all_history(self):
+        """Clear all chat history"""
+        self.writer.clear()
+
+    def close(self):
+        """Write everything still pending and close the database"""
+        self.writer.close()
+        self.store.close()
@@ -0,0 +1,55 @@
+"""Tokenization for the chat history full-text index.
+
+SQLite's unicode61 tokenizer has no notion of CJK words: it would index a
+whole run of Chinese text as a single token. Before text reaches FTS5, runs
+of CJK characters are therefore rewritten as space-separated overlapping
+bigrams ("成都三日游" -> 成都 都三 三日 日游); everything else is left to
+unicode61, which splits, lower-cases and folds it. Queries get the same
+treatment, so a CJK query matches as a phrase of consecutive bigrams. No Qt
+imports here.
+"""
+import re
+
+_CJK = (
+    "\u3040-\u30ff"  # Hiragana, Katakana
+    "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"  # CJK ideographs
+    "\uac00-\ud7af"  # Hangul syllables
+)
+_CJK_RUN = re.compile(rf"[{_CJK}]+")
+_RUNS = re.compile(rf"([{_CJK}]+)|([^\W_{_CJK}]+)")
+
+
+def _runs(text):
+    """(is_cjk, run) pairs in text order"""
+    for match in _RUNS.finditer(text.lower()):
+        cjk, word = match.groups()
+        yield (True, cjk) if cjk else (False, word)
+
+
+def _bigrams(run):
+    return [run] if len(run) == 1 else [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def index_text(text):
+    """Text in the form stored in the FTS5 table"""
+    return _CJK_RUN.sub(lambda match: " " + " ".join(_bigrams(match.group())) + " ", text or "")
+
+
+def match_query(text):
+    """FTS5 MATCH expression for a search-as-you-type query, or None if it has no terms.
+
+    Every term must match. CJK runs match as phrases of their bigrams; the
+    last term also matches as a prefix because it may still be being typed,
+    and a single CJK character only matches as the start of a bigram.
+    """
+    terms = []
+    runs = list(_runs(text or ""))
+    for position, (is_cjk, run) in enumerate(runs):
+        last = position == len(runs) - 1
+        if is_cjk and len(run) > 1:
+            terms.append('"' + " ".join(_bigrams(run)) + '"')
+        elif last or is_cjk:
+            terms.append(f'"{run}"*')
+        else:
+            terms.append(f'"{run}"')
+    return " ".join(terms) or None
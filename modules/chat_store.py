@@ -0,0 +1,460 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+
+if __package__:
+    from .chat_search import index_text, match_query
+    from .legacy_history import LegacyHistoryIndex, summarize
+else:  # imported from the modules directory by the benchmarks, without the GUI package
+    from chat_search import index_text, match_query
+    from legacy_history import LegacyHistoryIndex, summarize
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id            TEXT PRIMARY KEY,
+    title         TEXT,
+    timestamp     TEXT NOT NULL,
+    last_updated  TEXT NOT NULL,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    user_turns    INTEGER NOT NULL DEFAULT 0,
+    first_message TEXT,
+    size          INTEGER NOT NULL DEFAULT 0,
+    cold          INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sessions_by_time ON sessions (timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS sessions_warm ON sessions (last_updated) WHERE cold = 0;
+
+CREATE TABLE IF NOT EXISTS messages (
+    session_id TEXT NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+    seq        INTEGER NOT NULL,
+    role       TEXT NOT NULL,
+    content    TEXT NOT NULL,
+    extra      TEXT,
+    PRIMARY KEY (session_id, seq)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS cold_messages (
+    session_id TEXT PRIMARY KEY REFERENCES sessions (id) ON DELETE CASCADE,
+    payload    BLOB NOT NULL
+);
+
+-- Full-text index, one document per session; rowid is the session's rowid
+CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5 (title, body, tokenize = 'unicode61 remove_diacritics 2');
+CREATE TRIGGER IF NOT EXISTS sessions_unindex AFTER DELETE ON sessions BEGIN
+    DELETE FROM search WHERE rowid = old.rowid;
+END;
+
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Run on an existing database at user_version N to bring it to N + 1; empty until a
+# released schema needs migrating
+UPGRADES = {}
+
+SUMMARY_COLUMNS = "id, title, timestamp, last_updated, message_count, user_turns, first_message"
+
+
+def storable_message(message):
+    """Copy of a chat message with local paths reduced to file names"""
+    message = dict(message)
+    file_paths = message.pop("file_paths", None)
+    if file_paths:
+        message["file_info"] = [os.path.basename(path) for path in file_paths]
+    if "files" in message:
+        message["files"] = [{"name": file_data.get("name", "unknown"), "type": file_data.get("type", "file")}
+                            for file_data in message["files"]]
+    if message.get("role") == "assistant" and "images" in message:
+        message["images"] = [os.path.basename(path) for path in message["images"]]
+    return message
+
+
+class ChatHistoryStore:
+    """Chat sessions in a SQLite database in write-ahead-log mode.
+
+    A session row carries the summary the history list needs (title, times,
+    counts, first message); messages live in their own table keyed by
+    (session_id, seq), so appending a turn inserts one row and listing
+    sessions never reads message bodies. Sessions that have not changed for
+    a while can be compacted into one zlib-compressed row ("cold"), which is
+    expanded again transparently when the chat is continued. An FTS5 table
+    indexes titles and message text (see chat_search for the CJK-aware
+    tokenization); saving a turn only appends the new messages to it. One
+    connection is shared behind a lock, so the store can be used from any
+    thread.
+    """
+
+    DB_FILE = "chat_history.db"
+    LEGACY_JSON_FILE = "chat_history.json"
+    COMPACT_BATCH_SIZE = 100  # sessions per compaction transaction, keeps the lock short
+    IMPORT_BATCH_SIZE = 100  # sessions per import transaction, likewise
+    SEARCH_RANK_LIMIT = 1000  # only this many most recent matches are ranked by relevance
+
+    def __init__(self, db_file=DB_FILE):
+        self.db_file = db_file
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_file, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")  # durable at each checkpoint, never corrupt
+        self._db.execute("PRAGMA foreign_keys=ON")
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        for upgrade in range(version, SCHEMA_VERSION) if version else ():
+            if upgrade in UPGRADES:
+                self._db.executescript(UPGRADES[upgrade])
+        self._db.executescript(SCHEMA)
+        self._db.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._last_id = self._db.execute("SELECT COALESCE(MAX(CAST(id AS INTEGER)), 0) FROM sessions").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _transaction(self):
+        return _Transaction(self._db, self._lock)
+
+    # SESSIONS
+    # ///////////////////////////////////////////////////////////////
+    def list_sessions(self, limit=None, after=None):
+        """Session summaries, newest first, without any message bodies.
+
+        Pages are read by passing the last summary of the previous page as
+        `after`; each page is an index range scan, so its cost does not
+        depend on how many sessions are stored.
+        """
+        query = f"SELECT {SUMMARY_COLUMNS} FROM sessions"
+        params = []
+        if after is not None:
+            query += " WHERE (timestamp, id) < (?, ?)"
+            params += [after["timestamp"], after["id"]]
+        query += " ORDER BY timestamp DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            return [dict(row) for row in self._db.execute(query, params)]
+
+    def get_session(self, session_id):
+        """Summary of one session, or None"""
+        with self._lock:
+            row = self._db.execute(f"SELECT {SUMMARY_COLUMNS} FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        return dict(row) if row else None
+
+    def load_messages(self, session_id):
+        with self._lock:
+            return self._read_messages(self._db, session_id)
+
+    def load_session(self, session_id):
+        """Summary plus the full message list, or None"""
+        session = self.get_session(session_id)
+        if session is not None:
+            session["messages"] = self.load_messages(session_id)
+        return session
+
+    def save_session(self, session_id, messages, title=None, timestamp=None, last_updated=None):
+        """Create the session or bring its first len(messages) messages up to date.
+
+        The stored rows are compared with `messages` and only new or changed
+        ones are written, so a turn costs one insert plus the summary update,
+        and a download attaching files to a message rewrites just that row.
+        Rows past the end of a shorter list are kept; truncate_session drops
+        them.
+        """
+        now = datetime.now().isoformat()
+        messages = [storable_message(message) for message in messages]
+        with self._transaction() as db:
+            row = db.execute("SELECT cold FROM sessions WHERE id = ?", (session_id,)).fetchone()
+            if row is None:
+                stored = []
+                db.execute("INSERT INTO sessions (id, title, timestamp, last_updated) VALUES (?, ?, ?, ?)",
+                           (session_id, title, timestamp or now, last_updated or now))
+            else:
+                if row["cold"]:
+                    self._thaw(db, session_id)
+                stored = self._stored_rows(db, session_id)
+            self._write_messages(db, session_id, messages, stored, title, last_updated or now)
+
+    def truncate_session(self, session_id, length, last_updated=None):
+        """Drop the session's messages from index `length` on (an edited chat); returns how many went"""
+        with self._transaction() as db:
+            row = db.execute("SELECT cold FROM sessions WHERE id = ?", (session_id,)).fetchone()
+            if row is None:
+                return 0
+            if row["cold"]:
+                self._thaw(db, session_id)
+            stored = self._stored_rows(db, session_id)
+            if len(stored) <= length:
+                return 0
+            db.execute("DELETE FROM messages WHERE session_id = ? AND seq >= ?", (session_id, length))
+            self._update_summary(db, session_id, stored[:length], None, last_updated or datetime.now().isoformat())
+            self._index_session(db, session_id, stored[:length], 0, None, rebuild=True)
+            return len(stored) - length
+
+    def _write_messages(self, db, session_id, messages, stored, title, last_updated):
+        """Write the messages whose rows differ from `stored`, then refresh the summary and search index.
+
+        `stored` is the session's rows as _stored_rows returns them, empty
+        for a new session.
+        """
+        rows = [self._message_row(message) for message in messages]
+        db.executemany(
+            "INSERT OR REPLACE INTO messages (session_id, seq, role, content, extra) VALUES (?, ?, ?, ?, ?)",
+            [(session_id, seq, *row) for seq, row in enumerate(rows) if seq >= len(stored) or row != stored[seq]])
+        edited = any(row[1] != stored_row[1] for row, stored_row in zip(rows, stored))
+        rows += stored[len(rows):]
+        self._update_summary(db, session_id, rows, title, last_updated)
+        self._index_session(db, session_id, rows, len(stored), title, rebuild=edited)
+
+    @staticmethod
+    def _update_summary(db, session_id, rows, title, last_updated):
+        size = sum(len(content.encode('utf-8')) + len((extra or "").encode('utf-8')) for _, content, extra in rows)
+        db.execute(
+            "UPDATE sessions SET last_updated = ?, message_count = ?, user_turns = ?, first_message = ?, size = ?,"
+            " title = COALESCE(?, title) WHERE id = ?",
+            (last_updated, len(rows), sum(1 for role, _, _ in rows if role == "user"),
+             rows[0][1] if rows else None, size, title, session_id))
+
+    @staticmethod
+    def _index_session(db, session_id, rows, indexed, title, rebuild=False):
+        """Append the text of rows[indexed:] to the session's search document, or rebuild it"""
+        rowid = db.execute("SELECT rowid FROM sessions WHERE id = ?", (session_id,)).fetchone()[0]
+        document = db.execute("SELECT title, body FROM search WHERE rowid = ?", (rowid,)).fetchone()
+        if document is None or rebuild:
+            db.execute("DELETE FROM search WHERE rowid = ?", (rowid,))
+            title = title or db.execute("SELECT title FROM sessions WHERE rowid = ?", (rowid,)).fetchone()[0]
+            db.execute("INSERT INTO search (rowid, title, body) VALUES (?, ?, ?)",
+                       (rowid, index_text(title), " ".join(index_text(content) for _, content, _ in rows)))
+            return
+        new_text = " ".join(index_text(content) for _, content, _ in rows[indexed:])
+        if new_text or title:
+            db.execute("UPDATE search SET title = ?, body = body || ' ' || ? WHERE rowid = ?",
+                       (index_text(title) if title else document["title"], new_text, rowid))
+
+    @staticmethod
+    def _message_row(message):
+        extra = {key: value for key, value in message.items() if key not in ("role", "content")}
+        return (message.get("role", "user"), str(message.get("content", "")),
+                json.dumps(extra, ensure_ascii=False) if extra else None)
+
+    @staticmethod
+    def _stored_rows(db, session_id):
+        """The session's (role, content, extra) rows in order, as _message_row builds them"""
+        return [tuple(row) for row in db.execute(
+            "SELECT role, content, extra FROM messages WHERE session_id = ? ORDER BY seq", (session_id,))]
+
+    @staticmethod
+    def _read_messages(db, session_id):
+        cold = db.execute("SELECT payload FROM cold_messages WHERE session_id = ?", (session_id,)).fetchone()
+        if cold is not None:
+            return json.loads(zlib.decompress(cold["payload"]))
+        messages = []
+        for row in db.execute(
+                "SELECT role, content, extra FROM messages WHERE session_id = ? ORDER BY seq", (session_id,)):
+            message = {"role": row["role"], "content": row["content"]}
+            if row["extra"]:
+                message.update(json.loads(row["extra"]))
+            messages.append(message)
+        return messages
+
+    def new_session_id(self):
+        """Millisecond timestamp, bumped past the last id handed out; no disk access"""
+        with self._lock:
+            self._last_id = max(int(time.time() * 1000), self._last_id + 1)
+            return str(self._last_id)
+
+    def delete_session(self, session_id):
+        with self._transaction() as db:
+            db.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    def clear(self):
+        with self._transaction() as db:
+            db.execute("DELETE FROM sessions")
+
+    def session_count(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    # SEARCH
+    # ///////////////////////////////////////////////////////////////
+    def search_sessions(self, text, limit=100):
+        """Summaries of the sessions matching every term of `text`, best match first.
+
+        Ranked by BM25 with title matches weighted 3x, then by recency.
+        Scoring is the expensive part of a query, so when a common term
+        matches more than SEARCH_RANK_LIMIT sessions only the most recently
+        created ones (highest rowids) are ranked. Returns None when `text`
+        has nothing to search for.
+        """
+        query = match_query(text)
+        if query is None:
+            return None
+        columns = ", ".join(f"sessions.{column.strip()}" for column in SUMMARY_COLUMNS.split(","))
+        with self._lock:
+            oldest = self._db.execute(
+                "SELECT rowid FROM search WHERE search MATCH ? ORDER BY rowid DESC LIMIT 1 OFFSET ?",
+                (query, self.SEARCH_RANK_LIMIT - 1)).fetchone()
+            return [dict(row) for row in self._db.execute(
+                f"SELECT {columns} FROM search JOIN sessions ON sessions.rowid = search.rowid"
+                " WHERE search MATCH ? AND search.rowid >= ?"
+                " ORDER BY bm25(search, 3.0, 1.0), sessions.timestamp DESC LIMIT ?",
+                (query, oldest[0] if oldest else 0, int(limit)))]
+
+    # RETENTION AND COMPACTION
+    # ///////////////////////////////////////////////////////////////
+    def apply_retention(self, max_sessions=0, max_age_days=0, max_size_mb=0):
+        """Delete the oldest sessions past any of the limits (0 means no limit); returns how many went.
+
+        Age counts from the last update; count and size keep the newest
+        sessions in list order. Size is the stored size, so compacted
+        sessions count at their compressed size.
+        """
+        deleted = 0
+        with self._transaction() as db:
+            if max_age_days:
+                cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+                deleted += db.execute("DELETE FROM sessions WHERE last_updated < ?", (cutoff,)).rowcount
+            if max_sessions:
+                deleted += db.execute(
+                    "DELETE FROM sessions WHERE id IN"
+                    " (SELECT id FROM sessions ORDER BY timestamp DESC, id DESC LIMIT -1 OFFSET ?)",
+                    (int(max_sessions),)).rowcount
+            if max_size_mb:
+                deleted += db.execute(
+                    "DELETE FROM sessions WHERE id IN (SELECT id FROM"
+                    " (SELECT id, SUM(size) OVER (ORDER BY timestamp DESC, id DESC) AS total FROM sessions)"
+                    " WHERE total > ?)", (int(max_size_mb * 2 ** 20),)).rowcount
+        return deleted
+
+    def compact(self, older_than_days):
+        """Compress the messages of sessions not updated for `older_than_days` into cold rows; returns how many.
+
+        Works in batches of COMPACT_BATCH_SIZE sessions, each its own
+        transaction, so other readers and writers get the lock in between.
+        """
+        cutoff = (datetime.now() - timedelta(days=older_than_days)).isoformat()
+        compacted = 0
+        while True:
+            with self._transaction() as db:
+                session_ids = [row["id"] for row in db.execute(
+                    "SELECT id FROM sessions WHERE cold = 0 AND last_updated < ? LIMIT ?",
+                    (cutoff, self.COMPACT_BATCH_SIZE))]
+                for session_id in session_ids:
+                    self._freeze(db, session_id)
+            compacted += len(session_ids)
+            if len(session_ids) < self.COMPACT_BATCH_SIZE:
+                return compacted
+
+    def _freeze(self, db, session_id):
+        messages = self._read_messages(db, session_id)
+        payload = zlib.compress(json.dumps(messages, ensure_ascii=False).encode('utf-8'), 6)
+        db.execute("INSERT OR REPLACE INTO cold_messages (session_id, payload) VALUES (?, ?)", (session_id, payload))
+        db.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+        db.execute("UPDATE sessions SET cold = 1, size = ? WHERE id = ?", (len(payload), session_id))
+
+    def _thaw(self, db, session_id):
+        messages = self._read_messages(db, session_id)
+        db.execute("DELETE FROM cold_messages WHERE session_id = ?", (session_id,))
+        db.execute("UPDATE sessions SET cold = 0 WHERE id = ?", (session_id,))
+        db.executemany(
+            "INSERT INTO messages (session_id, seq, role, content, extra) VALUES (?, ?, ?, ?, ?)",
+            [(session_id, seq, *self._message_row(message)) for seq, message in enumerate(messages)])
+
+    # LEGACY JSON IMPORT
+    # ///////////////////////////////////////////////////////////////
+    def json_import_pending(self, json_file=LEGACY_JSON_FILE):
+        """True if json_file exists and has not been imported in its current state"""
+        marker = self._json_marker(json_file)
+        if marker is None:
+            return False
+        with self._lock:
+            row = self._db.execute("SELECT value FROM meta WHERE key = 'json_import'").fetchone()
+        return row is None or row["value"] != marker
+
+    @staticmethod
+    def _json_marker(json_file):
+        try:
+            stat = os.stat(json_file)
+        except OSError:
+            return None
+        return f"{os.path.abspath(json_file)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    def migrate_json(self, json_file=LEGACY_JSON_FILE, index=None):
+        """Import a chat_history.json archive once; returns the number of sessions imported.
+
+        The file is left in place as a backup. Its size and mtime are recorded
+        so the same file is never imported twice, while a different archive
+        dropped in later still is. Sessions whose id already exists are skipped
+        without being parsed: the archive is read through its byte-offset
+        index (a LegacyHistoryIndex, built if not given), one session at a
+        time, IMPORT_BATCH_SIZE sessions per transaction.
+        """
+        if not self.json_import_pending(json_file):
+            return 0
+        marker = self._json_marker(json_file)
+        index = index or LegacyHistoryIndex(json_file)
+        try:
+            # The archive is newest first; import oldest first so rowids follow creation order
+            sessions = list(reversed(index.sessions()))
+        except (OSError, ValueError) as e:
+            print(f"Chat history import skipped, {json_file} is unreadable: {e}")
+            return 0
+
+        imported = 0
+        for first in range(0, len(sessions), self.IMPORT_BATCH_SIZE):
+            batch = [session['id'] for session in sessions[first:first + self.IMPORT_BATCH_SIZE]]
+            with self._lock:
+                existing = {row[0] for row in self._db.execute(
+                    f"SELECT id FROM sessions WHERE id IN ({', '.join('?' * len(batch))})", batch)}
+            try:
+                records = [index.load_record(session_id) for session_id in batch if session_id not in existing]
+                records = [record for record in records if record is not None]
+            except (OSError, ValueError) as e:
+                print(f"Chat history import stopped, {json_file} is unreadable: {e}")
+                return imported
+            with self._transaction() as db:
+                for record in records:
+                    session_id = str(record["id"])
+                    if db.execute("SELECT 1 FROM sessions WHERE id = ?", (session_id,)).fetchone():
+                        continue
+                    summary = summarize(record)
+                    messages = [storable_message(message) for message in record.get("messages") or []
+                                if isinstance(message, dict)]
+                    db.execute("INSERT INTO sessions (id, timestamp, last_updated) VALUES (?, ?, ?)",
+                               (session_id, summary["timestamp"], summary["timestamp"]))
+                    self._write_messages(db, session_id, messages, [], summary["title"], summary["last_updated"])
+                    imported += 1
+        with self._transaction() as db:
+            db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_import', ?)", (marker,))
+        return imported
+
+
+class _Transaction:
+    """Hold the store lock for one BEGIN IMMEDIATE ... COMMIT block; rolls back on error"""
+
+    def __init__(self, db, lock):
+        self.db = db
+        self.lock = lock
+
+    def __enter__(self):
+        self.lock.acquire()
+        try:
+            self.db.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            self.lock.release()
+            raise
+        return self.db
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.db.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.lock.release()
+        return False
@@ -0,0 +1,676 @@
+import math
+import os
+from collections import OrderedDict
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QPoint, QPointF, QRect, QRectF, QSize, QUrl, Property, Signal
+from PySide6.QtGui import (Qt, QAbstractTextDocumentLayout, QColor, QDesktopServices, QFont, QFontMetrics,
+                           QGuiApplication, QImageReader, QPainter, QPalette, QPixmap, QPixmapCache,
+                           QTextCursor, QTextDocument)
+from PySide6.QtWidgets import QAbstractItemView, QFrame, QListView, QMenu, QStyledItemDelegate
+
+
+class TranscriptEntry:
+    """One row of the chat transcript; a plain object, so a long chat costs no widgets"""
+
+    MESSAGE = "message"
+    TYPING = "typing"
+    IMAGE = "image"
+    FILE = "file"
+    NOTE = "note"
+
+    __slots__ = ("kind", "text", "is_user", "path", "style", "revision", "cursor", "size_cache", "image_size")
+
+    def __init__(self, kind, text="", is_user=False, path=None, style=None):
+        self.kind = kind
+        self.text = text
+        self.is_user = is_user
+        self.path = path
+        self.style = style  # NOTE rows: "attachment" or "download"
+        self.revision = 0  # Bumped when the text is replaced rather than appended to
+        self.cursor = False
+        self.size_cache = None  # (layout width, QSize) filled in by the delegate
+        self.image_size = None  # (original QSize, displayed QSize) for IMAGE rows
+
+    @classmethod
+    def message(cls, text, is_user):
+        return cls(cls.MESSAGE, text, is_user=is_user)
+
+    @classmethod
+    def image(cls, path):
+        return cls(cls.IMAGE, path=path)
+
+    @classmethod
+    def file(cls, path, name=None):
+        return cls(cls.FILE, name or os.path.basename(path), path=path)
+
+    @classmethod
+    def note(cls, text, style="attachment"):
+        return cls(cls.NOTE, text, style=style)
+
+
+class TranscriptMessage:
+    """Handle to a message row with the setText/appendText/cursor API StreamRenderer expects"""
+
+    def __init__(self, model, entry):
+        self.model = model
+        self.entry = entry
+
+    @property
+    def current_text(self):
+        """Displayed text without the cursor"""
+        return self.entry.text
+
+    def setText(self, text):
+        self.model.setEntryText(self.entry, text)
+
+    def appendText(self, text):
+        if text:
+            self.model.appendEntryText(self.entry, text)
+
+    def addCursor(self):
+        self.model.setEntryCursor(self.entry, True)
+
+    def removeCursor(self):
+        self.model.setEntryCursor(self.entry, False)
+
+    def remove(self):
+        self.model.removeEntry(self.entry)
+
+
+class ChatTranscriptModel(QAbstractListModel):
+    """List model behind the chat transcript.
+
+    Rows are only appended, updated in place or cleared. A text change emits
+    dataChanged for that single row, so streaming into the last message never
+    touches the rest of the transcript.
+    """
+
+    EntryRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == self.EntryRole:
+            return entry
+        if role == Qt.DisplayRole:
+            return entry.text
+        if role == Qt.ToolTipRole and entry.path:
+            return entry.path
+        return None
+
+    def entries(self):
+        return list(self._entries)
+
+    def rowOf(self, entry):
+        """Row of entry, searching from the end where updates happen; -1 once removed"""
+        for row in range(len(self._entries) - 1, -1, -1):
+            if self._entries[row] is entry:
+                return row
+        return -1
+
+    def appendEntries(self, entries):
+        """Insert several rows with a single beginInsertRows (used when loading a chat)"""
+        if not entries:
+            return
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self._entries.extend(entries)
+        self.endInsertRows()
+
+    def appendEntry(self, entry):
+        self.appendEntries([entry])
+        return entry
+
+    def addMessage(self, text, is_user=True):
+        return TranscriptMessage(self, self.appendEntry(TranscriptEntry.message(text, is_user)))
+
+    def addTyping(self, text):
+        return TranscriptMessage(self, self.appendEntry(TranscriptEntry(TranscriptEntry.TYPING, text)))
+
+    def addImage(self, path):
+        """Append an image row; returns None when the file is not a readable image"""
+        reader = QImageReader(path)
+        if not reader.canRead() or not reader.size().isValid():
+            return None
+        return self.appendEntry(TranscriptEntry.image(path))
+
+    def addFile(self, path):
+        return self.appendEntry(TranscriptEntry.file(path))
+
+    def addNote(self, text, style="attachment"):
+        return self.appendEntry(TranscriptEntry.note(text, style))
+
+    def removeEntry(self, entry):
+        row = self.rowOf(entry)
+        if row >= 0:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._entries[row]
+            self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._entries = []
+        self.endResetModel()
+
+    def _entryChanged(self, entry):
+        row = self.rowOf(entry)
+        if row >= 0:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def setEntryText(self, entry, text):
+        entry.text = text
+        entry.cursor = False
+        entry.revision += 1
+        entry.size_cache = None
+        self._entryChanged(entry)
+
+    def appendEntryText(self, entry, text):
+        entry.text += text
+        entry.size_cache = None
+        self._entryChanged(entry)
+
+    def setEntryCursor(self, entry, shown):
+        if entry.cursor != shown:
+            entry.cursor = shown
+            entry.size_cache = None
+            self._entryChanged(entry)
+
+
+class _BubbleDocument:
+    """Cached QTextDocument for one message, kept in sync by appending in place"""
+
+    CURSOR_CHAR = "▌"
+
+    def __init__(self, entry, font):
+        self.document = QTextDocument()
+        self.document.setUndoRedoEnabled(False)
+        self.document.setDocumentMargin(0)
+        self.document.setDefaultFont(font)
+        if Qt.mightBeRichText(entry.text):
+            self.document.setHtml(entry.text)
+        else:
+            self.document.setPlainText(entry.text)
+        self.revision = entry.revision
+        self.length = len(entry.text)
+        self.cursor_shown = False
+        self._end_cursor = QTextCursor(self.document)
+        self.sync(entry)
+
+    def sync(self, entry):
+        """Insert text appended since the last sync and update the streaming cursor"""
+        if self.length == len(entry.text) and self.cursor_shown == entry.cursor:
+            return
+        end = self._end_cursor
+        end.movePosition(QTextCursor.End)
+        if self.cursor_shown:
+            end.movePosition(QTextCursor.Left, QTextCursor.KeepAnchor, len(self.CURSOR_CHAR))
+            end.removeSelectedText()
+        if len(entry.text) > self.length:
+            end.insertText(entry.text[self.length:])
+            self.length = len(entry.text)
+        if entry.cursor:
+            end.insertText(self.CURSOR_CHAR)
+        self.cursor_shown = entry.cursor
+
+
+class ChatMessageDelegate(QStyledItemDelegate):
+    """Paints transcript rows (bubbles, images, file chips, notes) without creating widgets.
+
+    Row sizes are cached on the entry per layout width and only recomputed when
+    the entry changes; laid-out documents live in a small LRU so scrolling back
+    and forth does not re-run text layout for every paint.
+    """
+
+    ROW_MARGIN_X = 10
+    ROW_MARGIN_Y = 5
+    AVATAR_SIZE = 30
+    AVATAR_SPACING = 10
+    BUBBLE_MAX_WIDTH = 800
+    BUBBLE_RADIUS = 12
+    USER_PADDING = (16, 12)
+    AI_PADDING = (15, 10)
+    IMAGE_PADDING = 12
+    IMAGE_SPACING = 8
+    IMAGE_MAX_SIZE = QSize(600, 400)  # Larger images are shown scaled down to IMAGE_SCALED_SIZE
+    IMAGE_SCALED_SIZE = QSize(300, 300)
+    FILE_PADDING = 8
+    FILE_ICON_WIDTH = 40
+    NOTE_PADDING = 5
+    SAVE_BUTTON_SIZE = QSize(90, 30)
+    DOWNLOAD_BUTTON_SIZE = QSize(80, 25)
+    DOCUMENT_CACHE_SIZE = 128
+
+    # Dark theme defaults; the theme stylesheet overrides them through the view's qproperty-* colors
+    bubble_color = QColor(44, 49, 58)
+    text_color = QColor(221, 221, 221)
+    avatar_color = QColor(68, 71, 90)
+    typing_color = QColor(113, 126, 149)
+    note_background = QColor(44, 49, 58, 77)
+    note_color = QColor(136, 136, 136)
+    download_note_color = QColor(52, 152, 219)
+    image_background = QColor(42, 45, 55)
+    meta_color = QColor(136, 136, 136)
+    save_button_color = QColor(33, 150, 243)
+    save_button_hover = QColor(11, 125, 218)
+    download_button_color = QColor(52, 152, 219)
+    download_button_hover = QColor(41, 128, 185)
+    button_text_color = QColor(255, 255, 255)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._documents = OrderedDict()
+        self.hover_rect = None  # Clickable rect under the mouse, maintained by the view
+
+        self.message_font = QFont()
+        self.message_font.setFamilies(["Microsoft YaHei UI", "PingFang SC"])
+        self.message_font.setPixelSize(24)
+        self.avatar_font = QFont(self.message_font)
+        self.typing_font = QFont()
+        self.typing_font.setPixelSize(14)
+        self.typing_font.setItalic(True)
+        self.small_font = QFont()
+        self.small_font.setPixelSize(12)
+        self.file_icon_font = QFont()
+        self.file_icon_font.setPixelSize(24)
+
+    def clearCache(self):
+        self._documents.clear()
+
+    # GEOMETRY
+    # ///////////////////////////////////////////////////////////////
+    def _rowWidth(self, option):
+        view = self.parent()
+        if isinstance(view, QAbstractItemView):
+            return view.viewport().width()
+        return option.rect.width()
+
+    def _padding(self, entry):
+        return self.USER_PADDING if entry.is_user else self.AI_PADDING
+
+    def _bubbleMaxWidth(self, entry, row_width):
+        available = row_width - 2 * self.ROW_MARGIN_X
+        if not entry.is_user:
+            available -= self.AVATAR_SIZE + self.AVATAR_SPACING
+        return max(4 * self.BUBBLE_RADIUS, min(self.BUBBLE_MAX_WIDTH, available))
+
+    def _document(self, entry, text_width):
+        cached = self._documents.get(entry)
+        if cached is not None and cached.revision == entry.revision:
+            self._documents.move_to_end(entry)
+            cached.sync(entry)
+        else:
+            font = self.typing_font if entry.kind == TranscriptEntry.TYPING else self.message_font
+            cached = _BubbleDocument(entry, font)
+            self._documents[entry] = cached
+            if len(self._documents) > self.DOCUMENT_CACHE_SIZE:
+                self._documents.popitem(last=False)
+        if cached.document.textWidth() != text_width:
+            cached.document.setTextWidth(text_width)
+        return cached.document
+
+    def _textWidth(self, entry, row_width):
+        """Layout width of a bubble's document. Sizing, painting and hit testing all use it,
+        so a streamed message is laid out once per change, not once per width."""
+        return self._bubbleMaxWidth(entry, row_width) - 2 * self._padding(entry)[0]
+
+    def _bubbleSize(self, entry, row_width):
+        bubble_max = self._bubbleMaxWidth(entry, row_width)
+        if entry.size_cache is not None and entry.size_cache[0] == bubble_max:
+            return entry.size_cache[1]
+        pad_x, pad_y = self._padding(entry)
+        doc = self._document(entry, self._textWidth(entry, row_width))
+        size = QSize(min(bubble_max, math.ceil(doc.idealWidth()) + 2 * pad_x + 1),
+                     math.ceil(doc.size().height()) + 2 * pad_y)
+        entry.size_cache = (bubble_max, size)
+        return size
+
+    def _bubbleRect(self, entry, rect):
+        size = self._bubbleSize(entry, rect.width())
+        top = rect.top() + self.ROW_MARGIN_Y
+        if entry.is_user:
+            left = rect.right() + 1 - self.ROW_MARGIN_X - size.width()
+        else:
+            left = rect.left() + self.ROW_MARGIN_X + self.AVATAR_SIZE + self.AVATAR_SPACING
+        return QRect(QPoint(left, top), size)
+
+    def _imageSizes(self, entry):
+        if entry.image_size is None:
+            original = QImageReader(entry.path).size()
+            shown = QSize(original) if original.isValid() else QSize(0, 0)
+            if original.width() > self.IMAGE_MAX_SIZE.width() or original.height() > self.IMAGE_MAX_SIZE.height():
+                shown = original.scaled(self.IMAGE_SCALED_SIZE, Qt.KeepAspectRatio)
+            entry.image_size = (original, shown)
+        return entry.image_size
+
+    def _contentRect(self, rect):
+        return rect.adjusted(self.ROW_MARGIN_X, self.ROW_MARGIN_Y, -self.ROW_MARGIN_X, -self.ROW_MARGIN_Y)
+
+    def _saveButtonRect(self, rect):
+        box = self._contentRect(rect).adjusted(self.IMAGE_PADDING, self.IMAGE_PADDING,
+                                               -self.IMAGE_PADDING, -self.IMAGE_PADDING)
+        size = self.SAVE_BUTTON_SIZE
+        return QRect(box.right() + 1 - size.width(), box.bottom() + 1 - size.height(), size.width(), size.height())
+
+    def _downloadButtonRect(self, rect):
+        box = self._contentRect(rect).adjusted(self.FILE_PADDING, self.FILE_PADDING, 0, -self.FILE_PADDING)
+        size = self.DOWNLOAD_BUTTON_SIZE
+        return QRect(box.left() + self.FILE_ICON_WIDTH, box.bottom() + 1 - size.height(), size.width(), size.height())
+
+    def _noteHeight(self, entry, row_width):
+        width = row_width - 2 * self.ROW_MARGIN_X - 2 * self.NOTE_PADDING
+        if entry.size_cache is not None and entry.size_cache[0] == width:
+            return entry.size_cache[1].height()
+        metrics = QFontMetrics(self._noteFont())
+        height = metrics.boundingRect(QRect(0, 0, max(1, width), 1 << 20), Qt.TextWordWrap, entry.text).height()
+        entry.size_cache = (width, QSize(width, height))
+        return height
+
+    def _noteFont(self):
+        font = QFont(self.parent().font()) if self.parent() is not None else QFont()
+        font.setItalic(True)
+        return font
+
+    def rowHeight(self, entry, row_width):
+        if entry.kind in (TranscriptEntry.MESSAGE, TranscriptEntry.TYPING):
+            height = self._bubbleSize(entry, row_width).height()
+            if not entry.is_user:
+                height = max(height, self.AVATAR_SIZE)
+        elif entry.kind == TranscriptEntry.IMAGE:
+            height = (2 * self.IMAGE_PADDING + self._imageSizes(entry)[1].height()
+                      + self.IMAGE_SPACING + self.SAVE_BUTTON_SIZE.height())
+        elif entry.kind == TranscriptEntry.FILE:
+            name_height = QFontMetrics(self._boldFont()).height()
+            height = 2 * self.FILE_PADDING + name_height + self.IMAGE_SPACING + self.DOWNLOAD_BUTTON_SIZE.height()
+        else:
+            height = self._noteHeight(entry, row_width) + 2 * self.NOTE_PADDING
+        return height + 2 * self.ROW_MARGIN_Y
+
+    def _boldFont(self):
+        font = QFont(self.parent().font()) if self.parent() is not None else QFont()
+        font.setBold(True)
+        return font
+
+    def sizeHint(self, option, index):
+        entry = index.data(ChatTranscriptModel.EntryRole)
+        row_width = self._rowWidth(option)
+        return QSize(row_width, self.rowHeight(entry, row_width))
+
+    def hitTest(self, index, rect, pos):
+        """Return (action, value, rect) for the clickable element at pos, or None"""
+        entry = index.data(ChatTranscriptModel.EntryRole)
+        if entry.kind == TranscriptEntry.MESSAGE:
+            bubble = self._bubbleRect(entry, rect)
+            if not bubble.contains(pos):
+                return None
+            pad_x, pad_y = self._padding(entry)
+            doc = self._document(entry, self._textWidth(entry, rect.width()))
+            anchor = doc.documentLayout().anchorAt(QPointF(pos - bubble.topLeft() - QPoint(pad_x, pad_y)))
+            return ("link", anchor, bubble) if anchor else None
+        if entry.kind == TranscriptEntry.IMAGE:
+            button = self._saveButtonRect(rect)
+            return ("save", entry.path, button) if button.contains(pos) else None
+        if entry.kind == TranscriptEntry.FILE:
+            button = self._downloadButtonRect(rect)
+            return ("open", entry.path, button) if button.contains(pos) else None
+        return None
+
+    # PAINTING
+    # ///////////////////////////////////////////////////////////////
+    def paint(self, painter, option, index):
+        entry = index.data(ChatTranscriptModel.EntryRole)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        if entry.kind in (TranscriptEntry.MESSAGE, TranscriptEntry.TYPING):
+            self._paintMessage(painter, option.rect, entry)
+        elif entry.kind == TranscriptEntry.IMAGE:
+            self._paintImage(painter, option.rect, entry)
+        elif entry.kind == TranscriptEntry.FILE:
+            self._paintFile(painter, option.rect, entry)
+        else:
+            self._paintNote(painter, option.rect, entry)
+        painter.restore()
+
+        # A streamed message grew a line: have the view re-query this row's height
+        if self.rowHeight(entry, option.rect.width()) != option.rect.height():
+            self.sizeHintChanged.emit(index)
+
+    def _paintMessage(self, painter, rect, entry):
+        painter.setPen(Qt.NoPen)
+        if not entry.is_user:
+            avatar = QRect(rect.left() + self.ROW_MARGIN_X, rect.top() + self.ROW_MARGIN_Y,
+                           self.AVATAR_SIZE, self.AVATAR_SIZE)
+            painter.setBrush(self.avatar_color)
+            painter.drawEllipse(avatar)
+            painter.setPen(self.text_color)
+            painter.setFont(self.avatar_font)
+            painter.drawText(avatar, Qt.AlignCenter, "🤖")
+            painter.setPen(Qt.NoPen)
+
+        bubble = self._bubbleRect(entry, rect)
+        painter.setBrush(self.bubble_color)
+        painter.drawRoundedRect(bubble, self.BUBBLE_RADIUS, self.BUBBLE_RADIUS)
+
+        pad_x, pad_y = self._padding(entry)
+        doc = self._document(entry, self._textWidth(entry, rect.width()))
+        painter.translate(bubble.left() + pad_x, bubble.top() + pad_y)
+        context = QAbstractTextDocumentLayout.PaintContext()
+        palette = QPalette(context.palette)
+        palette.setColor(QPalette.Text, self.typing_color if entry.kind == TranscriptEntry.TYPING else self.text_color)
+        context.palette = palette
+        context.clip = QRectF(0, 0, bubble.width() - 2 * pad_x, bubble.height() - 2 * pad_y)
+        doc.documentLayout().draw(painter, context)
+
+    def _paintButton(self, painter, rect, text, color, hover_color):
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(hover_color if rect == self.hover_rect else color)
+        painter.drawRoundedRect(rect, 4, 4)
+        painter.setPen(self.button_text_color)
+        painter.setFont(self.small_font)
+        painter.drawText(rect, Qt.AlignCenter, text)
+
+    def _paintImage(self, painter, rect, entry):
+        box = self._contentRect(rect)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.image_background)
+        painter.drawRoundedRect(box, 8, 8)
+
+        original, shown = self._imageSizes(entry)
+        key = f"chat_transcript:{entry.path}:{shown.width()}x{shown.height()}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(entry.path)
+            if not pixmap.isNull() and pixmap.size() != shown:
+                pixmap = pixmap.scaled(shown, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            QPixmapCache.insert(key, pixmap)
+        image_rect = QRect(box.left() + (box.width() - shown.width()) // 2, box.top() + self.IMAGE_PADDING,
+                           shown.width(), shown.height())
+        painter.drawPixmap(image_rect, pixmap)
+
+        button = self._saveButtonRect(rect)
+        meta = QRect(box.left() + self.IMAGE_PADDING, button.top(),
+                     button.left() - box.left() - 2 * self.IMAGE_PADDING, button.height())
+        painter.setPen(self.meta_color)
+        painter.setFont(self.small_font)
+        painter.drawText(meta, Qt.AlignLeft | Qt.AlignVCenter, f"Image {original.width()}×{original.height()}")
+        self._paintButton(painter, button, "Save As", self.save_button_color, self.save_button_hover)
+
+    def _paintFile(self, painter, rect, entry):
+        box = self._contentRect(rect).adjusted(self.FILE_PADDING, self.FILE_PADDING, 0, -self.FILE_PADDING)
+        painter.setPen(self.text_color)
+        painter.setFont(self.file_icon_font)
+        painter.drawText(QRect(box.left(), box.top(), self.FILE_ICON_WIDTH, box.height()),
+                         Qt.AlignLeft | Qt.AlignVCenter, "📄")
+
+        bold = self._boldFont()
+        painter.setFont(bold)
+        name_rect = QRect(box.left() + self.FILE_ICON_WIDTH, box.top(),
+                          box.width() - self.FILE_ICON_WIDTH, QFontMetrics(bold).height())
+        name = QFontMetrics(bold).elidedText(entry.text, Qt.ElideMiddle, name_rect.width())
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, name)
+        self._paintButton(painter, self._downloadButtonRect(rect), "Download",
+                          self.download_button_color, self.download_button_hover)
+
+    def _paintNote(self, painter, rect, entry):
+        box = self._contentRect(rect)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.note_background)
+        painter.drawRoundedRect(box, 5, 5)
+        painter.setPen(self.download_note_color if entry.style == "download" else self.note_color)
+        painter.setFont(self._noteFont())
+        text_rect = box.adjusted(self.NOTE_PADDING, self.NOTE_PADDING, -self.NOTE_PADDING, -self.NOTE_PADDING)
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, entry.text)
+
+
+def _delegateColor(name):
+    """Expose a delegate color as a QColor property so QSS can set it with qproperty-<name>"""
+
+    def getter(self):
+        return getattr(self.delegate, name)
+
+    def setter(self, color):
+        setattr(self.delegate, name, QColor(color))
+        self.viewport().update()
+
+    return Property(QColor, getter, setter)
+
+
+class ChatTranscriptView(QListView):
+    """Virtualized chat transcript.
+
+    Only the rows in the viewport are painted, by ChatMessageDelegate. Items are
+    laid out in batches so opening a long chat shows the first screen right away.
+    While the view is scrolled to the bottom it stays there as rows are added or
+    the streaming message grows.
+
+    Colors come from the theme stylesheet, e.g.
+    #chatDisplayArea { qproperty-bubbleColor: rgb(44, 49, 58); }
+    """
+
+    LAYOUT_BATCH_SIZE = 50
+
+    bubbleColor = _delegateColor("bubble_color")
+    textColor = _delegateColor("text_color")
+    avatarColor = _delegateColor("avatar_color")
+    typingColor = _delegateColor("typing_color")
+    noteBackground = _delegateColor("note_background")
+    noteColor = _delegateColor("note_color")
+    downloadNoteColor = _delegateColor("download_note_color")
+    imageBackground = _delegateColor("image_background")
+    metaColor = _delegateColor("meta_color")
+    saveButtonColor = _delegateColor("save_button_color")
+    saveButtonHoverColor = _delegateColor("save_button_hover")
+    downloadButtonColor = _delegateColor("download_button_color")
+    downloadButtonHoverColor = _delegateColor("download_button_hover")
+    buttonTextColor = _delegateColor("button_text_color")
+
+    saveImageRequested = Signal(str)
+    openFileRequested = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.transcript = ChatTranscriptModel(self)
+        self.delegate = ChatMessageDelegate(self)
+        self.setModel(self.transcript)
+        self.setItemDelegate(self.delegate)
+        self._placeholder = None
+        self._follow_tail = True
+
+        self.setFrameShape(QFrame.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(24)
+        self.setResizeMode(QListView.Adjust)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(self.LAYOUT_BATCH_SIZE)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setMouseTracking(True)
+
+        self.transcript.modelReset.connect(self.delegate.clearCache)
+        scrollbar = self.verticalScrollBar()
+        scrollbar.rangeChanged.connect(self._keepAtBottom)
+        scrollbar.valueChanged.connect(self._trackBottom)
+
+    def setPlaceholder(self, widget):
+        """Show widget (e.g. the welcome message) at the top of the viewport"""
+        self._placeholder = widget
+        widget.setParent(self.viewport())
+        self._layoutPlaceholder()
+
+    def _layoutPlaceholder(self):
+        if self._placeholder is not None:
+            margin = ChatMessageDelegate.ROW_MARGIN_X
+            width = self.viewport().width() - 2 * margin
+            height = self._placeholder.heightForWidth(width)
+            if height < 0:
+                height = self._placeholder.sizeHint().height()
+            self._placeholder.setGeometry(margin, margin, width, height)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._layoutPlaceholder()
+
+    def _trackBottom(self, value):
+        self._follow_tail = value >= self.verticalScrollBar().maximum()
+        self._setHoverRect(None)
+
+    def _keepAtBottom(self, minimum, maximum):
+        if self._follow_tail:
+            self.verticalScrollBar().setValue(maximum)
+
+    def _targetAt(self, pos):
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return None
+        return self.delegate.hitTest(index, self.visualRect(index), pos)
+
+    def _setHoverRect(self, rect):
+        old = self.delegate.hover_rect
+        if rect != old:
+            self.delegate.hover_rect = rect
+            for changed in (old, rect):
+                if changed is not None:
+                    self.viewport().update(changed)
+
+    def mouseMoveEvent(self, event):
+        target = self._targetAt(event.position().toPoint())
+        self.viewport().setCursor(Qt.PointingHandCursor if target else Qt.ArrowCursor)
+        self._setHoverRect(target[2] if target and target[0] != "link" else None)
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self._setHoverRect(None)
+        super().leaveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            target = self._targetAt(event.position().toPoint())
+            if target:
+                action, value, _ = target
+                if action == "link":
+                    QDesktopServices.openUrl(QUrl(value))
+                elif action == "save":
+                    self.saveImageRequested.emit(value)
+                elif action == "open":
+                    self.openFileRequested.emit(value)
+        super().mouseReleaseEvent(event)
+
+    def contextMenuEvent(self, event):
+        index = self.indexAt(event.pos())
+        text = index.data(Qt.DisplayRole) if index.isValid() else None
+        if not text:
+            return
+        menu = QMenu(self)
+        copy_action = menu.addAction("Copy")
+        if menu.exec(event.globalPos()) == copy_action:
+            QGuiApplication.clipboard().setText(text)
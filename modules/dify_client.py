@@ -0,0 +1,410 @@
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from PySide6.QtCore import QThread, Signal
+
+from .http_session import HTTPSessionPool
+from .sse_parser import iter_dify_events
+from .stream_renderer import ChunkBuffer
+from .upload_cache import UploadCache
+
+
+class DifyAPIClient:
+    """Enhanced Dify API client - with file/image upload support"""
+
+    MAX_UPLOAD_WORKERS = 4  # Concurrent attachment uploads per message
+
+    def __init__(self, api_key, base_url="https://api.dify.ai/v1", user="default_user", pool=None,
+                 upload_cache=None):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.user = user  # Add default user identifier
+        self.pool = pool or HTTPSessionPool.instance()  # Shared keep-alive connections
+        self.upload_cache = upload_cache or UploadCache.instance()  # Content hash -> upload_file_id
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+    def upload_file(self, file_path, user=None):
+        """Upload a file and return its file ID"""
+        if user is None:
+            user = self.user
+            
+        try:
+            with open(file_path, 'rb') as f:
+                filename = os.path.basename(file_path)
+                mime_type = self.get_mime_type(filename)
+                
+                files = {'file': (filename, f, mime_type)}
+                headers = {"Authorization": f"Bearer {self.api_key}"}
+                data = {'user': user}
+                
+                response = self.pool.post(
+                    f"{self.base_url}/files/upload",
+                    headers=headers,
+                    files=files,
+                    data=data
+                )
+                
+                if response.status_code == 201:  # Note: status code 201 for created
+                    file_data = response.json()
+                    return file_data.get('id')  # Return file ID
+                else:
+                    error_msg = f"File upload failed ({response.status_code}): {response.text[:100]}"
+                    print(error_msg)
+                    return None
+                
+        except Exception as e:
+            print(f"File upload error: {e}")
+            return None
+
+    def upload_file_cached(self, file_path, user=None, use_cache=True, cache_hits=None):
+        """Return a cached upload_file_id for identical content, uploading only on a miss.
+
+        Paths served from the cache are appended to `cache_hits` when given.
+        """
+        if user is None:
+            user = self.user
+
+        try:
+            cache_key = self.upload_cache.key_for(file_path, self.base_url, user)
+        except OSError as e:
+            print(f"File hashing error: {e}")
+            return self.upload_file(file_path, user=user)
+
+        if use_cache:
+            file_id = self.upload_cache.get(cache_key)
+            if file_id:
+                print(f"Upload cache hit: {os.path.basename(file_path)}")
+                if cache_hits is not None:
+                    cache_hits.append(file_path)
+                return file_id
+
+        file_id = self.upload_file(file_path, user=user)
+        if file_id:
+            self.upload_cache.put(cache_key, file_id)
+        return file_id
+
+    def invalidate_cached_uploads(self, file_paths, user=None):
+        """Drop cache entries for these files, e.g. after Dify rejected a cached ID"""
+        if user is None:
+            user = self.user
+        keys = []
+        for file_path in file_paths:
+            try:
+                keys.append(self.upload_cache.key_for(file_path, self.base_url, user))
+            except OSError:
+                continue
+        self.upload_cache.invalidate(keys)
+
+    def upload_files(self, file_paths, user=None, progress_callback=None, use_cache=True, cache_hits=None):
+        """Upload several files concurrently, returning file IDs in input order (None for failures)"""
+        file_ids = [None] * len(file_paths)
+        if not file_paths:
+            return file_ids
+
+        total = len(file_paths)
+        done = 0
+        if progress_callback:
+            progress_callback(0, total)
+
+        workers = min(self.MAX_UPLOAD_WORKERS, self.pool.pool_size, total)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dify-upload") as executor:
+            futures = {
+                executor.submit(self.upload_file_cached, file_path, user, use_cache, cache_hits): index
+                for index, file_path in enumerate(file_paths)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    file_ids[index] = future.result()
+                except Exception as e:
+                    print(f"File upload error ({file_paths[index]}): {e}")
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+
+        return file_ids
+
+    def get_mime_type(self, filename):
+        """Get MIME type based on filename"""
+        mime_types = {
+            '.jpg': 'image/jpeg',
+            '.jpeg': 'image/jpeg',
+            '.png': 'image/png',
+            '.gif': 'image/gif',
+            '.pdf': 'application/pdf',
+            '.doc': 'application/msword',
+            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+            '.xls': 'application/vnd.ms-excel',
+            '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            '.txt': 'text/plain',
+        }
+        ext = os.path.splitext(filename)[1].lower()
+        return mime_types.get(ext, 'application/octet-stream')
+    
+    def chat_with_files(self, message, file_paths=None, conversation_id=None, user_id="travelmind_user",
+                        progress_callback=None, use_upload_cache=True, response_mode="streaming"):
+        """Send a chat message with its attachments; returns the response, which the caller must close.
+
+        response_mode "streaming" returns the SSE stream, "blocking" the whole
+        answer as one JSON body.
+        """
+        url = f"{self.base_url}/chat-messages"
+    
+    # Build file info list
+        piclist = []
+        cache_hits = []  # paths whose upload_file_id came from the cache
+        if file_paths:
+            existing_paths = [path for path in file_paths if os.path.exists(path)]
+            file_ids = self.upload_files(existing_paths, user=user_id, progress_callback=progress_callback,
+                                         use_cache=use_upload_cache, cache_hits=cache_hits)
+            for file_path, file_id in zip(existing_paths, file_ids):
+                if file_id:
+                    piclist.append({
+                        "type": "image" if self.is_image(file_path) else "file",
+                        "transfer_method": "local_file",
+                        "upload_file_id": file_id
+                    })
+                else:
+                    print(f"Skipping attachment that failed to upload: {os.path.basename(file_path)}")
+        
+        # Build request payload
+        data = {
+            "inputs": {},  # Use format compatible with test.py
+            "user": user_id,
+            "query": message,
+            "response_mode": response_mode,
+            "files":piclist,
+            "conversation_id": conversation_id or ""
+        }
+        
+        try:
+            response = self.pool.post(
+                url,
+                headers=self.headers,
+                json=data,
+                stream=response_mode == "streaming"
+            )
+
+            # A cached upload_file_id may have expired on the server: re-upload once and retry
+            if cache_hits and self.is_stale_upload_error(response):
+                response.close()
+                self.invalidate_cached_uploads(cache_hits, user=user_id)
+                return self.chat_with_files(message, file_paths, conversation_id, user_id,
+                                            progress_callback, use_upload_cache=False, response_mode=response_mode)
+        
+            # Check response status
+            if response.status_code not in (200,201):
+                error_msg = f"API returned error ({response.status_code}): "
+                try:
+                    error_data = response.json()
+                    error_msg += error_data.get("message", "unknown error")
+                    if "detail" in error_data:
+                        error_msg += f" - {error_data['detail']}"
+                except:
+                    error_msg += response.text[:200] + "..."
+                finally:
+                    response.close()
+                raise Exception(error_msg)
+            
+            return response
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"API request failed: {str(e)}")
+            
+    @staticmethod
+    def is_stale_upload_error(response):
+        """True if Dify rejected the request because of an unknown or expired upload file"""
+        if response.status_code not in (400, 404):
+            return False
+        try:
+            error_data = response.json()
+        except ValueError:
+            return False
+        # e.g. {"code": "invalid_param", "message": "Invalid upload file id"}; not "Conversation Not Exists"
+        error_text = f"{error_data.get('code', '')} {error_data.get('message', '')}".lower()
+        return "file" in error_text
+
+    def is_image(self, file_path):
+        """More accurate image type check"""
+        image_exts = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp']
+        ext = os.path.splitext(file_path)[1].lower()
+        return ext in image_exts
+    
+    
+    def extract_image_urls(self,response_text):
+        """Extract image URLs (handles HTML tags specially)"""
+    # First pattern: match src attributes within tags
+        img_pattern = r']*src\s*=\s*[\'"]([^\'"]+)[\'"]'
+    
+    # Second pattern: match raw URLs (fallback)
+        url_pattern = r'(https?://[^\s"\'<]+)'
+    
+    
+        found_urls = []
+    
+    # First try to extract URLs from tags
+        img_matches = re.findall(img_pattern, response_text, re.IGNORECASE)
+        for url in img_matches:
+            # Clean HTML entities and special characters from URL
+            clean_url = url.replace('&amp;', '&').replace('&quot;', '"')
+            found_urls.append(clean_url)
+    
+    # If no tag URLs found, try plain URL matching
+        if not found_urls:
+            url_matches = re.findall(url_pattern, response_text)
+            for url in url_matches:
+                # Only keep image URLs
+                if any(url.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.webp']):
+                    found_urls.append(url)
+    
+        return found_urls
+
+
+class EnhancedAIResponseThread(QThread):
+    response_complete = Signal(str, str)
+    error_occurred = Signal(str)
+    file_received = Signal(dict)  
+    upload_progress = Signal(int, int)
+
+    def __init__(self, message, api_key=None, file_paths=None, conversation_id=None, stream=True,
+                 base_url="https://api.dify.ai/v1"):
+        super().__init__()
+        self.message = message
+        self.api_key = api_key
+        self.file_paths = file_paths or []
+        self.conversation_id = conversation_id
+        self.stream = stream
+        self.is_cancelled = False
+        self.full_response = "" 
+        self.stream_buffer = ChunkBuffer()  # Drained by the GUI once per frame
+
+        if not api_key:
+            self.test_mode = True
+        else:
+            self.test_mode = False
+            self.client = DifyAPIClient(api_key, base_url)
+
+    def cancel(self):
+        self.is_cancelled = True
+
+    def _deliver(self, text):
+        """Hand text to the GUI buffer without waiting for it to be displayed"""
+        self.full_response += text
+        self.stream_buffer.put(text)
+
+    def run(self):
+        try:
+            if self.test_mode:
+                self._handle_test_response()
+            elif self.stream:
+                self._handle_streaming_response()
+            else:
+                self._handle_blocking_response()
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def _handle_test_response(self):
+        time.sleep(0.5)
+        response = f"This is a test reply. Received message: {self.message}"
+        if self.file_paths:
+            response += "\nI see you uploaded an image, but test mode cannot analyze image content."
+
+        self._deliver(response)
+
+        if not self.is_cancelled:
+            self.response_complete.emit("", self.full_response)
+
+    def _handle_streaming_response(self):
+        """Handle streaming response - display content block by block"""
+        try:
+            # Use modified chat_with_files method
+            response = self.client.chat_with_files(
+                self.message,
+                self.file_paths,
+                self.conversation_id,
+                user_id="travelmind_user",  # Use user identifier from test.py
+                progress_callback=self.upload_progress.emit
+            )
+            
+            # Closing the response returns its connection to the shared pool, even on errors
+            with response:
+                # Check response status
+                if response.status_code != 200:
+                    error_msg = f"API returned error ({response.status_code}): "
+                    try:
+                        error_data = response.json()
+                        error_msg += error_data.get("message", "unknown error")
+                        if "detail" in error_data:
+                            error_msg += f" - {error_data['detail']}"
+                    except:
+                        error_msg += response.text[:200] + "..."
+                    raise Exception(error_msg)
+            
+                # Frame SSE events incrementally from the raw byte stream
+                new_conversation_id = self.conversation_id
+
+                for event_type, data in iter_dify_events(response.iter_content(chunk_size=None)):
+                    if self.is_cancelled:
+                        break
+
+                    if event_type == "message":
+                        # Handle message event
+                        if not new_conversation_id and data.get("conversation_id"):
+                            new_conversation_id = data["conversation_id"]
+
+                        # Get incremental content
+                        content = data.get("answer", "")
+                        if content:
+                            self._deliver(content)
+
+                    # Handle files
+                    if "files" in data:
+                        for file_info in data["files"]:
+                            self.file_received.emit(file_info)
+
+                    if event_type == "message_end":
+                        if not new_conversation_id and data.get("conversation_id"):
+                            new_conversation_id = data["conversation_id"]
+                        break
+
+                    elif event_type == "error":
+                        error_msg = data.get("message", "unknown error")
+                        self.error_occurred.emit(f"API error: {error_msg}")
+                        return
+
+            if not self.is_cancelled:
+                # Send complete response
+                self.response_complete.emit(new_conversation_id or "", self.full_response)
+
+        except Exception as e:
+            print(f"Streaming response processing exception: {str(e)}")
+            self.error_occurred.emit(f"API call error: {str(e)}")
+
+    def _handle_blocking_response(self):
+        """Handle blocking response - the whole answer arrives as one JSON body"""
+        try:
+            response = self.client.chat_with_files(
+                self.message,
+                self.file_paths,
+                self.conversation_id,
+                user_id="travelmind_user",
+                progress_callback=self.upload_progress.emit,
+                response_mode="blocking"
+            )
+            with response:
+                result = response.json()
+            content = result.get("answer") or "Sorry, I cannot answer your question right now."
+            conversation_id = result.get("conversation_id") or self.conversation_id or ""
+
+            self._deliver(content)
+
+            if not self.is_cancelled:
+                self.response_complete.emit(conversation_id, self.full_response)
+
+        except Exception as e:
+            self.error_occurred.emit(f"API call error: {str(e)}")
@@ -0,0 +1,152 @@
+from datetime import datetime
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class HistoryListModel(QAbstractListModel):
+    """Chat summaries for the History page, read from the history manager a page at a time.
+
+    Rows are summary dicts (no messages). The view asks for more through
+    canFetchMore / fetchMore as it scrolls, so only the visible part of a
+    long history is ever read. Display text and tooltips are built when a
+    row is first painted or hovered. applyChanges() updates, inserts or
+    removes just the rows a save touched instead of reloading the list.
+    With a filter set, the rows are the ranked search results instead.
+    """
+
+    PAGE_SIZE = 100
+    SEARCH_LIMIT = 200
+    SessionRole = Qt.UserRole + 1
+
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.source = source  # ChatHistoryManager: load_history(limit, after), search(text, limit), get_summary(id)
+        self._sessions = []
+        self._display = {}  # session id -> (display text, tooltip), filled on first use
+        self._filter = ""
+        self._searching = False
+        self._exhausted = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._sessions)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        session = self._sessions[index.row()]
+        if role == self.SessionRole:
+            return session
+        if role == Qt.DisplayRole:
+            return self._texts(session)[0]
+        if role == Qt.ToolTipRole:
+            return self._texts(session)[1]
+        return None
+
+    def _texts(self, session):
+        texts = self._display.get(session['id'])
+        if texts is None:
+            timestamp = datetime.fromisoformat(session['timestamp']).strftime("%Y-%m-%d %H:%M")
+
+            # Use custom title if available, otherwise use first message
+            first_message = session['first_message']
+            display_title = session['title'] or first_message or "Empty chat"
+            if not session['title'] and len(display_title) > 50:
+                display_title = display_title[:50] + "..."
+
+            texts = (f"[{timestamp}] {display_title}",
+                     f"Time: {timestamp}\nMessages: {session['user_turns']}\nFirst message: {first_message or 'None'}")
+            self._display[session['id']] = texts
+        return texts
+
+    def sessionAt(self, row):
+        return self._sessions[row] if 0 <= row < len(self._sessions) else None
+
+    def rowOf(self, session_id):
+        for row, session in enumerate(self._sessions):
+            if session['id'] == session_id:
+                return row
+        return -1
+
+    # LOADING
+    # ///////////////////////////////////////////////////////////////
+    def setFilter(self, text):
+        """Show the search results for text, or the whole history when it has no search terms"""
+        self._filter = text
+        self.reload()
+
+    def reload(self):
+        self.beginResetModel()
+        self._display = {}
+        results = self.source.search(self._filter, self.SEARCH_LIMIT) if self._filter.strip() else None
+        self._searching = results is not None
+        self._sessions = results if self._searching else self.source.load_history(self.PAGE_SIZE)
+        self._exhausted = self._searching or len(self._sessions) < self.PAGE_SIZE
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        page = self.source.load_history(self.PAGE_SIZE, after=self._sessions[-1] if self._sessions else None)
+        self._exhausted = len(page) < self.PAGE_SIZE
+        if page:
+            first = len(self._sessions)
+            self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+            self._sessions.extend(page)
+            self.endInsertRows()
+
+    # INCREMENTAL UPDATES
+    # ///////////////////////////////////////////////////////////////
+    def applyChanges(self, changes):
+        """Apply one HistoryWriter batch: {"saved": [ids], "deleted": [ids], "reset": bool}"""
+        if changes.get("reset") or self._searching and changes.get("saved"):
+            self.reload()  # search ranks depend on the new text; a cleared store has nothing to keep
+            return
+        for session_id in changes.get("deleted", ()):
+            self.removeSession(session_id)
+        for session_id in changes.get("saved", ()):
+            self.updateSession(session_id)
+
+    def removeSession(self, session_id):
+        row = self.rowOf(session_id)
+        if row >= 0:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._sessions[row]
+            self._display.pop(session_id, None)
+            self.endRemoveRows()
+
+    def updateSession(self, session_id):
+        """Refresh one row from the store, inserting it in order if it is new and within the loaded pages"""
+        session = self.source.get_summary(session_id)
+        row = self.rowOf(session_id)
+        if session is None:
+            self.removeSession(session_id)
+            return
+        self._display.pop(session_id, None)
+        if row >= 0:
+            self._sessions[row] = session
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+            return
+        if self._searching:
+            return
+        row = self._insertionRow(session)
+        if row == len(self._sessions) and not self._exhausted:
+            return  # belongs to a page that has not been fetched yet
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._sessions.insert(row, session)
+        self.endInsertRows()
+
+    def _insertionRow(self, session):
+        """Binary search in the newest-first (timestamp, id) order of the rows"""
+        key = (session['timestamp'], session['id'])
+        low, high = 0, len(self._sessions)
+        while low < high:
+            middle = (low + high) // 2
+            if (self._sessions[middle]['timestamp'], self._sessions[middle]['id']) > key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
@@ -0,0 +1,173 @@
+import threading
+import time
+
+from PySide6.QtCore import QObject, Signal
+
+
+class HistoryWriter(QObject):
+    """Background persistence for chat history.
+
+    The GUI thread only records what changed: save() snapshots the messages
+    of a session, delete() and clear() queue removals. A single writer
+    thread waits until changes stop arriving for `delay` seconds (at most
+    MAX_DELAY after the first one), then applies them to the
+    ChatHistoryStore, one transaction per session, so a burst of saves of the
+    same chat costs one write. `flushed` is emitted after every batch with
+    what it touched, {"saved": [ids], "deleted": [ids], "reset": bool}
+    (reset after a clear), so views can update just those rows. A batch
+    stays visible to pending_messages() and pending_removals() until its
+    transactions are committed, so a read in between never falls back to
+    the store's older rows. close() writes whatever is still pending before
+    it returns.
+
+    The same thread runs `maintenance` (retention and compaction) while it is
+    idle: MAINTENANCE_DELAY after startup and every MAINTENANCE_INTERVAL
+    after that. It returns True when sessions changed, which emits `flushed`
+    with reset set. `startup`, if given, is a sequence of such tasks run on
+    the thread, in order, before anything else (indexing and then importing
+    the legacy JSON archive); each reports changes the same way, and saves
+    made meanwhile are queued behind them.
+    """
+
+    DEFAULT_DELAY = 0.5  # seconds of quiet before a batch is written
+    MAX_DELAY = 5.0  # a steady stream of changes is still written this often
+    MAINTENANCE_DELAY = 30.0
+    MAINTENANCE_INTERVAL = 6 * 3600.0
+
+    flushed = Signal(object)
+
+    def __init__(self, store, delay=DEFAULT_DELAY, maintenance=None, startup=None, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.delay = delay
+        self.maintenance = maintenance
+        self.startup = startup
+        self._next_maintenance = time.monotonic() + self.MAINTENANCE_DELAY
+        self._pending = {}  # session id -> ("save", messages, title) / ("delete",); None -> ("clear",)
+        self._inflight = {}  # the batch being written, still visible to readers until it is committed
+        self._condition = threading.Condition()
+        self._version = 0  # bumped on every change, for the debounce
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._thread.start()
+
+    def save(self, session_id, messages, title=None):
+        snapshot = [dict(message) for message in messages]
+        with self._condition:
+            self._pending.pop(session_id, None)  # keep changes in arrival order
+            self._pending[session_id] = ("save", snapshot, title)
+            self._version += 1
+            self._condition.notify()
+
+    def delete(self, session_id):
+        with self._condition:
+            self._pending.pop(session_id, None)
+            self._pending[session_id] = ("delete",)
+            self._version += 1
+            self._condition.notify()
+
+    def clear(self):
+        with self._condition:
+            self._pending = {None: ("clear",)}
+            self._version += 1
+            self._condition.notify()
+
+    def pending_messages(self, session_id):
+        """Messages saved for a session but not committed yet, or None"""
+        with self._condition:
+            # Queued changes are newer than the batch being written
+            for changes in (self._pending, self._inflight):
+                change = changes.get(session_id)
+                if change is not None and change[0] == "save":
+                    return [dict(message) for message in change[1]]
+                if change is not None or None in changes:
+                    return []
+            return None
+
+    def pending_removals(self):
+        """Ids deleted but not committed yet; None while a clear is pending"""
+        with self._condition:
+            if None in self._pending or None in self._inflight:
+                return None
+            removed = {session_id for session_id, change in self._inflight.items() if change[0] == "delete"}
+            for session_id, change in self._pending.items():
+                if change[0] == "delete":
+                    removed.add(session_id)
+                else:
+                    removed.discard(session_id)
+            return removed
+
+    def close(self):
+        """Stop the writer thread after it has written everything; safe to call twice"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self):
+        for task in self.startup or ():
+            self._call(task, "startup")
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    timeout = self._until_maintenance()
+                    if timeout == 0:
+                        break
+                    self._condition.wait(timeout)
+                # Debounce: wait until changes stop arriving or the app closes
+                version, deadline = None, time.monotonic() + self.MAX_DELAY
+                while not self._closed and version != self._version and time.monotonic() < deadline:
+                    version = self._version
+                    self._condition.wait(self.delay)
+                changes, self._pending = self._pending, {}
+                self._inflight = changes
+                closed = self._closed
+            if not changes and closed:
+                return
+            try:
+                self._apply(changes)
+            finally:
+                with self._condition:
+                    self._inflight = {}
+            if not closed and self._until_maintenance() == 0:
+                self._maintain()
+
+    def _until_maintenance(self):
+        """Seconds until maintenance is due, or None if there is none"""
+        if self.maintenance is None:
+            return None
+        return max(0.0, self._next_maintenance - time.monotonic())
+
+    def _maintain(self):
+        self._next_maintenance = time.monotonic() + self.MAINTENANCE_INTERVAL
+        self._call(self.maintenance, "maintenance")
+
+    def _call(self, task, name):
+        try:
+            changed = task()
+        except Exception as e:
+            print(f"Chat history {name} failed: {e}")
+            return
+        if changed:
+            self.flushed.emit({"saved": [], "deleted": [], "reset": True})
+
+    def _apply(self, changes):
+        if not changes:
+            return
+        summary = {"saved": [], "deleted": [], "reset": False}
+        for session_id, change in changes.items():
+            try:
+                if change[0] == "clear":
+                    self.store.clear()
+                    summary["reset"] = True
+                elif change[0] == "delete":
+                    self.store.delete_session(session_id)
+                    summary["deleted"].append(session_id)
+                else:
+                    self.store.save_session(session_id, change[1], change[2])
+                    summary["saved"].append(session_id)
+            except Exception as e:
+                print(f"Chat history save failed: {e}")
+        self.flushed.emit(summary)
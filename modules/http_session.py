@@ -0,0 +1,83 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HTTPSessionPool:
+    """Shared keep-alive connection pool for all Dify and download requests"""
+
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_CONNECT_TIMEOUT = 5
+    DEFAULT_READ_TIMEOUT = 60
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout=DEFAULT_READ_TIMEOUT):
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+        # One urllib3 pool per host, blocking when all connections are busy
+        # so worker threads queue up instead of opening throwaway sockets
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide pool, creating it with defaults if needed"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def configure(cls, config):
+        """(Re)create the shared pool from the api_config.json settings"""
+        pool = cls(
+            pool_size=int(config.get("pool_size", cls.DEFAULT_POOL_SIZE)),
+            connect_timeout=float(config.get("connect_timeout", cls.DEFAULT_CONNECT_TIMEOUT)),
+            read_timeout=float(config.get("read_timeout", cls.DEFAULT_READ_TIMEOUT)),
+        )
+        with cls._instance_lock:
+            old, cls._instance = cls._instance, pool
+        if old is not None:
+            old.close()
+        return pool
+
+    @property
+    def timeout(self):
+        """Split (connect, read) timeout used when a call does not pass its own"""
+        return (self.connect_timeout, self.read_timeout)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def prewarm(self, base_url):
+        """Open a connection to base_url in the background so the first message skips the handshake"""
+        if not base_url:
+            return None
+
+        def warm():
+            try:
+                self.session.head(base_url, timeout=(self.connect_timeout, self.connect_timeout))
+            except requests.exceptions.RequestException as e:
+                print(f"Connection prewarm failed: {e}")
+
+        thread = threading.Thread(target=warm, name="http-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def close(self):
+        self.session.close()
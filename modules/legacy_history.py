@@ -0,0 +1,214 @@
+"""Byte-offset index over the chat_history.json archive of earlier versions.
+
+That file is one JSON array of sessions with every message inline, so
+showing the history list used to mean parsing all of it. The index records,
+for each session, the byte range of its object in the file plus the summary
+fields the list needs. It is kept in a sidecar file next to the archive
+(chat_history.json.idx) together with the archive's size and mtime. While
+those still match, the list comes from the sidecar alone and opening a chat
+parses just that chat's bytes. When they change, the file is re-scanned for
+object boundaries and only objects whose bytes are new are parsed; the rest
+keep their summaries. Boundaries are found by a plain byte search in the
+layout the app wrote (json.dump with indent=2), by decoding otherwise. No Qt imports here.
+"""
+import json
+import os
+import re
+import threading
+import zlib
+
+# json.dump(indent=2) puts each session object between lines "  {" and "  }";
+# nested lines are indented deeper and strings never contain a raw newline
+_INDENTED_ARRAY = re.compile(rb"\[\r?\n  \{\r?\n")
+_INDENTED_START = re.compile(rb"\n  \{\r?\n")
+_INDENTED_END = re.compile(rb"\n  \}")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _scan_indented(data):
+    """Object ranges of an archive in the layout the app wrote, found without parsing; None if it is not"""
+    starts = [match.start() + 1 for match in _INDENTED_START.finditer(data)]
+    ends = [match.end() for match in _INDENTED_END.finditer(data)]
+    if len(starts) != len(ends) or any(end < start for start, end in zip(starts, ends)):
+        return None
+    return list(zip(starts, ends))
+
+
+def _scan_decoded(data):
+    """Object ranges of an archive in any layout, found by decoding it element by element"""
+    text = data.decode('latin-1')  # one character per byte, so positions are byte offsets
+    decoder = json.JSONDecoder()
+    position = _WHITESPACE.match(text).end()
+    if text[position:position + 1] != "[":
+        raise ValueError("chat history archive is not a JSON array")
+    ranges = []
+    position = _WHITESPACE.match(text, position + 1).end()
+    if text[position:position + 1] == "]":
+        return ranges
+    while True:
+        _, end = decoder.raw_decode(text, position)
+        if text[position] == "{":
+            ranges.append((position, end))
+        position = _WHITESPACE.match(text, end).end()
+        separator = text[position:position + 1]
+        if separator == "]":
+            return ranges
+        if separator != ",":
+            raise ValueError(f"expected ',' or ']' at byte {position}")
+        position = _WHITESPACE.match(text, position + 1).end()
+
+
+def summarize(record):
+    """Summary fields of one archived session, as ChatHistoryStore.list_sessions returns them"""
+    messages = [message for message in record.get("messages") or [] if isinstance(message, dict)]
+    timestamp = record.get("timestamp") or record.get("last_updated") or "1970-01-01T00:00:00"
+    return {
+        "id": str(record["id"]),
+        "title": record.get("title"),
+        "timestamp": timestamp,
+        "last_updated": record.get("last_updated") or timestamp,
+        "message_count": len(messages),
+        "user_turns": sum(1 for message in messages if message.get("role", "user") == "user"),
+        "first_message": str(messages[0].get("content", "")) if messages else None,
+    }
+
+
+class LegacyHistoryIndex:
+    """Session summaries and byte ranges of a chat_history.json archive.
+
+    refresh() brings the index up to date and must be called before the
+    other methods; they call it again themselves if the archive has changed
+    since. Sessions keep the archive's order (newest first, as the app wrote
+    them); list_sessions() sorts and pages like the SQLite store. Safe to use
+    from several threads.
+    """
+
+    INDEX_SUFFIX = ".idx"
+    INDEX_VERSION = 1
+
+    def __init__(self, json_file):
+        self.json_file = json_file
+        self.index_file = json_file + self.INDEX_SUFFIX
+        self._stamp = None  # (size, mtime_ns) of the archive the entries describe
+        self._entries = []  # [offset, length, crc32, summary] in file order
+        self._by_id = {}
+        self._newest_first = []
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Re-index the archive if it changed; returns False if there is none.
+
+        Raises OSError or ValueError if the archive cannot be read or parsed.
+        """
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self):
+        try:
+            stat = os.stat(self.json_file)
+        except OSError:
+            self._set_entries(None, [])
+            return False
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        if stamp == self._stamp:
+            return True
+        if self._stamp is None:
+            self._load_sidecar()
+            if stamp == self._stamp:
+                return True
+
+        with open(self.json_file, 'rb') as f:
+            data = f.read()
+        known = {(length, crc): summary for _, length, crc, summary in self._entries}
+        entries = None
+        ranges = _scan_indented(data) if _INDENTED_ARRAY.match(data) else None
+        if ranges is not None:
+            try:
+                entries = self._index(data, ranges, known)
+            except ValueError:
+                pass  # not the layout json.dump(indent=2) writes after all
+        if entries is None:
+            entries = self._index(data, _scan_decoded(data), known)
+        self._set_entries(stamp, entries)
+        self._save_sidecar()
+        return True
+
+    @staticmethod
+    def _index(data, ranges, known):
+        """Entries for the given object ranges, parsing only objects not in `known`"""
+        entries = []
+        for start, end in ranges:
+            chunk = data[start:end]
+            crc = zlib.crc32(chunk)
+            summary = known.get((len(chunk), crc))
+            if summary is None:
+                record = json.loads(chunk)
+                if not record.get("id"):
+                    continue
+                summary = summarize(record)
+            entries.append([start, len(chunk), crc, summary])
+        return entries
+
+    def _set_entries(self, stamp, entries):
+        self._stamp = stamp
+        self._entries = entries
+        self._by_id = {entry[3]["id"]: entry for entry in entries}
+        self._newest_first = sorted((entry[3] for entry in entries),
+                                    key=lambda session: (session["timestamp"], session["id"]), reverse=True)
+
+    def _load_sidecar(self):
+        if not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get("version") == self.INDEX_VERSION:
+                self._set_entries(index["stamp"], index["sessions"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Rebuilding chat history index {self.index_file}: {e}")
+
+    def _save_sidecar(self):
+        index = {"version": self.INDEX_VERSION, "stamp": self._stamp, "sessions": self._entries}
+        temp_file = self.index_file + ".tmp"
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(index, ensure_ascii=False))  # dumps uses the C encoder, dump does not
+            os.replace(temp_file, self.index_file)
+        except OSError as e:
+            print(f"Could not write chat history index {self.index_file}: {e}")
+
+    # READS
+    # ///////////////////////////////////////////////////////////////
+    def sessions(self):
+        """Summaries in archive order"""
+        self.refresh()
+        return [entry[3] for entry in self._entries]
+
+    def list_sessions(self, limit=None, after=None):
+        """Summaries newest first, `limit` at a time after the summary `after`"""
+        self.refresh()
+        sessions = self._newest_first
+        if after is not None:
+            sessions = [session for session in sessions
+                        if (session["timestamp"], session["id"]) < (after["timestamp"], after["id"])]
+        return sessions[:limit] if limit is not None else sessions
+
+    def get_session(self, session_id):
+        """Summary of one session, or None"""
+        self.refresh()
+        entry = self._by_id.get(session_id)
+        return entry[3] if entry else None
+
+    def load_record(self, session_id):
+        """The archived session object, parsed from its byte range alone; None if unknown"""
+        self.refresh()
+        entry = self._by_id.get(session_id)
+        if entry is None:
+            return None
+        with open(self.json_file, 'rb') as f:
+            f.seek(entry[0])
+            return json.loads(f.read(entry[1]))
+
+    def load_messages(self, session_id):
+        record = self.load_record(session_id)
+        return [message for message in record.get("messages") or [] if isinstance(message, dict)] if record else []
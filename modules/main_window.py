@@ -0,0 +1,1608 @@
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+import traceback
+
+# Voice and image libraries (speech_recognition, PIL; Whisper lives in its worker
+# process) are imported on first use, see benchmarks/import_report.py
+
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from .api_config import APIConfig
+from .app_functions import AppFunctions
+from .app_settings import Settings
+from .audio_capture import AudioCapture
+from .chat_history import ChatHistoryManager
+from .chat_transcript import TranscriptEntry
+from .dify_client import DifyAPIClient, EnhancedAIResponseThread
+from .history_model import HistoryListModel
+from .http_session import HTTPSessionPool
+from .speech_service import SpeechRecognitionService
+from .startup_timeline import StartupTimeline
+from .stream_renderer import StreamRenderer
+from .ui_functions import UIFunctions
+from .ui_main import Ui_MainWindow
+from .upload_cache import UploadCache
+
+# Set as global widgets
+# ///////////////////////////////////////////////////////////////
+widgets = None
+
+
+class TypingIndicator(QObject):
+    """Typing indicator row in the chat transcript"""
+
+    def __init__(self, transcript, parent=None):
+        super().__init__(parent)
+        self.message = transcript.addTyping("Typing...")
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.updateDots)
+        self.dots = 0
+
+    def start(self):
+        self.timer.start(500)
+
+    def stop(self):
+        self.timer.stop()
+
+    def remove(self):
+        self.stop()
+        self.message.remove()
+
+    def updateDots(self):
+        self.dots = (self.dots + 1) % 4
+        text = "Typing" + "." * self.dots
+        self.message.setText(text)
+
+
+def process_uploaded_image(image_path):
+    """Process uploaded image"""
+    try:
+        from PIL import Image
+        with Image.open(image_path) as img:
+            print(f"Image info: {img.size}, {img.mode}")
+
+            if img.size[0] > 1024 or img.size[1] > 1024:
+                img.thumbnail((1024, 1024), Image.Resampling.LANCZOS)
+                compressed_path = image_path.replace('.', '_compressed.')
+                img.save(compressed_path, "JPEG", quality=85)
+                return compressed_path
+
+            return image_path
+
+    except Exception as e:
+        print(f"Image processing failed: {e}")
+        return image_path
+
+
+class MainWindow(QMainWindow):
+    voice_segment_ready = Signal(object)  # AudioData of a segment cut while recording
+
+    def __init__(self, started=None):
+        QMainWindow.__init__(self)
+        # `started`: perf_counter() when the process began, origin of the startup timeline
+        self.timeline = StartupTimeline(started, self)
+        self.timeline.mark("imports")
+
+        # Add client initialization
+        config = APIConfig.load_config()
+        api_key = config.get("dify_api_key", "")
+        base_url = config.get("dify_base_url", "https://api.dify.ai/v1")
+        self.http_pool = HTTPSessionPool.configure(config)
+        UploadCache.configure(config)
+        self.client = DifyAPIClient(api_key, base_url, user="travelmind_user", pool=self.http_pool) if api_key else None
+        
+        # Initialize generated images list
+        self.generated_images = []
+
+        # SET AS GLOBAL WIDGETS
+        # ///////////////////////////////////////////////////////////////
+        self.ui = Ui_MainWindow()
+        self.ui.setupUi(self)
+        global widgets
+        widgets = self.ui
+        self.timeline.mark("ui built")
+
+        # AI chat related variables
+        self.chat_history = []
+        self.typing_indicator = None
+        self.ai_thread = None
+        self.current_ai_message = None
+        self.stream_renderer = None
+        self.cursor_timer = None
+
+        # Coalesce autoscroll requests to one per frame
+        self.scroll_timer = QTimer(self)
+        self.scroll_timer.setSingleShot(True)
+        self.scroll_timer.setInterval(16)
+        self.scroll_timer.timeout.connect(self.applyScrollToBottom)
+
+        # Session management for auto-save
+        self.current_session_id = None
+        self.dify_conversation_id = None
+        self.auto_save_enabled = True
+
+        # History manager
+        self.history_manager = ChatHistoryManager(config)
+        self.history_manager.saved.connect(self.onHistorySaved)
+
+        # New: voice and image related variables
+        self.voice_segments = {}  # request id -> recognized text, None while pending
+        self.voice_base_text = ""
+        self.voice_tail_pending = False  # the last stretch of a recording is not handed over yet
+        self.speech_service = SpeechRecognitionService.configure(config)
+        self.audio_capture = AudioCapture.instance()
+        self.is_voice_recording = False
+        self.current_image_path = None
+        self.current_file_paths = []  # Store multiple file paths
+        # USE CUSTOM TITLE BAR | USE AS "False" FOR MAC OR LINUX
+        # ///////////////////////////////////////////////////////////////
+        Settings.ENABLE_CUSTOM_TITLE_BAR = True
+
+        # APP NAME
+        # ///////////////////////////////////////////////////////////////
+        title = "TravelMind"
+        description = "TravelMind - AI Travel Assistant"
+        self.setWindowTitle(title)
+        widgets.titleRightInfo.setText(description)
+
+        # TOGGLE MENU
+        # ///////////////////////////////////////////////////////////////
+        widgets.toggleButton.clicked.connect(lambda: UIFunctions.toggleMenu(self, True))
+
+        # SET UI DEFINITIONS
+        # ///////////////////////////////////////////////////////////////
+        UIFunctions.uiDefinitions(self)
+
+        # BUTTONS CLICK
+        # ///////////////////////////////////////////////////////////////
+        widgets.btn_home.clicked.connect(self.buttonClick)
+        widgets.btn_ai_chat.clicked.connect(self.buttonClick)
+        widgets.btn_history.clicked.connect(self.buttonClick)
+        widgets.btn_theme.clicked.connect(self.buttonClick)
+        widgets.btn_exit.clicked.connect(self.buttonClick)
+
+        # Home page buttons
+        widgets.start_chat_button.clicked.connect(self.startChatFromHome)
+
+        # The AI chat and history pages are built and wired on first navigation (see showPage)
+
+        # SHOW APP
+        # ///////////////////////////////////////////////////////////////
+        self.show()
+        self.timeline.mark("shown")
+        self.timeline.watch(widgets.styleSheet)
+
+        # Warm up a keep-alive connection so the first message skips the TCP+TLS handshake
+        if api_key:
+            self.http_pool.prewarm(base_url)
+
+        # Open the microphone in the background once the window has painted; the speech
+        # worker is only started on first voice use (startVoiceRecording)
+        QTimer.singleShot(0, self.audio_capture.start)
+
+        # SET CUSTOM THEME
+        # ///////////////////////////////////////////////////////////////
+        if getattr(sys, "frozen", False):
+            absPath = os.path.dirname(os.path.abspath(sys.executable))
+        elif __file__:
+            absPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # modules/ -> app root
+        useCustomTheme = True
+        self.useCustomTheme = useCustomTheme
+        self.absPath = absPath
+        themeFile = os.path.join(absPath, "themes", "py_dracula_dark.qss")
+
+        # SET THEME AND HACKS
+        if useCustomTheme:
+            UIFunctions.theme(self, themeFile, True)
+            AppFunctions.setThemeHack(self)
+
+        # SET HOME PAGE AND SELECT MENU
+        # ///////////////////////////////////////////////////////////////
+        widgets.stackedWidget.setCurrentWidget(widgets.home)
+        widgets.btn_home.setStyleSheet(UIFunctions.selectMenu(widgets.btn_home.styleSheet()))
+
+        widgets.textEdit.setPlainText("")
+
+        # Store images generated during current conversation
+        # Store images generated during current conversation
+        self.download_dir = os.path.join(os.getcwd(), "downloads")
+        if not os.path.exists(self.download_dir):
+            os.makedirs(self.download_dir)
+            
+        self.generated_images = []  
+
+    def showPage(self, name):
+        """Switch the stacked widget to a page, building it on first use"""
+        page = self.ensurePage(name)
+        widgets.stackedWidget.setCurrentWidget(page)
+        return page
+
+    def ensurePage(self, name):
+        """Build a page and connect its widgets the first time it is needed"""
+        page = getattr(widgets, name)
+        if page is None:
+            page = widgets.ensurePage(name)
+            init = {"ai_chat": self.initChatPage, "history": self.initHistoryPage, "widgets": self.initWidgetsPage}.get(name)
+            if init:
+                init()
+            print(f"Page built: {name}")
+        return page
+
+    def initChatPage(self):
+        """Wire up the AI chat page"""
+        # File preview layout above the input box
+        self.filePreviewLayout = QHBoxLayout()
+        widgets.chat_input_layout.insertLayout(0, self.filePreviewLayout)
+        # Update UI texts to English
+        self.updateUITexts()
+
+        # AI chat function buttons
+        widgets.sendButton.clicked.connect(self.sendMessage)
+        widgets.clearChatButton.clicked.connect(self.clearChat)
+
+        # Input box enter to send
+        widgets.chatInputArea.installEventFilter(self)
+
+        # Quick suggestion buttons
+        for btn in widgets.suggestion_buttons:
+            btn.clicked.connect(lambda checked, button=btn: self.sendSuggestion(button.text()))
+
+        # Buttons painted inside the chat transcript
+        widgets.chatDisplayArea.saveImageRequested.connect(self.saveImage)
+        widgets.chatDisplayArea.openFileRequested.connect(self.openFile)
+
+        # New: setup voice and image functionality
+        self.setupSimpleVoiceAndImage()
+
+    def initHistoryPage(self):
+        """Wire up the history page; the list model follows saves from then on"""
+        widgets.loadChatButton.clicked.connect(self.loadSelectedChat)
+        widgets.deleteChatButton.clicked.connect(self.deleteSelectedChat)
+        widgets.clearHistoryButton.clicked.connect(self.clearAllHistory)
+
+        # Summaries are read a page at a time as the list scrolls
+        self.history_model = HistoryListModel(self.history_manager, self)
+        widgets.historyList.setModel(self.history_model)
+
+        # History list selection change
+        widgets.historyList.selectionModel().selectionChanged.connect(self.onHistorySelectionChanged)
+
+        # Search as you type, once typing pauses
+        self.history_search_timer = QTimer(self)
+        self.history_search_timer.setSingleShot(True)
+        self.history_search_timer.setInterval(150)
+        self.history_search_timer.timeout.connect(self.loadHistoryList)
+        widgets.historySearchEdit.textChanged.connect(self.history_search_timer.start)
+
+        self.setupHistoryListStyle()
+        self.loadHistoryList()
+
+    def initWidgetsPage(self):
+        """PyDracula demo widgets"""
+        widgets.tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        AppFunctions.setDemoWidgetsStyle(self)
+
+    def setupHistoryListStyle(self):
+        """Size the chat history buttons; their look comes from the theme (#historyList, #loadChatButton, ...)"""
+        buttons = [
+            widgets.loadChatButton, 
+            widgets.deleteChatButton, 
+            widgets.clearHistoryButton
+            ]
+        
+        for btn in buttons:
+            btn.setMinimumSize(140, 50)  # Increase button size
+            btn.setMaximumSize(180, 60)
+
+    def init_dify_integration(self):
+            """Initialize Dify integration"""
+            self.dify_conversation_id = None
+            config = APIConfig.load_config()
+            if not config.get("dify_api_key"):
+                QTimer.singleShot(2000, self.showFirstTimeSetup)
+
+    def setupSimpleVoiceAndImage(self):
+        """Set up simple voice and image functionality"""
+
+        # Add voice button
+        self.voiceButton = QPushButton()
+        self.voiceButton.setObjectName("voiceButton")
+        self.voiceButton.setMinimumSize(QSize(50, 80))
+        self.voiceButton.setMaximumSize(QSize(50, 80))
+        self.voiceButton.setCursor(QCursor(Qt.PointingHandCursor))
+        self.voiceButton.setText("🎤")
+        self.voiceButton.setToolTip("Hold to record")
+
+        # Voice button events
+        self.voiceButton.pressed.connect(self.startVoiceRecording)
+        self.voiceButton.released.connect(self.stopVoiceRecording)
+
+        # Speech recognition runs in the shared service; the button reflects its readiness
+        self.speech_service.state_changed.connect(self.updateVoiceButtonState)
+        self.speech_service.result_ready.connect(self.handleSpeechResult)
+        self.speech_service.error_occurred.connect(self.handleSpeechError)
+        self.voice_segment_ready.connect(self.transcribeVoiceAudio)
+        self.updateVoiceButtonState(self.speech_service.state)
+
+        # Add image button
+        self.imageButton = QPushButton()
+        self.imageButton.setObjectName("imageButton")
+        self.imageButton.setMinimumSize(QSize(50, 80))
+        self.imageButton.setMaximumSize(QSize(50, 80))
+        self.imageButton.setCursor(QCursor(Qt.PointingHandCursor))
+        self.imageButton.setText("📷")
+        self.imageButton.setToolTip("Upload image")
+        self.imageButton.clicked.connect(self.selectImage)
+
+        # Add button to existing input layout
+        widgets.input_horizontal_layout.insertWidget(1, self.voiceButton)
+        widgets.input_horizontal_layout.insertWidget(2, self.imageButton)
+
+        # Add image preview label
+        self.imagePreview = QLabel()
+        self.imagePreview.setObjectName("imagePreview")
+        self.imagePreview.setMaximumSize(QSize(100, 80))
+        self.imagePreview.setText("No image")
+        self.imagePreview.setAlignment(Qt.AlignCenter)
+        self.imagePreview.hide()
+
+        # Add image preview to chat input layout above
+        widgets.chat_input_layout.insertWidget(0, self.imagePreview)
+
+
+        self.fileButton = QPushButton()
+        self.fileButton.setObjectName("fileButton")
+        self.fileButton.setMinimumSize(QSize(50, 80))
+        self.fileButton.setMaximumSize(QSize(50, 80))
+        self.fileButton.setCursor(QCursor(Qt.PointingHandCursor))
+        self.fileButton.setText("📄📄📄📄")
+        self.fileButton.setToolTip("Upload files")
+        self.fileButton.clicked.connect(self.selectFiles)
+        
+        # Add button to input layout
+        widgets.input_horizontal_layout.insertWidget(3, self.fileButton)
+
+    def startVoiceRecording(self):
+        """Start voice recording"""
+        if self.is_voice_recording:
+            return
+
+        # First voice use starts the speech worker, so the model loads while the user talks
+        self.speech_service.warmUp()
+
+        # The microphone is already open: recording starts from the ring buffer, pre-roll included.
+        # Segments cut at pauses are transcribed while the user keeps talking.
+        try:
+            self.audio_capture.begin(on_segment=self.voice_segment_ready.emit)
+        except RuntimeError as e:
+            self.handleVoiceError(str(e))
+            return
+
+        self.voice_segments = {}
+        self.voice_base_text = widgets.chatInputArea.toPlainText()
+
+        print("🎤 Start recording...")
+        self.is_voice_recording = True
+
+        self.setVoiceButtonRecording(True)
+
+    def stopVoiceRecording(self):
+        """Stop voice recording"""
+        if not self.is_voice_recording:
+            return
+
+        print("⏹️ Stop recording...")
+        self.is_voice_recording = False
+
+        self.setVoiceButtonRecording(False)
+        self.updateVoiceButtonState(self.speech_service.state)
+
+        audio = self.audio_capture.end()
+        if audio is not None:
+            print("🔄 Working...")
+            # After any segment the reader thread queued just before end(), so the tail is last
+            self.voice_tail_pending = True
+            QTimer.singleShot(0, lambda: self.transcribeVoiceTail(audio))
+        else:
+            # After any segment the reader thread queued just before end()
+            QTimer.singleShot(0, self.finishVoiceTranscript)
+
+    def setVoiceButtonRecording(self, recording):
+        """Switch the voice button between its idle and recording look ([recording="true"] in the themes)"""
+        self.voiceButton.setText("⏹️" if recording else "🎤")
+        self.voiceButton.setProperty("recording", recording)
+        # Dynamic properties are matched when a widget is polished, so re-polish just this button
+        style = self.voiceButton.style()
+        style.unpolish(self.voiceButton)
+        style.polish(self.voiceButton)
+
+    def updateVoiceButtonState(self, state):
+        """Show whether the speech model is still warming up"""
+        if self.is_voice_recording:
+            return
+        if state == SpeechRecognitionService.LOADING:
+            self.voiceButton.setText("⏳")
+            self.voiceButton.setToolTip("Speech model warming up... (recordings are queued)")
+        elif state == SpeechRecognitionService.FAILED:
+            self.voiceButton.setText("🎤")
+            if self.speech_service.online_fallback:
+                self.voiceButton.setToolTip("Hold to record (speech model unavailable, using online recognition)")
+            else:
+                self.voiceButton.setToolTip("Speech model unavailable")
+        else:
+            self.voiceButton.setText("🎤")
+            self.voiceButton.setToolTip("Hold to record")
+
+    def transcribeVoiceAudio(self, audio):
+        """Hand a recorded segment to the speech service"""
+        request_id = self.speech_service.transcribe(audio)
+        self.voice_segments[request_id] = None
+        if not self.speech_service.isReady():
+            print("⏳ Speech model still loading, request queued")
+
+    def transcribeVoiceTail(self, audio):
+        """Hand over the audio recorded after the last segment"""
+        self.voice_tail_pending = False
+        self.transcribeVoiceAudio(audio)
+
+    def handleSpeechResult(self, request_id, text):
+        if request_id not in self.voice_segments:
+            return
+        self.voice_segments[request_id] = text.strip() if text else ""
+        self.updateVoiceTranscript()
+        self.finishVoiceTranscript()
+
+    def handleSpeechError(self, request_id, error_msg):
+        if request_id not in self.voice_segments:
+            return
+        print(f"❌ Voice segment failed: {error_msg}")
+        self.voice_segments[request_id] = ""
+        self.finishVoiceTranscript()
+
+    def voiceTranscript(self):
+        """Recognized segments so far, in recording order"""
+        text = ""
+        for part in self.voice_segments.values():
+            if not part:
+                continue
+            # Whisper's Chinese output carries its own punctuation; only space-separate other scripts
+            if text and not (text[-1] > "\u2e7f" or part[0] > "\u2e7f"):
+                text += " "
+            text += part
+        return text
+
+    def updateVoiceTranscript(self):
+        """Stream the partial transcript into the input box"""
+        text = self.voiceTranscript()
+        if not text:
+            return
+        if self.voice_base_text.strip():
+            text = self.voice_base_text + " " + text
+        widgets.chatInputArea.setPlainText(text)
+        widgets.chatInputArea.moveCursor(QTextCursor.End)
+
+    def finishVoiceTranscript(self):
+        """Report the utterance once recording stopped and every segment is answered"""
+        if self.is_voice_recording or self.voice_tail_pending or None in self.voice_segments.values():
+            return
+        text = self.voiceTranscript()
+        self.voice_segments = {}
+        if text:
+            self.handleVoiceResult(text)
+        else:
+            self.handleVoiceError("No valid speech recognized")
+
+    def handleVoiceResult(self, text):
+        """Handle voice recognition result"""
+        print(f"✅ Voice recognition successful: {text}")
+
+    def handleVoiceError(self, error_msg):
+        """Handle voice recognition error"""
+        print(f"❌ Voice recognition failed: {error_msg}")
+
+    def selectImage(self):
+        """Select multiple image files"""
+        file_dialog = QFileDialog()
+        file_paths, _ = file_dialog.getOpenFileNames(
+            self,
+            "Select images",
+            "",
+            "Image files (*.png *.jpg *.jpeg *.gif *.bmp);;All files (*)"
+        )
+
+        if file_paths:
+            self.current_file_paths.extend(file_paths)
+            self.updateFilePreviews()
+
+    
+    def selectFiles(self):
+        """Select multiple files (any type)"""
+        file_dialog = QFileDialog()
+        file_paths, _ = file_dialog.getOpenFileNames(
+            self,
+            "Select files",
+            "",
+            "All files (*);;Image files (*.png *.jpg *.jpeg *.gif);;Documents (*.pdf *.doc *.docx *.txt)"
+        )
+        
+        if file_paths:
+            self.current_file_paths.extend(file_paths)
+            self.updateFilePreviews()
+
+    def updateFilePreviews(self):
+        """Update file preview area"""
+        # Clear existing previews
+        self.clearFilePreviews()
+        
+        # Add new file previews
+        for file_path in self.current_file_paths:
+            self.addFilePreview(file_path)
+
+    def clearFilePreviews(self):
+        """Clear all file previews"""
+        while self.filePreviewLayout.count():
+            item = self.filePreviewLayout.takeAt(0)
+            widget = item.widget()
+            if widget:
+                widget.deleteLater()
+
+    def addFilePreview(self, file_path):
+        """Add file preview"""
+        try:
+            filename = os.path.basename(file_path)
+            
+            # Create preview container (styled by the #filePreview* theme selectors)
+            container = QWidget()
+            container.setObjectName("filePreview")
+            container.setMaximumSize(100, 100)
+            layout = QVBoxLayout(container)
+            layout.setContentsMargins(2, 2, 2, 2)
+            
+            # Display different previews based on file type
+            if self.client.is_image(file_path):
+                # Image preview
+                pixmap = QPixmap(file_path)
+                if not pixmap.isNull():
+                    scaled_pixmap = pixmap.scaled(80, 80, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    preview = QLabel()
+                    preview.setPixmap(scaled_pixmap)
+                    layout.addWidget(preview)
+            else:
+                # File icon preview
+                icon = QLabel("📄📄")
+                icon.setObjectName("filePreviewIcon")
+                icon.setAlignment(Qt.AlignCenter)
+                layout.addWidget(icon)
+                
+            # File name label
+            name_label = QLabel(filename)
+            name_label.setObjectName("filePreviewName")
+            name_label.setAlignment(Qt.AlignCenter)
+            name_label.setWordWrap(True)
+            layout.addWidget(name_label)
+            
+            # Delete button
+            delete_btn = QPushButton("×")
+            delete_btn.setObjectName("filePreviewRemove")
+            delete_btn.setFixedSize(20, 20)
+            delete_btn.clicked.connect(lambda: self.removeFile(file_path))
+            
+            # Add to preview layout
+            self.filePreviewLayout.addWidget(container)
+            
+        except Exception as e:
+            print(f"File preview failed: {e}")
+
+    def removeFile(self, file_path):
+        """Remove file"""
+        if file_path in self.current_file_paths:
+            self.current_file_paths.remove(file_path)
+            self.updateFilePreviews()
+
+    def showImagePreview(self, image_path):
+        """Show image preview"""
+        try:
+            pixmap = QPixmap(image_path)
+            if not pixmap.isNull():
+                scaled_pixmap = pixmap.scaled(
+                    80, 60,
+                    Qt.KeepAspectRatio,
+                    Qt.SmoothTransformation
+                )
+                self.imagePreview.setPixmap(scaled_pixmap)
+                self.imagePreview.setText("")
+                self.imagePreview.show()
+
+                # Double click to clear
+                self.imagePreview.mouseDoubleClickEvent = lambda event: self.clearImagePreview()
+
+            else:
+                self.imagePreview.setText("Image loading failed")
+
+        except Exception as e:
+            print(f"Image preview failed: {e}")
+            self.imagePreview.setText("Preview failed")
+
+    def clearImagePreview(self):
+        """Clear image preview"""
+        self.current_image_path = None
+        self.imagePreview.clear()
+        self.imagePreview.setText("No image")
+        self.imagePreview.hide()
+        print("🗑️ Image cleared")
+
+    def addImageToChat(self, image_path):
+        """Add image preview to chat area (without showing URL information)"""
+        try:
+            # Painted by the transcript delegate; the pixmap is only loaded once the row is visible
+            if widgets.chatDisplayArea.transcript.addImage(image_path) is None:
+                print(f"Unable to load image: {image_path}")
+                return
+
+            self.scrollToBottom()
+
+        except Exception as e:
+            print(f"Failed to add image to chat: {str(e)}")
+    def addFileToChat(self, file_path):
+        """Add file preview to chat interface"""
+        try:
+            widgets.chatDisplayArea.transcript.addFile(file_path)
+            self.scrollToBottom()
+
+        except Exception as e:
+            print(f"Failed to add file to chat: {e}")
+    def openFile(self, file_path):
+        """Open downloaded file"""
+        try:
+            if sys.platform == "win32":
+                os.startfile(file_path)
+            elif sys.platform == "darwin":  # macOS
+                subprocess.call(["open", file_path])
+            else:  # Linux
+                subprocess.call(["xdg-open", file_path])
+        except Exception as e:
+            QMessageBox.warning(self, "Open failed", f"Unable to open file: {str(e)}")
+
+    def startChatFromHome(self):
+        """Jump from home page to chat page"""
+        self.showPage("ai_chat")
+        UIFunctions.resetStyle(self, "btn_ai_chat")
+        widgets.btn_ai_chat.setStyleSheet(UIFunctions.selectMenu(widgets.btn_ai_chat.styleSheet()))
+        widgets.chatInputArea.setFocus()
+        print("Started conversation from home page")
+
+    def updateUITexts(self):
+        """Update UI texts to English"""
+        widgets.chat_title.setText("🤖 TravelMind AI Assistant")
+        widgets.clearChatButton.setText("New Chat")
+        widgets.sendButton.setText("Send")
+        widgets.chatInputArea.setPlaceholderText(
+            "Please enter your travel question, e.g.: Recommend a 3-day Shanghai tour...")
+        
+        widgets.welcome_message.setText(
+            "👋 Welcome to TravelMind AI Assistant!\n\n"
+            "I can help you plan travel routes, recommend attractions, check weather information, and more.\n"
+            "Please enter your question below to start a conversation.")
+        suggestions = ["Shanghai 3-day tour", "Xiamen food guide", "Beijing family trip", "Chengdu weekend tour"]
+        for i, btn in enumerate(widgets.suggestion_buttons):
+            if i < len(suggestions):
+                btn.setText(suggestions[i])
+
+    def startNewChat(self):
+        """Start a new chat session"""
+        if self.chat_history and self.auto_save_enabled:
+            self.current_session_id = self.history_manager.save_or_update_chat(
+                self.chat_history, self.current_session_id
+            )
+
+        self.chat_history = []
+        self.current_session_id = None
+        self.clearChatUI()
+
+    def autoSaveCurrentChat(self):
+        """Automatically save/update current chat session"""
+        if self.chat_history and self.auto_save_enabled:
+            self.current_session_id = self.history_manager.save_or_update_chat(
+                self.chat_history, self.current_session_id
+            )
+
+    def loadHistoryList(self):
+        """Reload the history list, filtered by the search box"""
+        if widgets.history is None:
+            return  # filled when the history page is first shown
+        self.history_model.setFilter(widgets.historySearchEdit.text())
+        self.onHistorySelectionChanged()
+
+    def onHistorySaved(self, changes):
+        """Update the rows of the chats the history writer just wrote"""
+        if widgets.history is None:
+            return
+        self.history_model.applyChanges(changes)
+        self.onHistorySelectionChanged()
+
+    def selectedHistorySession(self):
+        """Summary of the selected history row, or None"""
+        rows = widgets.historyList.selectionModel().selectedRows()
+        return self.history_model.sessionAt(rows[0].row()) if rows else None
+
+    def onHistorySelectionChanged(self):
+        """Handle history list selection change"""
+        has_selection = self.selectedHistorySession() is not None
+
+        widgets.loadChatButton.setEnabled(has_selection)
+        widgets.deleteChatButton.setEnabled(has_selection)
+
+    def loadSelectedChat(self):
+        """Load selected chat history to AI chat page"""
+        chat_data = self.selectedHistorySession()
+        if chat_data is None:
+            return
+
+        # Auto save current chat (if any)
+        if self.chat_history and self.auto_save_enabled:
+            self.autoSaveCurrentChat()
+
+        self.ensurePage("ai_chat")
+
+        # Load selected chat history
+        self.chat_history = self.history_manager.load_chat(chat_data['id'])
+        self.current_session_id = chat_data['id']
+
+        # Clear chat interface
+        self.clearChatUI()
+        
+        # Build all rows first and insert them into the transcript in one go;
+        # the view only lays out and paints what is on screen
+        entries = []
+        for message in self.chat_history:
+            is_user = message['role'] == 'user'
+            content = message['content']
+            
+            # Display message content
+            entries.append(TranscriptEntry.message(content, is_user))
+            # If there's image info, display images
+            if not is_user and "images" in message:
+                for image_filename in message["images"]:
+                    image_path = os.path.join(self.download_dir, image_filename)
+                    if os.path.exists(image_path):
+                        entries.append(TranscriptEntry.image(image_path))
+            # If there's file info, display files
+            if "file_info" in message:
+                files_str = ", ".join(message["file_info"])
+                if is_user:
+                    file_message = f"📎📎 Uploaded files: {files_str}"
+                else:
+                    file_message = f"📎📎 Contains files: {files_str}"
+                
+                entries.append(TranscriptEntry.note(file_message, "attachment"))
+            
+            # If there are AI returned files, display files
+            if "files" in message:
+                for file_info in message["files"]:
+                    file_name = file_info.get("name", "unknown")
+                    
+                    # Create file placeholder
+                    entries.append(TranscriptEntry.note(f"📄 {file_name} (Downloaded)", "download"))
+
+        if entries:
+            self.hideWelcomeMessage()
+            widgets.chatDisplayArea.transcript.appendEntries(entries)
+            self.scrollToBottom()
+
+        # Switch to chat page
+        self.showPage("ai_chat")
+        UIFunctions.resetStyle(self, "btn_ai_chat")
+        widgets.btn_ai_chat.setStyleSheet(UIFunctions.selectMenu(widgets.btn_ai_chat.styleSheet()))
+
+    def deleteSelectedChat(self):
+        """Delete the selected chat from history"""
+        chat_data = self.selectedHistorySession()
+        if chat_data is None:
+            return
+
+        reply = QMessageBox.question(
+            self,
+            "Delete Chat",
+            "Are you sure you want to delete this chat?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+
+        if reply == QMessageBox.Yes:
+            if self.current_session_id == chat_data['id']:
+                self.current_session_id = None
+
+            self.history_manager.delete_chat(chat_data['id'])
+            self.history_model.removeSession(chat_data['id'])
+            self.onHistorySelectionChanged()
+
+    def clearAllHistory(self):
+        """Clear all chat history"""
+        reply = QMessageBox.question(
+            self,
+            "Clear All History",
+            "Are you sure you want to delete all chat history? This action cannot be undone.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+
+        if reply == QMessageBox.Yes:
+            self.history_manager.clear_all_history()
+            self.current_session_id = None
+            self.loadHistoryList()
+
+    def eventFilter(self, obj, event):
+        """Event filter to handle enter key in input box"""
+        if obj == widgets.chatInputArea and event.type() == QEvent.KeyPress:
+            if event.key() == Qt.Key_Return and not (event.modifiers() & Qt.ShiftModifier):
+                self.sendMessage()
+                return True
+            elif event.key() == Qt.Key_Return and (event.modifiers() & Qt.ShiftModifier):
+                return False
+        return super().eventFilter(obj, event)
+
+    def addChatMessage(self, message, is_user=True, streaming=False):
+        """Add chat message to interface"""
+        self.hideWelcomeMessage()
+
+        # Returns a row handle; streaming text is appended to the row in place
+        chat_message = widgets.chatDisplayArea.transcript.addMessage("" if streaming else message, is_user=is_user)
+
+        self.scrollToBottom()
+
+        return chat_message
+
+    def hideWelcomeMessage(self):
+        try:
+            if hasattr(widgets, 'welcome_message') and widgets.welcome_message:
+                widgets.welcome_message.hide()
+                self.welcome_shown = True
+        except RuntimeError:
+            pass
+    def scrollToBottom(self):
+        """Scroll chat area to bottom, at most once per frame"""
+        if not self.scroll_timer.isActive():
+            self.scroll_timer.start()
+
+    def applyScrollToBottom(self):
+        scrollbar = widgets.chatDisplayArea.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+    def showTypingIndicator(self):
+        """Show typing indicator"""
+        if self.typing_indicator is None:
+            self.typing_indicator = TypingIndicator(widgets.chatDisplayArea.transcript, self)
+
+        self.typing_indicator.start()
+        self.scrollToBottom()
+    def hideTypingIndicator(self):
+        """Hide typing indicator"""
+        if self.typing_indicator:
+            self.typing_indicator.remove()
+            self.typing_indicator.deleteLater()
+            self.typing_indicator = None
+    def sendMessage(self):
+        """Send message (supports text, images, and files)"""
+        message = widgets.chatInputArea.toPlainText().strip()
+    
+        # If no message and no files, don't send
+        if not message and not self.current_file_paths:
+            return
+    
+        # Get configuration
+        config = APIConfig.load_config()
+        api_key = config.get("dify_api_key", "")
+    
+        # Clear input box and file preview
+        widgets.chatInputArea.clear()
+        file_paths = self.current_file_paths.copy()  # Use copy to avoid modification in subsequent operations
+        self.current_file_paths = []
+        self.clearFilePreviews()
+    
+        # Disable send button
+        widgets.sendButton.setEnabled(False)
+        widgets.sendButton.setText("Sending...")
+    
+        # Build user message content (including all file info)
+        file_messages = []
+        combined_message = message
+    
+        # Process all files (images and non-images)
+        for file_path in file_paths:
+            # Display files in chat interface
+            if self.client.is_image(file_path):
+                self.addImageToChat(file_path)
+                file_message = f"[Image: {os.path.basename(file_path)}]"
+            else:
+                self.addFileToChat(file_path) # Add file preview method
+                file_message = f"[File: {os.path.basename(file_path)}]"
+        
+            file_messages.append(file_message)
+    
+        # If there's file info, add to message
+        if file_messages:
+            files_str = "\n".join(file_messages)
+            if message:
+                combined_message = f"{message}\n{files_str}"
+            else:
+                combined_message = files_str
+                message = "Please analyze these files" if len(file_messages) > 1 else "Please analyze this file"
+    
+        # Add user message to chat history
+        self.chat_history.append({
+        "role": "user",
+        "content": combined_message,
+        # Save file path info for loading in history
+        "file_paths": file_paths if file_paths else None
+        })
+    
+        # Display user message in chat interface
+        self.addChatMessage(combined_message, is_user=True)
+    
+        # Create AI message for streaming display
+        self.current_ai_message = self.addChatMessage("", is_user=False, streaming=True)
+        
+        # Start cursor blinking
+        self.startCursorBlink()
+        
+        # Create and start AI response thread
+        self.ai_thread = EnhancedAIResponseThread(
+            message,  # Original text message
+            api_key if api_key else None,
+            file_paths=file_paths,
+            conversation_id=getattr(self, 'dify_conversation_id', None),
+            stream=config.get("stream_enabled", True),
+            base_url=config.get("dify_base_url", "https://api.dify.ai/v1")
+        )
+
+        # Pull streamed text into the message once per frame (optional typewriter effect)
+        self.stopStreamRenderer()
+        self.stream_renderer = StreamRenderer(
+            self.current_ai_message,
+            self.ai_thread.stream_buffer,
+            typing_speed=config.get("typing_speed", 0.03),
+            parent=self
+        )
+        self.stream_renderer.finished.connect(self.stream_renderer.deleteLater)
+        self.stream_renderer.start()
+        
+        # Connect signals
+        self.ai_thread.response_complete.connect(self.handleDifyResponseComplete)
+        self.ai_thread.error_occurred.connect(self.handleAPIError)
+        self.ai_thread.file_received.connect(self.handleFileReceived)
+        self.ai_thread.upload_progress.connect(self.showUploadProgress)
+        
+        self.ai_thread.start()
+
+    def showUploadProgress(self, current, total):
+        """Show file upload progress"""
+        if total > 0:
+            percent = int(current * 100 / total)
+            widgets.sendButton.setText(f"Uploading... {percent}%")
+            if current >= total:
+                widgets.sendButton.setText("Sending...")
+    
+    def handleFileReceived(self, file_info):
+        """Handle received files"""
+        try:
+            file_name = file_info.get("name", "unknown_file")
+            file_url = file_info.get("url", "")
+            file_type = file_info.get("type", "file")
+            
+            if not file_url:
+                print("Invalid file URL")
+                return
+                
+            # Create download directory
+            download_dir = os.path.join(os.getcwd(), "downloads")
+            if not os.path.exists(download_dir):
+                os.makedirs(download_dir)
+                
+            # Download file
+            file_path = os.path.join(download_dir, file_name)
+            # Closing the response returns its connection to the shared pool, even on failure
+            with self.http_pool.get(file_url, stream=True) as response:
+                status_code = response.status_code
+                if status_code == 200:
+                    with open(file_path, "wb") as f:
+                        for chunk in response.iter_content(chunk_size=8192):
+                            if chunk:
+                                f.write(chunk)
+
+            if status_code == 200:
+                print(f"File download successful: {file_path}")
+                
+                # Display file in chat interface
+                if file_type == "image":
+                    self.addImageToChat(file_path)
+                else:
+                    self.addFileToChat(file_path)
+                    
+                # Add to chat history
+                if self.current_ai_message:
+                    self.chat_history[-1]["files"] = self.chat_history[-1].get("files", []) + [file_info]
+                    
+            else:
+                print(f"File download failed: {status_code}")
+                
+        except Exception as e:
+            print(f"File processing failed: {e}")
+
+    def stopStreamRenderer(self):
+        """Stop pulling streamed text into the current AI message"""
+        if self.stream_renderer:
+            self.stream_renderer.stop()
+            self.stream_renderer.deleteLater()
+            self.stream_renderer = None
+
+    def remove_image_urls(self, content, image_urls):
+        """Completely remove all image-related HTML tags and URL fragments"""
+        if not content:
+            return content
+        
+        clean_content = content
+    
+        # Step 1: Remove all HTML image tags
+        clean_content = re.sub(r'<img[^>]*>', '', clean_content)
+    
+        # Step 2: Remove all image URLs (including partial and incomplete URLs)
+        for url in image_urls:
+            # Remove complete URL
+            clean_content = clean_content.replace(url, '')
+        
+            # Remove URL fragments (for error formats in screenshots)
+            base_url = url.split("?")[0].split("%")[0]
+            if base_url and base_url in clean_content:
+                clean_content = clean_content.replace(base_url, '')
+    
+        # Step 3: Clean special error formats
+        patterns_to_remove = [
+        r'%!F$MISSING$', 
+        r'%!s$MISSING$', 
+        r'string=',
+        r'&&', 
+        r'\?\s*$',
+        r'<img[^>]*'
+        ]
+    
+        for pattern in patterns_to_remove:
+            clean_content = re.sub(pattern, '', clean_content)
+    
+        return clean_content.strip()
+
+    def handleDifyResponseComplete(self, conversation_id, full_text=None):
+        """Handle Dify response completion"""
+        self.stopCursorBlink()
+        
+        # Update session ID
+        self.dify_conversation_id = conversation_id or self.dify_conversation_id
+        
+        # Save to chat history
+        if self.current_ai_message:
+            # Use the full network response; the on-screen typewriter may still be catching up
+            original_content = full_text if full_text is not None else self.current_ai_message.current_text
+            
+            try:
+                # Extract image URLs
+                image_urls = self.client.extract_image_urls(original_content) if self.client else []
+                print("Extracted image URLs:")
+                for i, url in enumerate(image_urls):
+                    print(f"{i+1}. {url}")
+                # Download images
+                if image_urls:
+                    self.download_images(image_urls)
+                
+                # Create clean text without image URLs
+                clean_content = self.remove_image_urls(original_content, image_urls) if original_content else ""
+                
+                # If content is empty but images were generated, use default text
+                if not clean_content.strip() and image_urls:
+                    clean_content = "Generated travel images"
+                
+                # Update message content once the renderer has revealed the streamed text
+                self.finishStreamRenderer(clean_content)
+                
+                # Save to chat history
+                self.chat_history.append({
+                    "role": "assistant",
+                    "content": clean_content,
+                    "images": self.generated_images.copy()
+                })
+                
+            except Exception as e:
+                print(f"Error processing AI response: {str(e)}")
+                self.finishStreamRenderer("Error processing response, please check API configuration")
+                self.chat_history.append({
+                    "role": "assistant",
+                    "content": "Error processing response, please check API configuration"
+                })
+                
+            finally:
+                # Reset image list
+                self.generated_images.clear()
+        
+        # Save session
+        self.autoSaveCurrentChat()
+        
+        # Restore send button
+        widgets.sendButton.setEnabled(True)
+        widgets.sendButton.setText("Send")
+        self.ai_thread = None
+        self.current_ai_message = None
+
+    def process_response_content(self, original_content, image_urls):
+        """
+        Process response content:
+        1. Download and display images
+        2. Completely remove image URLs from text
+        """
+        # Download images
+        self.download_images(image_urls)
+    
+        # Create new cleaned content, only keep non-image parts
+        clean_content = original_content
+    
+        # Remove all image URLs
+        for url in image_urls:
+            # Remove Markdown format images
+            clean_content = re.sub(rf'!$$.*?$$${re.escape(url)}$', '', clean_content)
+            # Remove HTML img tags
+            clean_content = re.sub(rf'', '', clean_content)
+            # Remove bare URLs
+            clean_content = clean_content.replace(url, '')
+    
+        # Remove empty lines and extra spaces
+        clean_content = re.sub(r'\n\s*\n', '\n\n', clean_content).strip();
+    
+        # If content is completely empty, show default message
+        if not clean_content:
+            clean_content = "Generated related images" if image_urls else "No text content"
+    
+        return clean_content
+    
+    def remove_url_placeholders(self, message_text, image_urls):
+        """Remove URL placeholder text from message text"""
+        # Create URL regex patterns
+        url_patterns = [
+            r's\s*=\s*[\'\"](https?://[^\s\'\"]+)[\'\"]',      # s="URL" format
+            r'image_url\s*:\s*[\'\"](https?://[^\s\'\"]+)[\'\"]',  # image_url:"URL" format
+            r'url\s*:\s*(https?://\S+)',                     # url: URL format
+            r'a url\s*：\s*(https?://\S+)',                  # a url: format
+        ]
+        
+        clean_text = message_text
+        # Remove all URL patterns
+        for pattern in url_patterns:
+            clean_text = re.sub(pattern, '', clean_text)
+        
+        # Remove code block comments (code snippets provided in example code)
+        code_blocks = re.findall(r'```python[\s\S]+?```', clean_text, re.DOTALL)
+        for code_block in code_blocks:
+            if "req.get" in code_block or "open(" in code_block:
+                clean_text = clean_text.replace(code_block, '')
+        
+        # If entire message is URL, remove completely
+        if clean_text.strip() in image_urls:
+            clean_text = "Generated images" if image_urls else ""
+        
+        # Update message display
+        self.current_ai_message.setText(clean_text.strip())
+    
+    def download_images(self, image_urls):
+        """More reliable image download method"""
+        if not image_urls:
+            return
+        
+        # Ensure download directory exists
+        download_dir = os.path.join("downloads", "images")
+        os.makedirs(download_dir, exist_ok=True)
+    
+        for i, url in enumerate(image_urls):
+            try:
+                # Clean special formats in URL
+                url = url.replace('%!F(MISSING)', '/').replace('%!F', '/')
+            
+                # Get filename
+                filename = os.path.basename(url.split("?")[0])
+                if not filename:
+                    filename = f"image_{int(time.time())}_{i}.png"
+                
+                file_path = os.path.join(download_dir, filename)
+            
+                # Download image
+                with self.http_pool.get(url, stream=True) as response:
+                    status_code = response.status_code
+                    if status_code == 200:
+                        with open(file_path, "wb") as f:
+                            for chunk in response.iter_content(chunk_size=8192):
+                                f.write(chunk)
+
+                if status_code == 200:
+                    print(f"Image saved to: {file_path}")
+                    self.addImageToChat(file_path)
+                    self.generated_images.append(file_path)
+                else:
+                    print(f"Image download failed: {url} - Status code {status_code}")
+                
+            except Exception as e:
+                print(f"Image processing error: {str(e)}")
+
+    def finishStreamRenderer(self, final_text):
+        """Let the renderer flush what is left, then show final_text"""
+        if self.stream_renderer:
+            self.stream_renderer.finish(final_text)
+            self.stream_renderer = None
+        elif self.current_ai_message:
+            self.current_ai_message.setText(final_text)
+
+    def handleAPIError(self, error_message):
+        """Handle API errors"""
+        self.stopCursorBlink()
+        self.stopStreamRenderer()
+
+        # Display detailed error information
+        error_dialog = QMessageBox(self)
+        error_dialog.setIcon(QMessageBox.Critical)
+        error_dialog.setWindowTitle("API Error")
+        error_dialog.setText("Error processing API request")
+        error_dialog.setInformativeText(error_message)
+        error_dialog.setDetailedText("Detailed technical information:\n" + traceback.format_exc())
+        error_dialog.exec()
+        
+        # Restore UI state
+        if self.current_ai_message:
+            self.current_ai_message.setText(f"❌❌ API Error: {error_message}")
+
+        widgets.sendButton.setEnabled(True)
+        widgets.sendButton.setText("Send")
+
+        if self.ai_thread:
+            self.ai_thread.quit()
+            self.ai_thread.wait()
+            self.ai_thread = None
+
+        self.current_ai_message = None
+
+    def startCursorBlink(self):
+        """Start blinking cursor effect"""
+        self.cursor_visible = True
+        self.cursor_timer = QTimer()
+        self.cursor_timer.timeout.connect(self.toggleCursor)
+        self.cursor_timer.start(500)
+
+    def stopCursorBlink(self):
+        """Stop blinking cursor effect"""
+        if self.cursor_timer:
+            self.cursor_timer.stop()
+            self.cursor_timer = None
+        if self.current_ai_message:
+            self.current_ai_message.removeCursor()
+
+    def toggleCursor(self):
+        """Toggle cursor visibility"""
+        if self.current_ai_message:
+            if self.cursor_visible:
+                self.current_ai_message.removeCursor()
+            else:
+                self.current_ai_message.addCursor()
+            self.cursor_visible = not self.cursor_visible
+
+    def sendSuggestion(self, suggestion):
+        """Send quick suggestion"""
+        widgets.chatInputArea.setPlainText(suggestion)
+        self.sendMessage()
+
+    def clearChat(self):
+        """Clear conversation"""
+        self.dify_conversation_id = None
+        self.startNewChat()
+
+    def showFirstTimeSetup(self):
+        """First-time setup prompt"""
+        reply = QMessageBox.question(
+            self,
+            "Welcome to TravelMind",
+            "You haven't configured the Dify API key yet.\n\n"
+            "After configuration, you can use AI assistant features, otherwise test mode will be used.\n\n"
+            "Configure now?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+
+        if reply == QMessageBox.Yes:
+            self.showAPISettings()
+
+    def openImage(self, image_path):
+        """Open image with system default application"""
+        if not os.path.exists(image_path):
+            self.showWarning("Image file does not exist", f"Cannot find image file: {image_path}")
+            return
+            
+        try:
+            if sys.platform == "win32":
+                os.startfile(image_path)
+            elif sys.platform == "darwin":  # macOS
+                subprocess.call(["open", image_path])
+            else:  # Linux
+                subprocess.call(["xdg-open", image_path])
+        except Exception as e:
+            self.showWarning("Open failed", f"Unable to open image: {str(e)}")
+    
+    def saveImage(self, image_path):
+        """Save image to specified location"""
+        if not os.path.exists(image_path):
+            self.showWarning("File does not exist", "Cannot find image file")
+            return
+            
+        file_filter = "Image files (*.png *.jpg *.jpeg *.gif)"
+        save_path, _ = QFileDialog.getSaveFileName(
+            self, "Save image", "", file_filter
+        )
+        
+        if save_path:
+            try:
+                shutil.copy2(image_path, save_path)
+                self.showInfo("Save successful", "Image saved successfully")
+            except Exception as e:
+                self.showWarning("Save failed", f"Unable to save image: {str(e)}")
+
+    def showAPISettings(self):
+        """Show API settings dialog"""
+        dialog = APISettingsDialog(self)
+        if dialog.exec() == QDialog.Accepted:
+            self.dify_conversation_id = None
+
+    def clearChatUI(self):
+        """Clear only the chat UI, not the data"""
+        if self.ai_thread and self.ai_thread.isRunning():
+            self.ai_thread.cancel()
+            self.ai_thread.quit()
+            self.ai_thread.wait()
+            self.ai_thread = None
+
+        self.stopStreamRenderer()
+        self.stopCursorBlink()
+        self.current_ai_message = None
+        self.hideTypingIndicator()
+
+        widgets.chatDisplayArea.transcript.clear()
+
+        try:
+            if hasattr(widgets, 'welcome_message') and widgets.welcome_message:
+                widgets.welcome_message.show()
+                self.welcome_shown = False
+        except RuntimeError:
+            self.createWelcomeMessage()
+            self.welcome_shown = False
+
+        widgets.chatInputArea.clear()
+        widgets.sendButton.setEnabled(True)
+        widgets.sendButton.setText("Send")
+
+    def createWelcomeMessage(self):
+        """Create or recreate welcome message"""
+        widgets.welcome_message = QLabel()
+        widgets.welcome_message.setObjectName(u"welcome_message")
+        widgets.welcome_message.setAlignment(Qt.AlignCenter)
+        widgets.welcome_message.setWordWrap(True)
+        widgets.welcome_message.setText(
+            "👋 Welcome to TravelMind AI Assistant!\n\n"
+            "I can help you plan travel routes, recommend attractions, check weather information, and more.\n"
+            "Please enter your question below to start a conversation.")
+
+        widgets.chatDisplayArea.setPlaceholder(widgets.welcome_message)
+        widgets.welcome_message.show()
+
+    def buttonClick(self):
+        """Handle button clicks"""
+        btn = self.sender()
+        btnName = btn.objectName()
+
+        if btnName == "btn_home":
+            self.showPage("home")
+            UIFunctions.resetStyle(self, btnName)
+            btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet()))
+
+        if btnName == "btn_ai_chat":
+            self.showPage("ai_chat")
+            UIFunctions.resetStyle(self, btnName)
+            btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet()))
+
+        if btnName == "btn_history":
+            self.showPage("history")
+            UIFunctions.resetStyle(self, btnName)
+            btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet()))
+
+        if btnName == "btn_theme":
+            if self.useCustomTheme:
+                themeFile = os.path.abspath(os.path.join(self.absPath, "themes", "py_dracula_light.qss"))
+                UIFunctions.theme(self, themeFile, True)
+                AppFunctions.setThemeHack(self)
+                self.useCustomTheme = False
+            else:
+                themeFile = os.path.abspath(os.path.join(self.absPath, "themes", "py_dracula_dark.qss"))
+                UIFunctions.theme(self, themeFile, True)
+                AppFunctions.setThemeHack(self)
+                self.useCustomTheme = True
+
+        if btnName == "btn_exit":
+            if self.chat_history and self.auto_save_enabled:
+                self.autoSaveCurrentChat()
+            print("Exit BTN clicked!")
+            QApplication.quit()
+            return
+
+        print(f'Button "{btnName}" pressed!')
+
+    def resizeEvent(self, event):
+        """Handle resize events"""
+        UIFunctions.resize_grips(self)
+
+    def mousePressEvent(self, event):
+        """Handle mouse press events"""
+        self.dragPos = event.globalPosition().toPoint()
+
+        if event.buttons() == Qt.LeftButton:
+            print('Mouse click: LEFT CLICK')
+        if event.buttons() == Qt.RightButton:
+            print('Mouse click: RIGHT CLICK')
+
+    def closeEvent(self, event):
+        """Handle application close event"""
+        if self.chat_history and self.auto_save_enabled:
+            self.autoSaveCurrentChat()
+        self.history_manager.close()  # blocks until pending history is on disk
+        self.speech_service.shutdown()
+        self.audio_capture.stop()
+        event.accept()
+
+
+class APISettingsDialog(QDialog):
+    """API settings dialog"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("API Settings")
+        self.setFixedSize(450, 350)
+        self.setupUI()
+        self.loadSettings()
+
+    def setupUI(self):
+        layout = QVBoxLayout(self)
+
+        dify_group = QGroupBox("Dify API Configuration")
+        dify_layout = QVBoxLayout(dify_group)
+
+        key_layout = QHBoxLayout()
+        key_layout.addWidget(QLabel("API Key:"))
+        self.api_key_edit = QLineEdit()
+        self.api_key_edit.setEchoMode(QLineEdit.Password)
+        self.api_key_edit.setPlaceholderText("Enter your Dify API key")
+        key_layout.addWidget(self.api_key_edit)
+        dify_layout.addLayout(key_layout)
+
+        show_key_btn = QPushButton("Show/Hide")
+        show_key_btn.clicked.connect(self.togglePasswordVisibility)
+        key_layout.addWidget(show_key_btn)
+
+        url_layout = QHBoxLayout()
+        url_layout.addWidget(QLabel("Base URL:"))
+        self.base_url_edit = QLineEdit()
+        self.base_url_edit.setPlaceholderText("https://api.dify.ai/v1")
+        url_layout.addWidget(self.base_url_edit)
+        dify_layout.addLayout(url_layout)
+
+        layout.addWidget(dify_group)
+
+        response_group = QGroupBox("Response Settings")
+        response_layout = QVBoxLayout(response_group)
+
+        self.stream_checkbox = QCheckBox("Enable streaming output")
+        response_layout.addWidget(self.stream_checkbox)
+
+        speed_layout = QHBoxLayout()
+        speed_layout.addWidget(QLabel("Typewriter effect:"))
+        self.speed_spinbox = QSpinBox()
+        self.speed_spinbox.setRange(0, 200)
+        self.speed_spinbox.setSuffix(" ms/char")
+        self.speed_spinbox.setSpecialValueText("Off (show text as it arrives)")
+        speed_layout.addWidget(self.speed_spinbox)
+        response_layout.addLayout(speed_layout)
+
+        layout.addWidget(response_group)
+
+        button_layout = QHBoxLayout()
+        self.test_button = QPushButton("Test Connection")
+        self.save_button = QPushButton("Save")
+        self.cancel_button = QPushButton("Cancel")
+
+        button_layout.addWidget(self.test_button)
+        button_layout.addStretch()
+        button_layout.addWidget(self.save_button)
+        button_layout.addWidget(self.cancel_button)
+
+        layout.addLayout(button_layout)
+
+        self.test_button.clicked.connect(self.testConnection)
+        self.save_button.clicked.connect(self.saveSettings)
+        self.cancel_button.clicked.connect(self.reject)
+
+    def togglePasswordVisibility(self):
+        """Toggle password visibility"""
+        if self.api_key_edit.echoMode() == QLineEdit.Password:
+            self.api_key_edit.setEchoMode(QLineEdit.Normal)
+        else:
+            self.api_key_edit.setEchoMode(QLineEdit.Password)
+
+    def loadSettings(self):
+        """Load settings"""
+        config = APIConfig.load_config()
+        self.api_key_edit.setText(config.get("dify_api_key", ""))
+        self.base_url_edit.setText(config.get("dify_base_url", "https://api.dify.ai/v1"))
+        self.stream_checkbox.setChecked(config.get("stream_enabled", True))
+        self.speed_spinbox.setValue(int(config.get("typing_speed", 0.03) * 1000))
+
+    def testConnection(self):
+        """Test API connection"""
+        api_key = self.api_key_edit.text().strip()
+        base_url = self.base_url_edit.text().strip() or "https://api.dify.ai/v1"
+
+        if not api_key:
+            QMessageBox.warning(self, "Error", "Please enter API key")
+            return
+
+        self.test_button.setEnabled(False)
+        self.test_button.setText("Testing...")
+
+        try:
+            client = DifyAPIClient(api_key, base_url)
+            # Use non-streaming request for testing
+            test_data = {
+                "inputs": {},
+                "query": "Hello",
+                "response_mode": "blocking",
+                "user": "test_user"
+            }
+            
+            response = client.pool.post(
+                f"{base_url}/chat-messages",
+                headers=client.headers,
+                json=test_data
+            )
+            
+            if response.status_code == 200:
+                QMessageBox.information(self, "Success", "API connection test successful!")
+            else:
+                error_msg = f"API return error ({response.status_code}): "
+                try:
+                    error_data = response.json()
+                    error_msg += error_data.get("message", "Unknown error")
+                    if "detail" in error_data:
+                        error_msg += f" - {error_data['detail']}"
+                except:
+                    error_msg += response.text[:200] + "..."
+                QMessageBox.critical(self, "Error", error_msg)
+                
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"API connection test failed:\n{str(e)}")
+        finally:
+            self.test_button.setEnabled(True)
+            self.test_button.setText("Test Connection")
+
+    def saveSettings(self):
+        config = APIConfig.load_config()
+        config.update({
+            "dify_api_key": self.api_key_edit.text().strip(),
+            "dify_base_url": self.base_url_edit.text().strip() or "https://api.dify.ai/v1",
+            "stream_enabled": self.stream_checkbox.isChecked(),
+            "typing_speed": self.speed_spinbox.value() / 1000.0
+        })
+
+        APIConfig.save_config(config)
+        QMessageBox.information(self, "Success", "Settings saved successfully!")
+        self.accept()
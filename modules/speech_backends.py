@@ -0,0 +1,100 @@
+"""Pluggable offline speech recognizers.
+
+Imported by the worker process (speech_worker.py) and the benchmark harness,
+so this module must not import Qt or anything from the modules package.
+Every backend takes 16 kHz float32 samples or an audio file path.
+"""
+import abc
+import importlib.util
+
+
+class SpeechBackend(abc.ABC):
+    """Base class for a local speech recognizer; subclasses implement load() and transcribe().
+
+    model_size: tiny / base / small / medium / large-v3 ...
+    language:   ISO code such as "zh", or None to auto-detect per request
+    compute_type: "fp32" or "int8" (CPU inference precision)
+    beam_size:  1 for greedy decoding, >1 for beam search
+    """
+
+    name = None
+    REQUIRES = ()  # top-level modules load() imports
+    COMPUTE_TYPES = ("fp32", "int8")
+
+    def __init__(self, model_size="base", language="zh", compute_type="fp32", beam_size=1, threads=0):
+        if compute_type not in self.COMPUTE_TYPES:
+            raise ValueError(f"{self.name} does not support compute type {compute_type!r}")
+        self.model_size = model_size
+        self.language = language or None
+        self.compute_type = compute_type
+        self.beam_size = max(1, int(beam_size))
+        self.threads = int(threads)
+        self.model = None
+
+    @classmethod
+    def missing_modules(cls):
+        """The modules in REQUIRES that are not installed"""
+        return [module for module in cls.REQUIRES if importlib.util.find_spec(module) is None]
+
+    @abc.abstractmethod
+    def load(self):
+        """Load the model; called once before the first transcribe()"""
+
+    @abc.abstractmethod
+    def transcribe(self, audio):
+        """Return the recognized text for samples or a file path"""
+
+    def describe(self):
+        decoding = "greedy" if self.beam_size == 1 else f"beam {self.beam_size}"
+        return f"{self.name} {self.model_size} {self.compute_type} {decoding} lang={self.language or 'auto'}"
+
+
+class WhisperBackend(SpeechBackend):
+    """openai-whisper on PyTorch; int8 uses dynamic quantization of the Linear layers"""
+
+    name = "whisper"
+    REQUIRES = ("torch", "whisper")
+
+    def load(self):
+        import torch
+        import whisper
+        if self.threads:
+            torch.set_num_threads(self.threads)
+        model = whisper.load_model(self.model_size, device="cpu")
+        if self.compute_type == "int8":
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.model = model
+
+    def transcribe(self, audio):
+        options = {"language": self.language, "fp16": False}
+        if self.beam_size > 1:
+            options.update(beam_size=self.beam_size, best_of=self.beam_size, temperature=0.0)
+        return self.model.transcribe(audio, **options)["text"]
+
+
+class FasterWhisperBackend(SpeechBackend):
+    """CTranslate2 Whisper (faster-whisper), natively int8 on CPU"""
+
+    name = "faster-whisper"
+    REQUIRES = ("faster_whisper",)
+    _COMPUTE_TYPES = {"fp32": "float32", "int8": "int8"}
+
+    def load(self):
+        from faster_whisper import WhisperModel
+        self.model = WhisperModel(self.model_size, device="cpu",
+                                  compute_type=self._COMPUTE_TYPES[self.compute_type], cpu_threads=self.threads)
+
+    def transcribe(self, audio):
+        segments, _ = self.model.transcribe(audio, language=self.language, beam_size=self.beam_size)
+        return "".join(segment.text for segment in segments)
+
+
+BACKENDS = {backend.name: backend for backend in (WhisperBackend, FasterWhisperBackend)}
+
+
+def create_backend(name="whisper", **options):
+    try:
+        backend = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown speech backend {name!r} (available: {', '.join(BACKENDS)})")
+    return backend(**options)
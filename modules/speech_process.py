@@ -0,0 +1,190 @@
+import itertools
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "speech_worker.py")
+WORKER_SWITCH = "--speech-worker"  # main.py hands argv to speech_worker.main() when it sees this
+
+
+def worker_command():
+    """argv that starts a worker: speech_worker.py under this interpreter, or the frozen app itself.
+
+    In a PyInstaller / cx_Freeze build sys.executable is the app and there is
+    no speech_worker.py on disk, so the app is started with WORKER_SWITCH.
+    """
+    if getattr(sys, "frozen", False):
+        return [sys.executable, WORKER_SWITCH]
+    return [sys.executable, WORKER_SCRIPT]
+
+
+class SpeechWorkerError(Exception):
+    pass
+
+
+class SpeechWorkerCrashed(SpeechWorkerError):
+    pass
+
+
+class SpeechWorkerProcess:
+    """Parent-side handle on one speech_worker.py subprocess.
+
+    start() launches the worker and blocks until its model is loaded. Audio is
+    passed through a shared memory block and only its name and length travel
+    over the pipe. If the process has died, the next request starts a fresh
+    one; a request that was in flight when it died raises SpeechWorkerCrashed.
+    """
+
+    def __init__(self, backend="whisper", model_size="base", language="zh", compute_type="fp32", beam_size=1, threads=0):
+        self.options = {
+            "backend": backend,
+            "model": model_size,
+            "language": language or "",
+            "compute-type": compute_type,
+            "beam-size": beam_size,
+            "threads": threads,
+        }
+        self.error = None
+        self._process = None
+        self._request_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """Launch the worker if needed; returns True once its model is ready"""
+        if self.is_running:
+            return True
+        self.error = None
+        args = worker_command()
+        for option, value in self.options.items():
+            args += [f"--{option}", str(value)]
+        try:
+            self._process = subprocess.Popen(
+                args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            )
+        except (OSError, ValueError) as e:
+            self._process = None
+            self.error = f"could not start speech worker: {e}"
+            return False
+        try:
+            message = self._readMessage()
+        except SpeechWorkerCrashed as e:
+            self.error = str(e)
+            return False
+        if message.get("event") != "ready":
+            self.error = message.get("error", "worker failed to start")
+            self.stop()
+            return False
+        return True
+
+    def stop(self):
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            if process.poll() is None:
+                process.stdin.write(json.dumps({"op": "quit"}) + "\n")
+                process.stdin.flush()
+            process.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+
+    def _readMessage(self):
+        """Next protocol message; stray output that is not one (a library's print) is passed on to the log"""
+        while True:
+            try:
+                line = self._process.stdout.readline()
+            except (OSError, ValueError) as e:
+                line = ""
+                print(f"Speech worker pipe failed: {e}")
+            if not line:
+                code = self._process.wait()
+                self._process = None
+                raise SpeechWorkerCrashed(f"speech worker exited with code {code}")
+            try:
+                message = json.loads(line)
+            except ValueError:
+                message = None
+            if isinstance(message, dict) and "event" in message:
+                return message
+            print(f"speech worker: {line.rstrip()}")
+
+    def _call(self, request):
+        with self._lock:
+            if not self.is_running and not self.start():
+                raise SpeechWorkerError(self.error)
+            request["id"] = next(self._request_ids)
+            try:
+                self._process.stdin.write(json.dumps(request) + "\n")
+                self._process.stdin.flush()
+            except OSError:
+                self._process.wait()
+                self._process = None
+                raise SpeechWorkerCrashed("speech worker is gone")
+            while True:
+                message = self._readMessage()
+                if message.get("id") != request["id"]:
+                    continue
+                if message["event"] == "error":
+                    raise SpeechWorkerError(message["error"])
+                return message["text"]
+
+    def transcribe(self, samples):
+        """Transcribe 16 kHz float32 samples"""
+        from multiprocessing import shared_memory
+        import numpy as np
+
+        samples = np.ascontiguousarray(samples, dtype=np.float32)
+        block = shared_memory.SharedMemory(create=True, size=max(1, samples.nbytes))
+        try:
+            np.ndarray(samples.shape, dtype=np.float32, buffer=block.buf)[:] = samples
+            return self._call({"op": "transcribe", "shm": block.name, "samples": len(samples)})
+        finally:
+            block.close()
+            block.unlink()
+
+    def transcribeFile(self, path):
+        """Transcribe an audio file the worker decodes itself"""
+        return self._call({"op": "transcribe_file", "path": os.path.abspath(path)})
+
+
+class SpeechWorkerPool:
+    """A few worker processes sharing a batch of audio files"""
+
+    def __init__(self, processes=2, **options):
+        self.workers = [SpeechWorkerProcess(**options) for _ in range(max(1, processes))]
+
+    def transcribeFiles(self, paths):
+        """Return [(path, text, error)] in input order; workers start in parallel on first use"""
+        idle = queue.Queue()
+        for worker in self.workers:
+            idle.put(worker)
+
+        def run(path):
+            worker = idle.get()
+            try:
+                return path, worker.transcribeFile(path), None
+            except SpeechWorkerError as e:
+                return path, None, str(e)
+            finally:
+                idle.put(worker)
+
+        with ThreadPoolExecutor(max_workers=len(self.workers)) as executor:
+            return list(executor.map(run, paths))
+
+    def close(self):
+        for worker in self.workers:
+            worker.stop()
@@ -0,0 +1,205 @@
+import itertools
+import queue
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+from .speech_process import SpeechWorkerCrashed, SpeechWorkerPool, SpeechWorkerProcess
+
+
+class SpeechRecognitionService(QObject):
+    """Process-wide speech recognizer backed by one warm worker process.
+
+    The recognizer (a speech_backends backend, openai-whisper by default)
+    lives in a separate process (see speech_worker.py) so inference never
+    holds the GUI process's GIL. A background thread starts it on warmUp()
+    (the first voice use, or the first transcribe()) and then forwards
+    transcription requests from a queue. Callers
+    get a request id back from transcribe() and are answered through
+    result_ready / error_occurred; requests made while the model is still
+    loading are queued and answered once it is ready. A worker that crashes is
+    restarted and the interrupted request retried once. Google's online
+    recognizer is only used as a fallback when online_fallback is enabled.
+
+    Audio is trimmed to the spoken part and loudness-normalized first; clips
+    without speech are answered with empty text without reaching the model.
+    """
+
+    IDLE = "idle"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+    DEFAULT_BACKEND = "whisper"
+    DEFAULT_MODEL = "base"
+    DEFAULT_LANGUAGE = "zh"
+    DEFAULT_COMPUTE_TYPE = "fp32"
+    DEFAULT_BEAM_SIZE = 1
+
+    state_changed = Signal(str)
+    result_ready = Signal(int, str)  # request id, recognized text
+    error_occurred = Signal(int, str)  # request id, error message
+    files_transcribed = Signal(int, object)  # batch id, [(path, text, error)]
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, backend=DEFAULT_BACKEND, model_size=DEFAULT_MODEL, language=DEFAULT_LANGUAGE,
+                 compute_type=DEFAULT_COMPUTE_TYPE, beam_size=DEFAULT_BEAM_SIZE, online_fallback=False, parent=None):
+        super().__init__(parent)
+        self.model_name = model_size
+        self.language = language or None
+        self.online_fallback = online_fallback
+        self.backend_options = {
+            "backend": backend,
+            "model_size": model_size,
+            "language": self.language,
+            "compute_type": compute_type,
+            "beam_size": beam_size,
+        }
+        self._worker = SpeechWorkerProcess(**self.backend_options)
+        self.audio_seconds = 0.0  # running pre-processing totals for the stats log
+        self.trimmed_seconds = 0.0
+        self._state = self.IDLE
+        self._requests = queue.Queue()
+        self._request_ids = itertools.count(1)
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide service"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def configure(cls, config):
+        """(Re)create the shared service from the api_config.json speech settings"""
+        language = config.get("speech_language", cls.DEFAULT_LANGUAGE)
+        service = cls(
+            backend=config.get("speech_backend", cls.DEFAULT_BACKEND),
+            model_size=config.get("speech_model", cls.DEFAULT_MODEL),
+            language=None if language in ("", "auto", None) else language,
+            compute_type=config.get("speech_compute_type", cls.DEFAULT_COMPUTE_TYPE),
+            beam_size=int(config.get("speech_beam_size", cls.DEFAULT_BEAM_SIZE)),
+            online_fallback=bool(config.get("speech_online_fallback", False)),
+        )
+        with cls._instance_lock:
+            old, cls._instance = cls._instance, service
+        if old is not None:
+            old.shutdown()
+        return service
+
+    @property
+    def state(self):
+        return self._state
+
+    def isReady(self):
+        return self._state == self.READY
+
+    def _setState(self, state):
+        self._state = state
+        self.state_changed.emit(state)
+
+    def warmUp(self):
+        """Start loading the model in the background; no-op once started"""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._setState(self.LOADING)
+            self._thread = threading.Thread(target=self._run, name="speech-recognition", daemon=True)
+            self._thread.start()
+
+    def transcribe(self, audio):
+        """Queue speech_recognition AudioData for transcription and return the request id"""
+        request_id = next(self._request_ids)
+        self._requests.put((request_id, audio))
+        self.warmUp()
+        return request_id
+
+    def transcribeFiles(self, paths, processes=2):
+        """Transcribe audio files on a pool of worker processes; answered through files_transcribed"""
+        batch_id = next(self._request_ids)
+
+        def run():
+            pool = SpeechWorkerPool(processes=min(processes, len(paths)), **self.backend_options)
+            try:
+                self.files_transcribed.emit(batch_id, pool.transcribeFiles(paths))
+            finally:
+                pool.close()
+
+        threading.Thread(target=run, name="speech-batch", daemon=True).start()
+        return batch_id
+
+    def shutdown(self):
+        if self._thread is not None:
+            self._requests.put(None)
+
+    def _startWorker(self):
+        print(f"Loading speech model ({self.backend_options['backend']} {self.model_name})...")
+        try:
+            started = self._worker.start()
+        except Exception as e:  # never leave the state at LOADING with requests waiting
+            self._worker.error = str(e)
+            started = False
+        if started:
+            print("✅ Speech model loaded")
+            self._setState(self.READY)
+        else:
+            print(f"❌ Speech model loading failed: {self._worker.error}")
+            self._setState(self.FAILED)
+
+    def _run(self):
+        self._startWorker()
+        while True:
+            request = self._requests.get()
+            if request is None:
+                break
+            request_id, audio = request
+            try:
+                self.result_ready.emit(request_id, self._recognize(audio))
+            except Exception as e:
+                self.error_occurred.emit(request_id, f"Voice recognition failed: {str(e)}")
+        self._worker.stop()
+
+    def _recognize(self, audio):
+        from .audio_processing import audio_data_to_whisper, prepare_for_recognition
+
+        # 16 kHz float32 straight from the captured PCM: no temp WAV, no ffmpeg decode
+        samples, stats = prepare_for_recognition(audio_data_to_whisper(audio))
+        self.audio_seconds += stats.duration
+        self.trimmed_seconds += stats.trimmed if stats.has_speech else stats.duration
+        print(f"🎚️ {stats} | session: {self.trimmed_seconds:.1f} s of {self.audio_seconds:.1f} s skipped")
+        if samples is None:
+            return ""
+
+        try:
+            if self._state == self.READY:
+                try:
+                    return self._worker.transcribe(samples)
+                except SpeechWorkerCrashed as e:
+                    print(f"Speech worker crashed ({e}), restarting...")
+                    self._setState(self.LOADING)
+                    self._startWorker()
+                    if self._state != self.READY:
+                        raise
+                    return self._worker.transcribe(samples)
+            if not self.online_fallback:
+                raise Exception(f"Speech model unavailable: {self._worker.error}")
+            return self._recognizeOnline(audio)
+
+        except Exception as e:
+            if not self.online_fallback:
+                raise
+            print(f"Local recognition failed: {e}")
+            try:
+                return self._recognizeOnline(audio)
+            except Exception:
+                raise Exception("Both local and Google recognition failed")
+
+    def _recognizeOnline(self, audio):
+        import speech_recognition as sr
+        language = {"zh": "zh-CN", None: "en-US"}.get(self.language, self.language)
+        return sr.Recognizer().recognize_google(audio, language=language)
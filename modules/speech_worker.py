@@ -0,0 +1,98 @@
+"""Speech recognition worker process.
+
+Runs as a plain subprocess (python speech_worker.py --backend whisper --model base,
+or the frozen app started with --speech-worker, which calls main()) so inference never competes with the GUI process for its GIL. It deliberately
+imports nothing from the modules package, which would pull in Qt and the main
+window; the recognizer comes from the sibling speech_backends module.
+
+Protocol: one JSON object per line. Requests arrive on stdin, replies leave on
+stdout; anything Whisper or torch print is redirected to stderr.
+
+    -> {"op": "transcribe", "id": 1, "shm": "<name>", "samples": 80000}
+       16 kHz float32 samples in a multiprocessing.shared_memory block
+    -> {"op": "transcribe_file", "id": 2, "path": "trip.m4a"}
+    -> {"op": "quit"}
+    <- {"event": "ready"} | {"event": "failed", "error": "..."}   once, after loading
+    <- {"event": "result", "id": 1, "text": "..."}
+    <- {"event": "error", "id": 1, "error": "..."}
+"""
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from speech_backends import BACKENDS, create_backend
+
+
+def _attach(name):
+    from multiprocessing import shared_memory
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 registers attached blocks with this process's resource
+        # tracker, which would unlink the parent's block when the worker exits
+        from multiprocessing import resource_tracker
+        block = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(block._name, "shared_memory")
+        return block
+
+
+def _read_samples(name, count):
+    block = _attach(name)
+    try:
+        return np.ndarray((count,), dtype=np.float32, buffer=block.buf).copy()
+    finally:
+        block.close()
+
+
+def serve(backend, requests, reply):
+    try:
+        backend.load()
+    except Exception as e:
+        reply({"event": "failed", "error": str(e)})
+        return
+    reply({"event": "ready"})
+
+    for line in requests:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        if request.get("op") == "quit":
+            break
+        request_id = request.get("id")
+        try:
+            if request["op"] == "transcribe":
+                audio = _read_samples(request["shm"], request["samples"])
+            else:
+                audio = request["path"]
+            reply({"event": "result", "id": request_id, "text": backend.transcribe(audio)})
+        except Exception as e:
+            reply({"event": "error", "id": request_id, "error": str(e)})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", default="whisper", choices=sorted(BACKENDS))
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--language", default="zh", help="empty to auto-detect")
+    parser.add_argument("--compute-type", default="fp32", choices=("fp32", "int8"))
+    parser.add_argument("--beam-size", type=int, default=1, help="1 = greedy decoding")
+    parser.add_argument("--threads", type=int, default=0, help="CPU threads, 0 = library default")
+    args = parser.parse_args(argv)
+    backend = create_backend(args.backend, model_size=args.model, language=args.language,
+                             compute_type=args.compute_type, beam_size=args.beam_size, threads=args.threads)
+
+    # Keep stdout for the protocol only
+    protocol = sys.stdout
+    sys.stdout = sys.stderr
+
+    def reply(message):
+        protocol.write(json.dumps(message) + "\n")
+        protocol.flush()
+
+    serve(backend, sys.stdin, reply)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+import json
+import json.scanner
+import re
+from collections import namedtuple
+
+
+class SSEEvent(namedtuple("SSEEvent", "event data id retry")):
+    """A single dispatched server-sent event; data is kept as raw UTF-8 bytes"""
+
+    __slots__ = ()
+
+    def text(self):
+        return self.data.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.data)
+
+
+_new_event = tuple.__new__  # Skips the namedtuple __new__ wrapper on the hot path
+
+
+class SSEParser:
+    """Incremental text/event-stream parser fed with raw byte chunks.
+
+    Follows the WHATWG framing rules: lines end in CRLF, LF or CR, a blank line
+    dispatches the event, multiple data: lines are joined with LF, lines starting
+    with ':' are comments (keep-alive pings) and events without data are dropped.
+    Event boundaries are found with find() on the buffer and each event is
+    sliced out of it once; fields are matched as bytes and nothing is decoded.
+    feed() returns SSEEvent tuples, feed_data() just the data payloads for
+    callers that ignore the other fields.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._data = []
+        self._event = b""
+        self._last_id = None
+        self._retry = None
+        self._skip_lf = False  # Previous chunk ended in CR: an LF at the start belongs to it
+
+    def feed(self, chunk):
+        """Consume a chunk of bytes and return the list of events it completed"""
+        events = []
+        end = self._extend(chunk)
+        if end == -1:
+            return events
+
+        buffer = self._buffer
+        find = buffer.find
+        startswith = buffer.startswith
+        append = events.append
+        view = memoryview(buffer)
+        pos = 0
+        try:
+            while end != -1:
+                if startswith(b"data: ", pos) and find(b"\n", pos, end) == -1:
+                    # Hot path: Dify sends every event as a single data line
+                    append(_new_event(SSEEvent, ("message", bytes(view[pos + 6:end]), self._last_id, self._retry)))
+                else:
+                    events += self._parse_block(bytes(view[pos:end]))
+                pos = end + 2
+                end = find(b"\n\n", pos)
+        finally:
+            view.release()  # a bytearray with an exported view cannot be resized
+        del buffer[:pos]
+        return events
+
+    def feed_data(self, chunk):
+        """Like feed(), but return only the data payload (bytes) of each completed event"""
+        payloads = []
+        end = self._extend(chunk)
+        if end == -1:
+            return payloads
+
+        buffer = self._buffer
+        find = buffer.find
+        startswith = buffer.startswith
+        append = payloads.append
+        view = memoryview(buffer)
+        pos = 0
+        try:
+            while end != -1:
+                if startswith(b"data: ", pos) and find(b"\n", pos, end) == -1:
+                    append(bytes(view[pos + 6:end]))
+                else:
+                    payloads += [event[1] for event in self._parse_block(bytes(view[pos:end]))]
+                pos = end + 2
+                end = find(b"\n\n", pos)
+        finally:
+            view.release()
+        del buffer[:pos]
+        return payloads
+
+    def _extend(self, chunk):
+        """Buffer a chunk; return the position of the first blank line, or -1"""
+        if not chunk:
+            return -1
+        if self._skip_lf and chunk[:1] == b"\n":
+            chunk = chunk[1:]
+        self._skip_lf = False
+        buffer = self._buffer
+        # The buffered tail holds no blank line, but one may straddle the chunk boundary
+        search_from = max(0, len(buffer) - 1)
+        buffer += chunk
+
+        if b"\r" in chunk:
+            # Rare CR / CRLF line endings: normalise to LF, remembering a trailing CR
+            # whose LF may still be in flight
+            if buffer[-1] == 0x0D:
+                self._skip_lf = True
+            buffer[:] = buffer.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            search_from = 0
+        return buffer.find(b"\n\n", search_from)
+
+    def _parse_block(self, block):
+        """Events of one blank-line terminated block, line by line"""
+        events = []
+        for line in block.split(b"\n"):
+            if not line:
+                event = self._dispatch()
+                if event is not None:
+                    events.append(event)
+            elif line[0] != 0x3A:  # ':' comment / keep-alive
+                self._process_field(line)
+        event = self._dispatch()
+        if event is not None:
+            events.append(event)
+        return events
+
+    def _process_field(self, line):
+        field, colon, value = line.partition(b":")
+        if colon and value[:1] == b" ":
+            value = value[1:]
+
+        if field == b"data":
+            self._data.append(value)
+        elif field == b"event":
+            self._event = value
+        elif field == b"id":
+            if b"\0" not in value:
+                self._last_id = value.decode("utf-8", errors="replace")
+        elif field == b"retry":
+            if value.isdigit():
+                self._retry = int(value)
+
+    def _dispatch(self):
+        data_lines, self._data = self._data, []
+        event_name, self._event = self._event, b""
+        if not data_lines:
+            return None
+        data = data_lines[0] if len(data_lines) == 1 else b"\n".join(data_lines)
+        return SSEEvent(
+            event_name.decode("utf-8", errors="replace") if event_name else "message",
+            data,
+            self._last_id,
+            self._retry,
+        )
+
+    def iter_events(self, chunks):
+        """Yield events from an iterable of byte chunks (e.g. response.iter_content())"""
+        for chunk in chunks:
+            yield from self.feed(chunk)
+
+
+# Dify puts the event type inside the JSON payload, so sniff it from the raw bytes
+# and only pay for json.loads on events the caller actually handles
+_DIFY_EVENT_PREFIX = b'{"event": "'
+_DIFY_EVENT_RE = re.compile(rb'"event"\s*:\s*"([A-Za-z_]+)"')
+
+# The C scanner behind json.loads, called directly: payloads are single JSON
+# documents, so the whitespace handling json.loads wraps around it is skipped
+_scan_json = json.scanner.make_scanner(json.JSONDecoder())
+
+DIFY_CONSUMED_EVENTS = frozenset(("message", "message_end", "error"))
+
+
+def _decode_payload(data):
+    """The JSON document in a data payload; raises ValueError if it is not one"""
+    text = data.decode("utf-8")
+    try:
+        payload, end = _scan_json(text, 0)
+    except StopIteration:
+        return json.loads(text)  # leading whitespace, or invalid: json.loads says which
+    if end != len(text) and text[end:].strip():
+        raise ValueError(f"extra data at offset {end}")
+    return payload
+
+
+def iter_dify_events(chunks, consume=DIFY_CONSUMED_EVENTS):
+    """Yield (event_type, payload) for Dify chat-messages streaming events.
+
+    Events outside `consume` are skipped without JSON decoding unless they carry
+    a "files" list, as are payloads that are not JSON objects. Stops at a
+    `data: [DONE]` marker.
+    """
+    wanted = frozenset(name.encode("ascii") for name in consume)
+    prefix_len = len(_DIFY_EVENT_PREFIX)
+    parser = SSEParser()
+    for chunk in chunks:
+        for data in parser.feed_data(chunk):
+            if data.startswith(_DIFY_EVENT_PREFIX):
+                # Dify serializes "event" first with default json separators
+                event_type = data[prefix_len:data.find(b'"', prefix_len)]
+            elif data == b"[DONE]":
+                return
+            else:
+                match = _DIFY_EVENT_RE.search(data)
+                event_type = match.group(1) if match else None
+
+            if event_type not in wanted and b'"files"' not in data:
+                continue
+
+            try:
+                payload = _decode_payload(data)
+            except ValueError:
+                print(f"JSON parsing failed: {data[:200].decode('utf-8', errors='replace')}")
+                continue
+            if not isinstance(payload, dict):
+                continue
+            yield payload.get("event"), payload
@@ -0,0 +1,47 @@
+import time
+
+from PySide6.QtCore import QEvent, QObject, QTimer, Signal
+
+
+class StartupTimeline(QObject):
+    """Startup milestones in milliseconds since the process started importing.
+
+    mark() records a named step. watch(widget) adds "first paint" when that
+    widget first paints and "interactive" when the event loop is next idle
+    after it (the first moment input is handled), then prints the timeline.
+    """
+
+    finished = Signal()
+
+    def __init__(self, origin=None, parent=None):
+        super().__init__(parent)
+        self.origin = time.perf_counter() if origin is None else origin
+        self.marks = []
+        self._watched = None
+
+    def mark(self, name):
+        self.marks.append((name, (time.perf_counter() - self.origin) * 1000))
+
+    def elapsed(self, name):
+        """Milliseconds at the named milestone, or None if it has not happened"""
+        return next((ms for mark, ms in self.marks if mark == name), None)
+
+    def watch(self, widget):
+        self._watched = widget
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self._watched and event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            self._watched = None
+            self.mark("first paint")
+            QTimer.singleShot(0, self._interactive)
+        return False
+
+    def _interactive(self):
+        self.mark("interactive")
+        print(f"⏱️ Startup: {self.report()}")
+        self.finished.emit()
+
+    def report(self):
+        return " | ".join(f"{name} {ms:.0f} ms" for name, ms in self.marks)
@@ -0,0 +1,104 @@
+import threading
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class ChunkBuffer:
+    """Thread-safe text buffer the network thread writes into and the GUI drains"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._parts = []
+        self.closed = False
+
+    def put(self, text):
+        if text:
+            with self._lock:
+                self._parts.append(text)
+
+    def close(self):
+        """Mark the stream as finished; remaining text can still be drained"""
+        self.closed = True
+
+    def drain(self):
+        """Take everything written since the last drain"""
+        with self._lock:
+            if not self._parts:
+                return ""
+            parts, self._parts = self._parts, []
+        return "".join(parts)
+
+
+class StreamRenderer(QObject):
+    """Pull streamed text into a chat message at most once per display frame.
+
+    With typing_speed > 0 text is revealed at that many seconds per character
+    (typewriter effect). The animation is purely cosmetic: once the network side
+    has closed the buffer the backlog is flushed within CATCH_UP_MS.
+    """
+
+    FRAME_INTERVAL_MS = 16
+    CATCH_UP_MS = 1000
+
+    frame_rendered = Signal()
+    finished = Signal()
+
+    def __init__(self, message_widget, buffer, typing_speed=0.0, parent=None):
+        super().__init__(parent)
+        self.message_widget = message_widget
+        self.buffer = buffer
+        self.typing_speed = typing_speed
+        self.pending = ""
+        self.final_text = None
+        self._budget = 0.0
+        self._last_frame = None
+        self._catch_up_deadline = None
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.FRAME_INTERVAL_MS)
+        self.timer.timeout.connect(self.renderFrame)
+
+    def start(self):
+        self._last_frame = time.monotonic()
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def finish(self, final_text=None):
+        """Replace the message with final_text once everything has been revealed"""
+        self.final_text = final_text
+        self.buffer.close()
+
+    def renderFrame(self):
+        now = time.monotonic()
+        elapsed = now - self._last_frame
+        self._last_frame = now
+
+        self.pending += self.buffer.drain()
+        if self.pending:
+            if self.typing_speed > 0:
+                self._budget += elapsed / self.typing_speed
+                count = int(self._budget)
+                if self.buffer.closed:
+                    # Network is done: speed up so the tail never lags far behind
+                    if self._catch_up_deadline is None:
+                        self._catch_up_deadline = now + self.CATCH_UP_MS / 1000.0
+                    frames_left = max(1.0, (self._catch_up_deadline - now) * 1000.0 / self.FRAME_INTERVAL_MS)
+                    count = max(count, int(len(self.pending) / frames_left) + 1)
+                self._budget -= min(count, self._budget)
+                text, self.pending = self.pending[:count], self.pending[count:]
+            else:
+                text, self.pending = self.pending, ""
+
+            if text:
+                self.message_widget.appendText(text)
+                self.frame_rendered.emit()
+
+        if self.buffer.closed and not self.pending:
+            self.timer.stop()
+            if self.final_text is not None:
+                self.message_widget.setText(self.final_text)
+                self.frame_rendered.emit()
+            self.finished.emit()
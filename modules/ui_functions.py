@@ -14,16 +14,21 @@
 #
 # ///////////////////////////////////////////////////////////////
 
-# MAIN FILE
+# QT AND SHARED MODULES (never the main.py entry script)
 # ///////////////////////////////////////////////////////////////
-from main import *
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from . app_settings import Settings
+from widgets import CustomGrip
 
 # GLOBALS
 # ///////////////////////////////////////////////////////////////
 GLOBAL_STATE = False
 GLOBAL_TITLE_BAR = True
 
-class UIFunctions(MainWindow):
+class UIFunctions(QMainWindow):
     # MAXIMIZE/RESTORE
     # ///////////////////////////////////////////////////////////////
     def maximize_restore(self):
@@ -13,6 +13,7 @@ from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 
 from .resources_rc import *
+from .chat_transcript import ChatTranscriptView
 
 
 class Ui_MainWindow(object):
@@ -1139,7 +1140,6 @@ class Ui_MainWindow(object):
         self.verticalLayout_15.setContentsMargins(10, 10, 10, 10)
         self.stackedWidget = QStackedWidget(self.pagesContainer)
         self.stackedWidget.setObjectName(u"stackedWidget")
-        self.stackedWidget.setStyleSheet(u"background: transparent;")
 
     # Home page
         # self.home = QWidget()
@@ -1272,7 +1272,164 @@ class Ui_MainWindow(object):
 
         self.stackedWidget.addWidget(self.home)
 
-    # Add AI chat page
+    # Pages other than home are built on first navigation, see ensurePage()
+        self.ai_chat = None
+        self.history = None
+        self.widgets = None
+        self.new_page = None
+
+
+        self.verticalLayout_15.addWidget(self.stackedWidget)
+
+        self.horizontalLayout_4.addWidget(self.pagesContainer)
+
+        self.extraRightBox = QFrame(self.content)
+        self.extraRightBox.setObjectName(u"extraRightBox")
+        self.extraRightBox.setMinimumSize(QSize(0, 0))
+        self.extraRightBox.setMaximumSize(QSize(0, 16777215))
+        self.extraRightBox.setFrameShape(QFrame.NoFrame)
+        self.extraRightBox.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_7 = QVBoxLayout(self.extraRightBox)
+        self.verticalLayout_7.setSpacing(0)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.verticalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.themeSettingsTopDetail = QFrame(self.extraRightBox)
+        self.themeSettingsTopDetail.setObjectName(u"themeSettingsTopDetail")
+        self.themeSettingsTopDetail.setMaximumSize(QSize(16777215, 3))
+        self.themeSettingsTopDetail.setFrameShape(QFrame.NoFrame)
+        self.themeSettingsTopDetail.setFrameShadow(QFrame.Raised)
+
+        self.verticalLayout_7.addWidget(self.themeSettingsTopDetail)
+
+        self.contentSettings = QFrame(self.extraRightBox)
+        self.contentSettings.setObjectName(u"contentSettings")
+        self.contentSettings.setFrameShape(QFrame.NoFrame)
+        self.contentSettings.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_13 = QVBoxLayout(self.contentSettings)
+        self.verticalLayout_13.setSpacing(0)
+        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
+        self.verticalLayout_13.setContentsMargins(0, 0, 0, 0)
+        self.topMenus = QFrame(self.contentSettings)
+        self.topMenus.setObjectName(u"topMenus")
+        self.topMenus.setFrameShape(QFrame.NoFrame)
+        self.topMenus.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_14 = QVBoxLayout(self.topMenus)
+        self.verticalLayout_14.setSpacing(0)
+        self.verticalLayout_14.setObjectName(u"verticalLayout_14")
+        self.verticalLayout_14.setContentsMargins(0, 0, 0, 0)
+        self.btn_theme = QPushButton(self.topMenus)
+        self.btn_theme.setObjectName(u"btn_theme")
+        sizePolicy.setHeightForWidth(self.btn_theme.sizePolicy().hasHeightForWidth())
+        self.btn_theme.setSizePolicy(sizePolicy)
+        self.btn_theme.setMinimumSize(QSize(0, 45))
+        self.btn_theme.setFont(font)
+        self.btn_theme.setCursor(QCursor(Qt.PointingHandCursor))
+        self.btn_theme.setLayoutDirection(Qt.LeftToRight)
+        self.btn_theme.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-3d.png);")
+
+        self.verticalLayout_14.addWidget(self.btn_theme)
+
+        self.btn_print = QPushButton(self.topMenus)
+        self.btn_print.setObjectName(u"btn_print")
+        sizePolicy.setHeightForWidth(self.btn_print.sizePolicy().hasHeightForWidth())
+        self.btn_print.setSizePolicy(sizePolicy)
+        self.btn_print.setMinimumSize(QSize(0, 45))
+        self.btn_print.setFont(font)
+        self.btn_print.setCursor(QCursor(Qt.PointingHandCursor))
+        self.btn_print.setLayoutDirection(Qt.LeftToRight)
+        self.btn_print.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-print.png);")
+
+        self.verticalLayout_14.addWidget(self.btn_print)
+
+        self.btn_logout = QPushButton(self.topMenus)
+        self.btn_logout.setObjectName(u"btn_logout")
+        sizePolicy.setHeightForWidth(self.btn_logout.sizePolicy().hasHeightForWidth())
+        self.btn_logout.setSizePolicy(sizePolicy)
+        self.btn_logout.setMinimumSize(QSize(0, 45))
+        self.btn_logout.setFont(font)
+        self.btn_logout.setCursor(QCursor(Qt.PointingHandCursor))
+        self.btn_logout.setLayoutDirection(Qt.LeftToRight)
+        self.btn_logout.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-account-logout.png);")
+
+        self.verticalLayout_14.addWidget(self.btn_logout)
+
+        self.verticalLayout_13.addWidget(self.topMenus, 0, Qt.AlignTop)
+
+        self.verticalLayout_7.addWidget(self.contentSettings)
+
+        self.horizontalLayout_4.addWidget(self.extraRightBox)
+
+        self.verticalLayout_6.addWidget(self.content)
+
+        self.bottomBar = QFrame(self.contentBottom)
+        self.bottomBar.setObjectName(u"bottomBar")
+        self.bottomBar.setMinimumSize(QSize(0, 22))
+        self.bottomBar.setMaximumSize(QSize(16777215, 22))
+        self.bottomBar.setFrameShape(QFrame.NoFrame)
+        self.bottomBar.setFrameShadow(QFrame.Raised)
+        self.horizontalLayout_5 = QHBoxLayout(self.bottomBar)
+        self.horizontalLayout_5.setSpacing(0)
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.horizontalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.creditsLabel = QLabel(self.bottomBar)
+        self.creditsLabel.setObjectName(u"creditsLabel")
+        self.creditsLabel.setMaximumSize(QSize(16777215, 16))
+        font5 = QFont()
+        font5.setFamily(u"Segoe UI")
+        font5.setBold(False)
+        font5.setItalic(False)
+        self.creditsLabel.setFont(font5)
+        self.creditsLabel.setAlignment(Qt.AlignLeading | Qt.AlignLeft | Qt.AlignVCenter)
+
+        self.horizontalLayout_5.addWidget(self.creditsLabel)
+
+        self.version = QLabel(self.bottomBar)
+        self.version.setObjectName(u"version")
+        self.version.setAlignment(Qt.AlignRight | Qt.AlignTrailing | Qt.AlignVCenter)
+
+        self.horizontalLayout_5.addWidget(self.version)
+
+        self.frame_size_grip = QFrame(self.bottomBar)
+        self.frame_size_grip.setObjectName(u"frame_size_grip")
+        self.frame_size_grip.setMinimumSize(QSize(20, 0))
+        self.frame_size_grip.setMaximumSize(QSize(20, 16777215))
+        self.frame_size_grip.setFrameShape(QFrame.NoFrame)
+        self.frame_size_grip.setFrameShadow(QFrame.Raised)
+
+        self.horizontalLayout_5.addWidget(self.frame_size_grip)
+
+        self.verticalLayout_6.addWidget(self.bottomBar)
+
+        self.verticalLayout_2.addWidget(self.contentBottom)
+
+        self.appLayout.addWidget(self.contentBox)
+
+        self.appMargins.addWidget(self.bgApp)
+
+        MainWindow.setCentralWidget(self.styleSheet)
+
+        self.retranslateUi(MainWindow)
+
+        self.stackedWidget.setCurrentWidget(self.home)
+
+        QMetaObject.connectSlotsByName(MainWindow)
+
+    # setupUi
+
+    PAGE_SETUP = {
+        "ai_chat": "setupAiChatPage",
+        "history": "setupHistoryPage",
+        "widgets": "setupWidgetsPage",
+        "new_page": "setupNewPage",
+    }
+
+    def ensurePage(self, name):
+        """Build a stackedWidget page the first time it is needed and return it"""
+        if getattr(self, name) is None:
+            getattr(self, self.PAGE_SETUP[name])()
+        return getattr(self, name)
+
+    def setupAiChatPage(self):
         self.ai_chat = QWidget()
         self.ai_chat.setObjectName(u"ai_chat")
         self.ai_chat_layout = QVBoxLayout(self.ai_chat)
@@ -1338,48 +1495,24 @@ class Ui_MainWindow(object):
         self.ai_chat_layout.addWidget(self.chat_header)
 
     # Chat display area
-        self.chatDisplayArea = QScrollArea(self.ai_chat)
+        self.chatDisplayArea = ChatTranscriptView(self.ai_chat)
         self.chatDisplayArea.setObjectName(u"chatDisplayArea")
-        self.chatDisplayArea.setWidgetResizable(True)
         self.chatDisplayArea.setFrameShape(QFrame.NoFrame)
         self.chatDisplayArea.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.chatDisplayArea.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
-    # Chat content container
-        self.chatContentWidget = QWidget()
-        self.chatContentWidget.setObjectName(u"chatContentWidget")
-        self.chatContentLayout = QVBoxLayout(self.chatContentWidget)
-        self.chatContentLayout.setObjectName(u"chatContentLayout")
-        self.chatContentLayout.setContentsMargins(10, 10, 10, 10)
-        self.chatContentLayout.setSpacing(10)
-
     # Welcome message
-        self.welcome_message = QLabel(self.chatContentWidget)
+        self.welcome_message = QLabel()
         self.welcome_message.setObjectName(u"welcome_message")
         self.welcome_message.setAlignment(Qt.AlignCenter)
         self.welcome_message.setWordWrap(True)
-        self.welcome_message.setStyleSheet(u"""
-            QLabel {
-                color: rgb(113, 126, 149);
-                font-size: 14px;
-                padding: 20px;
-                background-color: rgba(44, 49, 58, 0.3);
-                border-radius: 10px;
-                border: 1px dashed rgb(89, 92, 111);
-            }
-        """)
         self.welcome_message.setText(
             "👋 Welcome to TravelMind AI Assistant!\n\n"
             "I can help you plan travel routes, recommend attractions, check weather information, and more.\n"
             "Please enter your question below to start a conversation.")
 
-        self.chatContentLayout.addWidget(self.welcome_message)
+        self.chatDisplayArea.setPlaceholder(self.welcome_message)
 
-    # Add spacer to bottom
-        self.chat_spacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
-        self.chatContentLayout.addItem(self.chat_spacer)
-
-        self.chatDisplayArea.setWidget(self.chatContentWidget)
         self.ai_chat_layout.addWidget(self.chatDisplayArea)
 
     # Input area
@@ -1488,7 +1621,7 @@ class Ui_MainWindow(object):
 
         self.stackedWidget.addWidget(self.ai_chat)
 
-    # Add history page
+    def setupHistoryPage(self):
         self.history = QWidget()
         self.history.setObjectName(u"history")
         self.history_layout = QVBoxLayout(self.history)
@@ -1509,6 +1642,10 @@ class Ui_MainWindow(object):
     # Title
         self.history_title = QLabel(self.history_header)
         self.history_title.setObjectName(u"history_title")
+        font_title = QFont()
+        font_title.setFamily(u"Segoe UI")
+        font_title.setPointSize(16)
+        font_title.setBold(True)
         self.history_title.setFont(font_title)
         self.history_title.setStyleSheet(u"color: rgb(189, 147, 249);")
         self.history_title.setText("📚 Chat History")
@@ -1526,32 +1663,26 @@ class Ui_MainWindow(object):
         self.clearHistoryButton.setMinimumSize(QSize(80, 30))
         self.clearHistoryButton.setMaximumSize(QSize(100, 30))
         self.clearHistoryButton.setCursor(QCursor(Qt.PointingHandCursor))
-        self.clearHistoryButton.setStyleSheet(u"""
-            QPushButton {
-                background-color: rgb(231, 76, 60);
-                border: none;
-                border-radius: 6px;
-                padding: 6px 12px;
-                color: white;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: rgb(241, 86, 70);
-            }
-            QPushButton:pressed {
-                background-color: rgb(221, 66, 50);
-            }
-        """)
 
         self.history_header_layout.addWidget(self.clearHistoryButton)
 
         self.history_layout.addWidget(self.history_header)
 
+    # Search box
+        self.historySearchEdit = QLineEdit(self.history)
+        self.historySearchEdit.setObjectName(u"historySearchEdit")
+        self.historySearchEdit.setMinimumSize(QSize(0, 34))
+        self.historySearchEdit.setClearButtonEnabled(True)
+        self.historySearchEdit.setPlaceholderText("🔍 Search chats, e.g. 成都 or Chengdu March")
+        self.historySearchEdit.setStyleSheet(u"background-color: rgb(33, 37, 43); font-size: 14px; padding: 0 8px;")
+
+        self.history_layout.addWidget(self.historySearchEdit)
+
     # History list
-        self.historyList = QListWidget(self.history)
+        self.historyList = QListView(self.history)
         self.historyList.setObjectName(u"historyList")
         self.historyList.setFrameShape(QFrame.NoFrame)
+        self.historyList.setUniformItemSizes(True)
         self.historyList.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.historyList.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
@@ -1574,26 +1705,6 @@ class Ui_MainWindow(object):
         self.loadChatButton.setMinimumSize(QSize(100, 15))
         self.loadChatButton.setMaximumSize(QSize(120, 15))
         self.loadChatButton.setCursor(QCursor(Qt.PointingHandCursor))
-        self.loadChatButton.setStyleSheet(u"""
-            QPushButton {
-                background-color: rgb(189, 147, 249);
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgb(196, 161, 249);
-            }
-            QPushButton:pressed {
-                background-color: rgb(180, 141, 238);
-            }
-            QPushButton:disabled {
-                background-color: rgb(100, 100, 100);
-                color: rgb(150, 150, 150);
-            }
-        """)
 
         self.history_buttons_layout.addWidget(self.loadChatButton)
 
@@ -1608,26 +1719,6 @@ class Ui_MainWindow(object):
         self.deleteChatButton.setMinimumSize(QSize(80, 15))
         self.deleteChatButton.setMaximumSize(QSize(100, 15))
         self.deleteChatButton.setCursor(QCursor(Qt.PointingHandCursor))
-        self.deleteChatButton.setStyleSheet(u"""
-            QPushButton {
-                background-color: rgb(231, 76, 60);
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgb(241, 86, 70);
-            }
-            QPushButton:pressed {
-                background-color: rgb(221, 66, 50);
-            }
-            QPushButton:disabled {
-                background-color: rgb(100, 100, 100);
-                color: rgb(150, 150, 150);
-            }
-        """)
 
         self.history_buttons_layout.addWidget(self.deleteChatButton)
 
@@ -1635,7 +1726,16 @@ class Ui_MainWindow(object):
 
         self.stackedWidget.addWidget(self.history)
 
-    # Widgets page
+    def setupWidgetsPage(self):
+        font = QFont()
+        font.setFamily(u"Segoe UI")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setItalic(False)
+        sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+
         self.widgets = QWidget()
         self.widgets.setObjectName(u"widgets")
         self.widgets.setStyleSheet(u"b")
@@ -1962,7 +2062,9 @@ class Ui_MainWindow(object):
 
         self.stackedWidget.addWidget(self.widgets)
 
-        # New page
+        self.retranslateWidgetsPage()
+
+    def setupNewPage(self):
         self.new_page = QWidget()
         self.new_page.setObjectName(u"new_page")
         self.verticalLayout_20 = QVBoxLayout(self.new_page)
@@ -1975,142 +2077,7 @@ class Ui_MainWindow(object):
 
         self.stackedWidget.addWidget(self.new_page)
 
-        self.verticalLayout_15.addWidget(self.stackedWidget)
-
-        self.horizontalLayout_4.addWidget(self.pagesContainer)
-
-        self.extraRightBox = QFrame(self.content)
-        self.extraRightBox.setObjectName(u"extraRightBox")
-        self.extraRightBox.setMinimumSize(QSize(0, 0))
-        self.extraRightBox.setMaximumSize(QSize(0, 16777215))
-        self.extraRightBox.setFrameShape(QFrame.NoFrame)
-        self.extraRightBox.setFrameShadow(QFrame.Raised)
-        self.verticalLayout_7 = QVBoxLayout(self.extraRightBox)
-        self.verticalLayout_7.setSpacing(0)
-        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
-        self.verticalLayout_7.setContentsMargins(0, 0, 0, 0)
-        self.themeSettingsTopDetail = QFrame(self.extraRightBox)
-        self.themeSettingsTopDetail.setObjectName(u"themeSettingsTopDetail")
-        self.themeSettingsTopDetail.setMaximumSize(QSize(16777215, 3))
-        self.themeSettingsTopDetail.setFrameShape(QFrame.NoFrame)
-        self.themeSettingsTopDetail.setFrameShadow(QFrame.Raised)
-
-        self.verticalLayout_7.addWidget(self.themeSettingsTopDetail)
-
-        self.contentSettings = QFrame(self.extraRightBox)
-        self.contentSettings.setObjectName(u"contentSettings")
-        self.contentSettings.setFrameShape(QFrame.NoFrame)
-        self.contentSettings.setFrameShadow(QFrame.Raised)
-        self.verticalLayout_13 = QVBoxLayout(self.contentSettings)
-        self.verticalLayout_13.setSpacing(0)
-        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
-        self.verticalLayout_13.setContentsMargins(0, 0, 0, 0)
-        self.topMenus = QFrame(self.contentSettings)
-        self.topMenus.setObjectName(u"topMenus")
-        self.topMenus.setFrameShape(QFrame.NoFrame)
-        self.topMenus.setFrameShadow(QFrame.Raised)
-        self.verticalLayout_14 = QVBoxLayout(self.topMenus)
-        self.verticalLayout_14.setSpacing(0)
-        self.verticalLayout_14.setObjectName(u"verticalLayout_14")
-        self.verticalLayout_14.setContentsMargins(0, 0, 0, 0)
-        self.btn_theme = QPushButton(self.topMenus)
-        self.btn_theme.setObjectName(u"btn_theme")
-        sizePolicy.setHeightForWidth(self.btn_theme.sizePolicy().hasHeightForWidth())
-        self.btn_theme.setSizePolicy(sizePolicy)
-        self.btn_theme.setMinimumSize(QSize(0, 45))
-        self.btn_theme.setFont(font)
-        self.btn_theme.setCursor(QCursor(Qt.PointingHandCursor))
-        self.btn_theme.setLayoutDirection(Qt.LeftToRight)
-        self.btn_theme.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-3d.png);")
-
-        self.verticalLayout_14.addWidget(self.btn_theme)
-
-        self.btn_print = QPushButton(self.topMenus)
-        self.btn_print.setObjectName(u"btn_print")
-        sizePolicy.setHeightForWidth(self.btn_print.sizePolicy().hasHeightForWidth())
-        self.btn_print.setSizePolicy(sizePolicy)
-        self.btn_print.setMinimumSize(QSize(0, 45))
-        self.btn_print.setFont(font)
-        self.btn_print.setCursor(QCursor(Qt.PointingHandCursor))
-        self.btn_print.setLayoutDirection(Qt.LeftToRight)
-        self.btn_print.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-print.png);")
-
-        self.verticalLayout_14.addWidget(self.btn_print)
-
-        self.btn_logout = QPushButton(self.topMenus)
-        self.btn_logout.setObjectName(u"btn_logout")
-        sizePolicy.setHeightForWidth(self.btn_logout.sizePolicy().hasHeightForWidth())
-        self.btn_logout.setSizePolicy(sizePolicy)
-        self.btn_logout.setMinimumSize(QSize(0, 45))
-        self.btn_logout.setFont(font)
-        self.btn_logout.setCursor(QCursor(Qt.PointingHandCursor))
-        self.btn_logout.setLayoutDirection(Qt.LeftToRight)
-        self.btn_logout.setStyleSheet(u"background-image: url(:/icons/images/icons/cil-account-logout.png);")
-
-        self.verticalLayout_14.addWidget(self.btn_logout)
-
-        self.verticalLayout_13.addWidget(self.topMenus, 0, Qt.AlignTop)
-
-        self.verticalLayout_7.addWidget(self.contentSettings)
-
-        self.horizontalLayout_4.addWidget(self.extraRightBox)
-
-        self.verticalLayout_6.addWidget(self.content)
-
-        self.bottomBar = QFrame(self.contentBottom)
-        self.bottomBar.setObjectName(u"bottomBar")
-        self.bottomBar.setMinimumSize(QSize(0, 22))
-        self.bottomBar.setMaximumSize(QSize(16777215, 22))
-        self.bottomBar.setFrameShape(QFrame.NoFrame)
-        self.bottomBar.setFrameShadow(QFrame.Raised)
-        self.horizontalLayout_5 = QHBoxLayout(self.bottomBar)
-        self.horizontalLayout_5.setSpacing(0)
-        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
-        self.horizontalLayout_5.setContentsMargins(0, 0, 0, 0)
-        self.creditsLabel = QLabel(self.bottomBar)
-        self.creditsLabel.setObjectName(u"creditsLabel")
-        self.creditsLabel.setMaximumSize(QSize(16777215, 16))
-        font5 = QFont()
-        font5.setFamily(u"Segoe UI")
-        font5.setBold(False)
-        font5.setItalic(False)
-        self.creditsLabel.setFont(font5)
-        self.creditsLabel.setAlignment(Qt.AlignLeading | Qt.AlignLeft | Qt.AlignVCenter)
-
-        self.horizontalLayout_5.addWidget(self.creditsLabel)
-
-        self.version = QLabel(self.bottomBar)
-        self.version.setObjectName(u"version")
-        self.version.setAlignment(Qt.AlignRight | Qt.AlignTrailing | Qt.AlignVCenter)
-
-        self.horizontalLayout_5.addWidget(self.version)
-
-        self.frame_size_grip = QFrame(self.bottomBar)
-        self.frame_size_grip.setObjectName(u"frame_size_grip")
-        self.frame_size_grip.setMinimumSize(QSize(20, 0))
-        self.frame_size_grip.setMaximumSize(QSize(20, 16777215))
-        self.frame_size_grip.setFrameShape(QFrame.NoFrame)
-        self.frame_size_grip.setFrameShadow(QFrame.Raised)
-
-        self.horizontalLayout_5.addWidget(self.frame_size_grip)
-
-        self.verticalLayout_6.addWidget(self.bottomBar)
-
-        self.verticalLayout_2.addWidget(self.contentBottom)
-
-        self.appLayout.addWidget(self.contentBox)
-
-        self.appMargins.addWidget(self.bgApp)
-
-        MainWindow.setCentralWidget(self.styleSheet)
-
-        self.retranslateUi(MainWindow)
-
-        self.stackedWidget.setCurrentIndex(1)
-
-        QMetaObject.connectSlotsByName(MainWindow)
-
-    # setupUi
+        self.label.setText(QCoreApplication.translate("MainWindow", u"NEW PAGE TEST", None))
 
     def retranslateUi(self, MainWindow):
         MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"MainWindow", None))
@@ -2148,7 +2115,7 @@ class Ui_MainWindow(object):
                                                          "<p align=\"center\" style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#ffffff;\">pyside6-uic main.ui &gt; ui_main.py</span></p>\n"
                                                          "<p align=\"center\" style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:12pt; font-weight:600; color:#ff79c6;\">Convert QRC</span></p>\n"
                                                          "<p align=\"center\" "
-                                                         "style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#ffffff;\">pyside6-rcc resources.qrc -o resources_rc.py</span></p></body></html>",
+                                                         "style=\" margin-top:12px; margin-bottom:12px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; color:#ffffff;\">pyside6-rcc --binary resources.qrc -o resources.rcc</span></p></body></html>",
                                                          None))
         self.titleRightInfo.setText(
             QCoreApplication.translate("MainWindow", u"TravelMind",
@@ -2169,6 +2136,14 @@ class Ui_MainWindow(object):
         self.closeAppBtn.setToolTip(QCoreApplication.translate("MainWindow", u"Close", None))
         # endif // QT_CONFIG(tooltip)
         self.closeAppBtn.setText("")
+        self.btn_theme.setText(QCoreApplication.translate("MainWindow", u"Dark/Light Theme", None))
+        self.btn_print.setText(QCoreApplication.translate("MainWindow", u"Print", None))
+        self.btn_logout.setText(QCoreApplication.translate("MainWindow", u"Logout", None))
+        self.creditsLabel.setText(QCoreApplication.translate("MainWindow", u"By: JunyanChen", None))
+        self.version.setText(QCoreApplication.translate("MainWindow", u"v1.0.0", None))
+        # retranslateUi
+
+    def retranslateWidgetsPage(self):
         self.labelBoxBlenderInstalation.setText(QCoreApplication.translate("MainWindow", u"FILE BOX", None))
         self.lineEdit.setText("")
         self.lineEdit.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Type here", None))
@@ -2234,11 +2209,3 @@ class Ui_MainWindow(object):
         ___qtablewidgetitem23 = self.tableWidget.item(0, 3)
         ___qtablewidgetitem23.setText(QCoreApplication.translate("MainWindow", u"Line", None));
         self.tableWidget.setSortingEnabled(__sortingEnabled)
-
-        self.label.setText(QCoreApplication.translate("MainWindow", u"NEW PAGE TEST", None))
-        self.btn_theme.setText(QCoreApplication.translate("MainWindow", u"Dark/Light Theme", None))
-        self.btn_print.setText(QCoreApplication.translate("MainWindow", u"Print", None))
-        self.btn_logout.setText(QCoreApplication.translate("MainWindow", u"Logout", None))
-        self.creditsLabel.setText(QCoreApplication.translate("MainWindow", u"By: JunyanChen", None))
-        self.version.setText(QCoreApplication.translate("MainWindow", u"v1.0.0", None))
-        # retranslateUi
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class UploadCache:
+    """Persistent map from file content hash (+ base URL and user) to a Dify upload_file_id"""
+
+    CACHE_FILE = "upload_cache.json"
+    DEFAULT_TTL_HOURS = 24  # Keep below the Dify upload retention so cached IDs stay valid
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, cache_file=CACHE_FILE, ttl_hours=DEFAULT_TTL_HOURS):
+        self.cache_file = cache_file
+        self.ttl = ttl_hours * 3600
+        self._lock = threading.Lock()
+        self._digests = {}  # (path, size, mtime) -> sha256, avoids rehashing unchanged files
+        self._entries = self._load()
+
+    @classmethod
+    def instance(cls):
+        """Return the process-wide cache"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def configure(cls, config):
+        """(Re)create the shared cache from the api_config.json settings"""
+        cache = cls(ttl_hours=float(config.get("upload_cache_ttl_hours", cls.DEFAULT_TTL_HOURS)))
+        with cls._instance_lock:
+            cls._instance = cache
+        return cache
+
+    def _load(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        now = time.time()
+        return {key: entry for key, entry in entries.items() if now - entry.get("created", 0) < self.ttl}
+
+    def _save(self):
+        """Write to a temp file and rename so a crash never leaves a truncated cache"""
+        tmp_file = self.cache_file + ".tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            print(f"Upload cache save failed: {e}")
+
+    def file_digest(self, file_path):
+        """SHA-256 of the file contents, read in fixed-size chunks"""
+        stat = os.stat(file_path)
+        stat_key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        digest = self._digests.get(stat_key)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b""):
+                    sha.update(chunk)
+            digest = sha.hexdigest()
+            self._digests[stat_key] = digest
+        return digest
+
+    def key_for(self, file_path, base_url, user):
+        return f"{base_url}|{user}|{self.file_digest(file_path)}"
+
+    def get(self, key):
+        """Return the cached upload_file_id, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry["created"] >= self.ttl:
+                del self._entries[key]
+                return None
+            return entry["upload_file_id"]
+
+    def put(self, key, upload_file_id):
+        with self._lock:
+            self._entries[key] = {"upload_file_id": upload_file_id, "created": time.time()}
+            self._save()
+
+    def invalidate(self, keys):
+        with self._lock:
+            removed = [self._entries.pop(key, None) for key in keys]
+            if any(removed):
+                self._save()
@@ -3,7 +3,7 @@ import os
 from cx_Freeze import setup, Executable
 
 # ADD FILES
-files = ['icon.ico', 'themes/']
+files = ['icon.ico', 'themes/', 'resources.rcc']
 
 # TARGET
 target = Executable(
@@ -18,7 +18,9 @@ setup(
     version="1.0",
     description="AI Tool for Trip Planning",
     author="Junyan Chen",
-    options={'build_exe': {'include_files': files}},
+    # speech_worker / speech_backends as top-level modules for main.py --speech-worker
+    options={'build_exe': {'include_files': files, 'path': sys.path + ['modules'],
+                           'includes': ['speech_worker', 'speech_backends']}},
     executables=[target]
 
 )
@@ -0,0 +1,65 @@
+from modules.chat_store import ChatHistoryStore
+
+
+def make_store(tmp_path):
+    store = ChatHistoryStore(str(tmp_path / "history.db"))
+    # Log the seq of every message row written
+    store._db.executescript("""
+        CREATE TEMP TABLE writes (seq INTEGER);
+        CREATE TEMP TRIGGER log_writes AFTER INSERT ON main.messages BEGIN
+            INSERT INTO writes VALUES (new.seq);
+        END;
+    """)
+    return store
+
+
+def take_writes(store):
+    seqs = [row[0] for row in store._db.execute("SELECT seq FROM writes ORDER BY seq")]
+    store._db.execute("DELETE FROM writes")
+    return seqs
+
+
+def test_save_writes_only_new_and_changed_rows(tmp_path):
+    store = make_store(tmp_path)
+    messages = [{"role": "user", "content": "Plan a trip to Chengdu"}, {"role": "assistant", "content": "Sure"}]
+    store.save_session("1", messages)
+    assert take_writes(store) == [0, 1]
+
+    store.save_session("1", messages)
+    assert take_writes(store) == []
+
+    messages.append({"role": "user", "content": "Three days"})
+    store.save_session("1", messages)
+    assert take_writes(store) == [2]
+
+    messages[1] = dict(messages[1], files=[{"name": "plan.pdf", "type": "document"}])
+    store.save_session("1", messages)
+    assert take_writes(store) == [1]
+    assert store.load_messages("1") == messages
+    assert store.get_session("1")["message_count"] == 3
+
+
+def test_shorter_list_keeps_rows_until_truncated(tmp_path):
+    store = make_store(tmp_path)
+    messages = [{"role": "user", "content": "Chengdu"}, {"role": "assistant", "content": "Pandas"},
+                {"role": "user", "content": "Xiamen"}]
+    store.save_session("1", messages)
+
+    store.save_session("1", messages[:1])
+    assert store.load_messages("1") == messages
+
+    assert store.truncate_session("1", 1) == 2
+    assert store.load_messages("1") == messages[:1]
+    session = store.get_session("1")
+    assert (session["message_count"], session["user_turns"]) == (1, 1)
+    assert [found["id"] for found in store.search_sessions("Chengdu")] == ["1"]
+    assert store.search_sessions("Xiamen") == []
+    assert store.truncate_session("1", 1) == 0
+
+
+def test_edited_message_is_reindexed(tmp_path):
+    store = make_store(tmp_path)
+    store.save_session("1", [{"role": "user", "content": "Beijing"}])
+    store.save_session("1", [{"role": "user", "content": "Shanghai"}])
+    assert store.search_sessions("Beijing") == []
+    assert [found["id"] for found in store.search_sessions("Shanghai")] == ["1"]
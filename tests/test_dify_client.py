@@ -0,0 +1,74 @@
+from modules.dify_client import DifyAPIClient, EnhancedAIResponseThread
+from modules.upload_cache import UploadCache
+
+
+class StubResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.body = body
+        self.text = str(body)
+        self.closed = False
+
+    def json(self):
+        return self.body
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class StubPool:
+    """Stands in for HTTPSessionPool: records requests and answers with canned responses"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def post(self, url, **kwargs):
+        self.requests.append((url, kwargs))
+        return self.responses.pop(0)
+
+
+def blocking_thread(pool, tmp_path, conversation_id=None):
+    thread = EnhancedAIResponseThread("hello", api_key="key", conversation_id=conversation_id, stream=False,
+                                      base_url="https://dify.test/v1")
+    thread.client = DifyAPIClient("key", "https://dify.test/v1", pool=pool,
+                                  upload_cache=UploadCache(str(tmp_path / "uploads.json")))
+    completed, errors = [], []
+    thread.response_complete.connect(lambda conversation, text: completed.append((conversation, text)))
+    thread.error_occurred.connect(errors.append)
+    return thread, completed, errors
+
+
+def test_blocking_mode_requests_and_delivers_the_whole_answer(tmp_path):
+    response = StubResponse(200, {"event": "message", "answer": "Day 1: Chengdu", "conversation_id": "c1"})
+    pool = StubPool(response)
+    thread, completed, errors = blocking_thread(pool, tmp_path)
+
+    thread.run()
+
+    url, request = pool.requests[0]
+    assert url == "https://dify.test/v1/chat-messages"
+    assert request["json"]["response_mode"] == "blocking"
+    assert request["json"]["query"] == "hello"
+    assert request["stream"] is False
+    assert response.closed
+    assert errors == []
+    assert completed == [("c1", "Day 1: Chengdu")]
+    assert thread.stream_buffer.drain() == "Day 1: Chengdu"
+
+
+def test_blocking_mode_reports_api_errors(tmp_path):
+    response = StubResponse(400, {"message": "Conversation Not Exists."})
+    thread, completed, errors = blocking_thread(StubPool(response), tmp_path, conversation_id="gone")
+
+    thread.run()
+
+    assert completed == []
+    assert errors and "Conversation Not Exists." in errors[0]
+    assert response.closed
@@ -0,0 +1,81 @@
+import threading
+
+from modules.chat_store import ChatHistoryStore
+from modules.history_writer import HistoryWriter
+
+
+class SlowStore(ChatHistoryStore):
+    """Store whose writes wait until the test lets them through"""
+
+    def __init__(self, db_file):
+        super().__init__(db_file)
+        self.writing = threading.Event()
+        self.proceed = threading.Event()
+
+    def save_session(self, *args, **kwargs):
+        self.writing.set()
+        assert self.proceed.wait(5)
+        super().save_session(*args, **kwargs)
+
+    def delete_session(self, session_id):
+        self.writing.set()
+        assert self.proceed.wait(5)
+        super().delete_session(session_id)
+
+
+def make_writer(tmp_path):
+    store = SlowStore(str(tmp_path / "history.db"))
+    return store, HistoryWriter(store, delay=0.01)
+
+
+def test_batch_being_written_stays_readable(tmp_path):
+    store, writer = make_writer(tmp_path)
+    try:
+        store.proceed.set()
+        writer.save("1", [{"role": "user", "content": "hi"}])
+        writer.close()
+        store.proceed.clear()
+        store.writing.clear()
+        writer = HistoryWriter(store, delay=0.01)
+
+        messages = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}]
+        writer.save("1", messages)
+        assert store.writing.wait(5)
+        # Committed rows are still the old single message; the writer must not fall back to them
+        assert store.load_messages("1") == messages[:1]
+        assert writer.pending_messages("1") == messages
+        store.proceed.set()
+    finally:
+        store.proceed.set()
+        writer.close()
+    assert writer.pending_messages("1") is None
+    assert store.load_messages("1") == messages
+
+
+def test_delete_being_written_stays_removed(tmp_path):
+    store, writer = make_writer(tmp_path)
+    try:
+        ChatHistoryStore.save_session(store, "1", [{"role": "user", "content": "hi"}])
+        writer.delete("1")
+        assert store.writing.wait(5)
+        assert store.get_session("1") is not None
+        assert writer.pending_removals() == {"1"}
+        assert writer.pending_messages("1") == []
+    finally:
+        store.proceed.set()
+        writer.close()
+    assert writer.pending_removals() == set()
+    assert store.get_session("1") is None
+
+
+def test_newer_save_wins_over_batch_being_written(tmp_path):
+    store, writer = make_writer(tmp_path)
+    try:
+        writer.save("1", [{"role": "user", "content": "a"}])
+        assert store.writing.wait(5)
+        writer.save("1", [{"role": "user", "content": "b"}])
+        assert writer.pending_messages("1") == [{"role": "user", "content": "b"}]
+    finally:
+        store.proceed.set()
+        writer.close()
+    assert store.load_messages("1") == [{"role": "user", "content": "b"}]
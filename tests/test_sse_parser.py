@@ -0,0 +1,35 @@
+import random
+
+from modules.sse_parser import SSEParser, iter_dify_events
+
+STREAM = (b": ping\r\n\r\nevent: foo\r\nid: 7\r\ndata: a\r\ndata: b\r\n\r\n"
+          b'data: {"event": "message", "answer": "x"}\n\n'
+          b'data: 42\n\ndata: ["files"]\n\ndata: "message"\n\n'
+          b'data: {"event": "message"} junk\n\n\n\n'
+          b'data:  {"event":"message_end"}\n\ndata: tail')
+
+
+def split_randomly(data, seed):
+    rng = random.Random(seed)
+    chunks, pos = [], 0
+    while pos < len(data):
+        size = rng.randint(1, 9)
+        chunks.append(data[pos:pos + size])
+        pos += size
+    return chunks
+
+
+def test_events_do_not_depend_on_chunking():
+    expected = SSEParser().feed(STREAM)
+    assert [event.event for event in expected][:2] == ["foo", "message"]
+    assert expected[0].data == b"a\nb" and expected[0].id == "7"
+    for seed in range(100):
+        events, payloads = SSEParser(), SSEParser()
+        chunks = split_randomly(STREAM, seed)
+        assert [event for chunk in chunks for event in events.feed(chunk)] == expected
+        assert [data for chunk in chunks for data in payloads.feed_data(chunk)] == [event.data for event in expected]
+
+
+def test_dify_events_skip_payloads_that_are_not_objects():
+    events = list(iter_dify_events(split_randomly(STREAM, 1)))
+    assert events == [("message", {"event": "message", "answer": "x"}), ("message_end", {"event": "message_end"})]